@@ -0,0 +1,116 @@
+"""Benchmark the alignment kernels (utils/align_kernels.py).
+
+The kernels only need numpy, so this runs with a plain Python, e.g.:
+
+    python benchmarks/bench_align_kernels.py 100000
+
+The argument is the number of calls per kernel (default 20000). When
+mathutils is importable (inside Blender, or with the standalone
+mathutils module), the kernels are also timed with mathutils Vector
+inputs, which is how the operators call them. The batched kernels (used
+by the batch align operator) are timed for the same number of rows,
+computed in one call.
+"""
+
+
+import importlib.util
+import os
+import sys
+import time
+
+import numpy as np
+
+
+KERNELS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'mesh_mesh_align_plus',
+    'utils',
+    'align_kernels.py'
+)
+
+
+def load_kernels():
+    # Load the module by path, importing the add-on package needs bpy
+    spec = importlib.util.spec_from_file_location('align_kernels', KERNELS_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_cases(kernels, vector):
+    a = vector((0.1, 0.2, 0.3))
+    b = vector((1.2, -0.4, 0.5))
+    c = vector((0.3, 1.1, -0.2))
+    d = vector((4.0, 5.0, 6.0))
+    e = vector((4.5, 4.1, 6.2))
+    f = vector((3.2, 5.4, 7.0))
+    return (
+        ('align points', kernels.align_points_matrix, (a, d)),
+        ('directional slide', kernels.directional_slide_matrix, (a, b)),
+        ('align lines', kernels.align_lines_matrix, (a, b, d, e)),
+        ('align planes', kernels.align_planes_matrix, ((a, b, c), (d, e, f))),
+        ('axis rotate', kernels.axis_rotate_matrix, (a, b, 0.7)),
+        ('scale match edge', kernels.scale_match_edge_matrix, (a, b, d, e)),
+    )
+
+
+def time_cases(cases, calls):
+    for name, kernel, args in cases:
+        start = time.perf_counter()
+        for call in range(calls):
+            kernel(*args)
+        seconds = time.perf_counter() - start
+        print('    {0:<24}{1:>10.2f} us/call'.format(
+            name,
+            seconds / calls * 1e6
+        ))
+
+
+def get_batch_cases(kernels, rows):
+    coords = np.random.default_rng(0).normal(size=(6, rows, 3))
+    a, b, c, d, e, f = coords
+    return (
+        ('align points', kernels.align_points_matrices, (a, d)),
+        ('directional slide', kernels.directional_slide_matrices, (a, b)),
+        ('align lines', kernels.align_lines_matrices, (a, b, d, e)),
+        ('align planes', kernels.align_planes_matrices, (
+            np.stack((a, b, c), axis=1),
+            np.stack((d, e, f), axis=1)
+        )),
+        ('axis rotate', kernels.axis_rotate_matrices, (a, b, 0.7)),
+        ('scale match edge', kernels.scale_match_edge_matrices, (a, b, d, e)),
+    )
+
+
+def time_batch_cases(cases, rows):
+    for name, kernel, args in cases:
+        start = time.perf_counter()
+        kernel(*args)
+        seconds = time.perf_counter() - start
+        print('    {0:<24}{1:>10.2f} us/row'.format(
+            name,
+            seconds / rows * 1e6
+        ))
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    kernels = load_kernels()
+
+    print('tuple inputs ({0} calls each):'.format(calls))
+    time_cases(get_cases(kernels, tuple), calls)
+
+    print('batched ({0} rows in one call each):'.format(calls))
+    time_batch_cases(get_batch_cases(kernels, calls), calls)
+
+    try:
+        import mathutils
+    except ImportError:
+        print('(mathutils not available, skipping Vector inputs)')
+        return
+    print('mathutils.Vector inputs ({0} calls each):'.format(calls))
+    time_cases(get_cases(kernels, mathutils.Vector), calls)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark the cylinder fit (utils/fitting.py fit_cylinder).
+
+The fits only need numpy, so this runs with a plain Python, e.g.:
+
+    python benchmarks/bench_fit_cylinder.py 1000000
+
+The argument is the number of points (default 1000000), sampled with
+some noise from three quarters of a tilted cylinder. Prints the fit time
+and how far the fitted axis and radius are from the true ones.
+"""
+
+
+import importlib
+import importlib.util
+import os
+import sys
+import time
+
+import numpy as np
+
+
+UTILS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'mesh_mesh_align_plus',
+    'utils'
+)
+
+
+def load_fitting():
+    # Load utils as a standalone package, importing the add-on package
+    # needs bpy
+    spec = importlib.util.spec_from_file_location(
+        'maplus_utils',
+        os.path.join(UTILS_PATH, '__init__.py'),
+        submodule_search_locations=[UTILS_PATH]
+    )
+    package = importlib.util.module_from_spec(spec)
+    sys.modules['maplus_utils'] = package
+    spec.loader.exec_module(package)
+    return importlib.import_module('maplus_utils.fitting')
+
+
+def get_points(fitting, count, axis, center, radius):
+    rng = np.random.default_rng(1)
+    u, v = fitting.perpendicular_basis(axis)
+    angles = rng.uniform(0.0, 1.5 * np.pi, count)
+    heights = rng.uniform(-2.0, 5.0, count)
+    points = (
+        center +
+        np.outer(heights, axis) +
+        radius * (np.outer(np.cos(angles), u) + np.outer(np.sin(angles), v))
+    )
+    return points + rng.normal(scale=radius * 1e-3, size=points.shape)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    fitting = load_fitting()
+    axis = np.array((0.3, -0.5, 0.8))
+    axis /= np.linalg.norm(axis)
+    radius = 0.7
+    points = get_points(fitting, count, axis, np.array((1.0, 2.0, -3.0)), radius)
+
+    start = time.perf_counter()
+    cylinder_fit = fitting.fit_cylinder(points)
+    seconds = time.perf_counter() - start
+    print('fit_cylinder, {0} points: {1:.3f} s'.format(count, seconds))
+    print('    axis error {0:.3g} rad, radius error {1:.3g}'.format(
+        np.arccos(min(abs(cylinder_fit.axis @ axis), 1.0)),
+        abs(cylinder_fit.radius - radius)
+    ))
+
+
+if __name__ == '__main__':
+    main()
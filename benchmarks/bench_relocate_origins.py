@@ -0,0 +1,91 @@
+"""Benchmark moving the origins of many mesh objects (OBJECT_ORIGIN).
+
+Compares utils.transforms.relocate_origins (all matrices computed at
+once, one view layer update, users of each mesh grouped once) with
+moving the origins one object at a time, the way the OBJECT_ORIGIN
+target used to (an object transform with its own view layer update,
+then the inverse mesh transform, then a scan of all targets for other
+users of the mesh).
+
+Runs inside Blender (it needs bpy), from the repository root, e.g.:
+
+    blender -b --factory-startup --python benchmarks/bench_relocate_origins.py -- 3000 4
+
+The arguments after "--" are the number of objects and how many of
+them share each mesh (linked duplicates), the defaults are 3000 and 1.
+Each mesh is a small cube.
+"""
+
+
+import os
+import sys
+import time
+
+import bpy
+import mathutils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from mesh_mesh_align_plus.utils import transforms  # noqa: E402
+
+
+def make_parts(count, users_per_mesh):
+    bpy.ops.mesh.primitive_cube_add(size=1.0)
+    template = bpy.context.active_object
+    collection = template.users_collection[0]
+    parts = []
+    mesh = None
+    for index in range(count):
+        if index % users_per_mesh == 0:
+            mesh = template.data.copy()
+        part = bpy.data.objects.new('Part', mesh)
+        part.location = (index % 100, index // 100, 0.0)
+        collection.objects.link(part)
+        parts.append(part)
+    bpy.data.objects.remove(template)
+    bpy.context.view_layer.update()
+    return parts
+
+
+def per_object(parts, matrix):
+    for item in transforms.get_unique_mesh_targets(parts):
+        transforms.transform_objects([item], matrix)
+        transforms.apply_mesh_transform(
+            item,
+            transforms.get_local_transform(item, matrix),
+            'OBJECT_ORIGIN',
+            parts
+        )
+
+
+def batched(parts, matrix):
+    transforms.relocate_origins(parts, matrix)
+
+
+def main():
+    args = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    count = int(args[0]) if args else 3000
+    users_per_mesh = int(args[1]) if len(args) > 1 else 1
+    matrix = (
+        mathutils.Matrix.Translation((0.1, 0.2, 0.3)) @
+        mathutils.Matrix.Rotation(0.3, 4, 'Z')
+    )
+
+    parts = make_parts(count, users_per_mesh)
+    print('{0} objects, {1} per mesh:'.format(count, users_per_mesh))
+    baseline = None
+    for name, function in (('one object at a time', per_object),
+                           ('relocate_origins', batched)):
+        start = time.perf_counter()
+        function(parts, matrix)
+        seconds = time.perf_counter() - start
+        if baseline is None:
+            baseline = seconds
+        print('    {0:<24}{1:>10.4f}s{2:>8.1f}x'.format(
+            name,
+            seconds,
+            baseline / seconds
+        ))
+
+
+if __name__ == '__main__':
+    main()
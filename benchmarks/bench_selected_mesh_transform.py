@@ -0,0 +1,116 @@
+"""Benchmark selected vert transforms (bmesh round trip vs numpy mask).
+
+Compares the ways a 4x4 matrix can be applied to the selected verts of
+a mesh: the old bmesh round trip (from_mesh, transform with a SELECT
+filter, to_mesh), and the masked foreach_get/numpy/foreach_set pipeline
+the MESH_SELECTED target uses now. Half of the grid's verts are
+selected, and timings are also given per million verts, to show how
+each method scales with mesh size.
+
+Runs inside Blender (it needs bpy), e.g.:
+
+    blender -b --factory-startup --python benchmarks/bench_selected_mesh_transform.py -- 500 1000 2000
+
+The arguments after "--" are grid subdivisions, a grid of n
+subdivisions has n * n verts (the defaults are 500, 1000 and 2000,
+i.e. 0.25M, 1M and 4M verts).
+"""
+
+
+import sys
+import time
+
+import bmesh
+import bpy
+import mathutils
+import numpy as np
+
+
+REPEATS = 3
+
+
+def make_grid(subdivisions):
+    bpy.ops.mesh.primitive_grid_add(
+        x_subdivisions=subdivisions,
+        y_subdivisions=subdivisions,
+        size=10.0
+    )
+    mesh_object = bpy.context.active_object
+    bpy.ops.object.mode_set(mode='OBJECT')
+    mesh = mesh_object.data
+    select_mask = np.zeros(len(mesh.vertices), dtype=bool)
+    select_mask[::2] = True
+    mesh.vertices.foreach_set('select', select_mask)
+    return mesh_object
+
+
+def bmesh_round_trip(mesh, matrix):
+    src_mesh = bmesh.new()
+    src_mesh.from_mesh(mesh)
+    src_mesh.transform(matrix, filter={'SELECT'})
+    src_mesh.to_mesh(mesh)
+    src_mesh.free()
+
+
+def numpy_masked(mesh, matrix):
+    vert_count = len(mesh.vertices)
+    select_mask = np.empty(vert_count, dtype=bool)
+    mesh.vertices.foreach_get('select', select_mask)
+    coords = np.empty(vert_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    coords = coords.reshape((-1, 3))
+    matrix = np.array(matrix)
+    coords[select_mask] = (
+        coords[select_mask].astype(np.float64) @ matrix[:3, :3].T +
+        matrix[:3, 3]
+    )
+    mesh.vertices.foreach_set('co', coords.ravel())
+    mesh.update()
+
+
+def best_time(function, mesh, matrix):
+    times = []
+    for repeat in range(REPEATS):
+        start = time.perf_counter()
+        function(mesh, matrix)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    args = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    subdivision_counts = [int(arg) for arg in args] or [500, 1000, 2000]
+    matrix = (
+        mathutils.Matrix.Translation((1.0, 2.0, 3.0)) @
+        mathutils.Matrix.Rotation(0.3, 4, 'Z')
+    )
+    methods = (
+        ('bmesh round trip', bmesh_round_trip),
+        ('numpy masked', numpy_masked),
+    )
+
+    for subdivisions in subdivision_counts:
+        mesh_object = make_grid(subdivisions)
+        mesh = mesh_object.data
+        print('{0} verts, {1} faces (best of {2}):'.format(
+            len(mesh.vertices),
+            len(mesh.polygons),
+            REPEATS
+        ))
+        baseline = None
+        for name, function in methods:
+            seconds = best_time(function, mesh, matrix)
+            if baseline is None:
+                baseline = seconds
+            print('    {0:<20}{1:>10.4f}s{2:>10.4f}s/Mvert{3:>8.1f}x'.format(
+                name,
+                seconds,
+                seconds * 1e6 / len(mesh.vertices),
+                baseline / seconds
+            ))
+        bpy.data.objects.remove(mesh_object)
+        bpy.data.meshes.remove(mesh)
+
+
+if __name__ == '__main__':
+    main()
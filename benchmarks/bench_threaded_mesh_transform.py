@@ -0,0 +1,106 @@
+"""Benchmark mesh level transforms of many meshes, by thread count.
+
+Applies a 4x4 matrix to all verts of several grid meshes with
+utils.transforms.apply_mesh_transforms (what the operators use for the
+WHOLE_MESH and MESH_SELECTED targets), with 1 worker (the meshes one
+after another, through Mesh.transform / foreach_get and foreach_set)
+and with thread pools of increasing size.
+
+Runs inside Blender (it needs bpy), from the repository root, e.g.:
+
+    blender -b --factory-startup --python benchmarks/bench_threaded_mesh_transform.py -- 8 1000
+
+The arguments after "--" are the number of meshes and their grid
+subdivisions (the defaults are 8 meshes of 1000 subdivisions, i.e. 8
+meshes of 1M verts). The worker counts go up to the CPU count.
+"""
+
+
+import os
+import sys
+import time
+
+import bpy
+import mathutils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from mesh_mesh_align_plus.utils import transforms  # noqa: E402
+
+
+REPEATS = 3
+
+
+def make_grids(count, subdivisions):
+    grids = []
+    for index in range(count):
+        bpy.ops.mesh.primitive_grid_add(
+            x_subdivisions=subdivisions,
+            y_subdivisions=subdivisions,
+            size=10.0
+        )
+        grids.append(bpy.context.active_object)
+    return grids
+
+
+def get_worker_counts():
+    counts = [1]
+    while counts[-1] * 2 <= (os.cpu_count() or 1):
+        counts.append(counts[-1] * 2)
+    if counts[-1] != os.cpu_count():
+        counts.append(os.cpu_count())
+    return counts
+
+
+def best_time(grids, matrix, target, workers):
+    times = []
+    for repeat in range(REPEATS):
+        start = time.perf_counter()
+        transforms.apply_mesh_transforms(
+            grids,
+            [matrix] * len(grids),
+            target,
+            grids,
+            workers=workers
+        )
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    args = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    mesh_count = int(args[0]) if args else 8
+    subdivisions = int(args[1]) if len(args) > 1 else 1000
+    matrix = (
+        mathutils.Matrix.Translation((1.0, 2.0, 3.0)) @
+        mathutils.Matrix.Rotation(0.3, 4, 'Z')
+    )
+
+    grids = make_grids(mesh_count, subdivisions)
+    # Select every other vert, for the MESH_SELECTED target
+    for grid in grids:
+        grid.data.vertices.foreach_set(
+            'select',
+            [index % 2 == 0 for index in range(len(grid.data.vertices))]
+        )
+
+    for target in ('WHOLE_MESH', 'MESH_SELECTED'):
+        print('{0}, {1} meshes of {2} verts (best of {3}):'.format(
+            target,
+            mesh_count,
+            len(grids[0].data.vertices),
+            REPEATS
+        ))
+        baseline = None
+        for workers in get_worker_counts():
+            seconds = best_time(grids, matrix, target, workers)
+            if baseline is None:
+                baseline = seconds
+            print('    {0:>3} worker(s){1:>10.4f}s{2:>8.1f}x'.format(
+                workers,
+                seconds,
+                baseline / seconds
+            ))
+
+
+if __name__ == '__main__':
+    main()
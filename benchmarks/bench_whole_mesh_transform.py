@@ -0,0 +1,107 @@
+"""Benchmark whole mesh transforms (bmesh round trip vs in place).
+
+Compares the ways a 4x4 matrix can be applied to all verts of a mesh:
+the old bmesh round trip (from_mesh, transform, to_mesh), Mesh.transform
+(what the WHOLE_MESH and OBJECT_ORIGIN targets use now), and a
+foreach_get/numpy/foreach_set pipeline.
+
+Runs inside Blender (it needs bpy), e.g.:
+
+    blender -b --factory-startup --python benchmarks/bench_whole_mesh_transform.py -- 1000 2000
+
+The arguments after "--" are grid subdivisions, a grid of n
+subdivisions has n * n verts (the defaults are 1000 and 2000, i.e. 1M
+and 4M verts).
+"""
+
+
+import sys
+import time
+
+import bmesh
+import bpy
+import mathutils
+import numpy as np
+
+
+REPEATS = 3
+
+
+def make_grid(subdivisions):
+    bpy.ops.mesh.primitive_grid_add(
+        x_subdivisions=subdivisions,
+        y_subdivisions=subdivisions,
+        size=10.0
+    )
+    return bpy.context.active_object
+
+
+def bmesh_round_trip(mesh, matrix):
+    src_mesh = bmesh.new()
+    src_mesh.from_mesh(mesh)
+    src_mesh.transform(matrix)
+    src_mesh.to_mesh(mesh)
+    src_mesh.free()
+
+
+def mesh_transform(mesh, matrix):
+    mesh.transform(matrix)
+    mesh.update()
+
+
+def numpy_pipeline(mesh, matrix):
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    coords = coords.reshape((-1, 3))
+    matrix = np.array(matrix, dtype=np.float32)
+    coords = coords @ matrix[:3, :3].T + matrix[:3, 3]
+    mesh.vertices.foreach_set('co', coords.ravel())
+    mesh.update()
+
+
+def best_time(function, mesh, matrix):
+    times = []
+    for repeat in range(REPEATS):
+        start = time.perf_counter()
+        function(mesh, matrix)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    args = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    subdivision_counts = [int(arg) for arg in args] or [1000, 2000]
+    matrix = (
+        mathutils.Matrix.Translation((1.0, 2.0, 3.0)) @
+        mathutils.Matrix.Rotation(0.3, 4, 'Z')
+    )
+    methods = (
+        ('bmesh round trip', bmesh_round_trip),
+        ('Mesh.transform', mesh_transform),
+        ('foreach_get/numpy/foreach_set', numpy_pipeline),
+    )
+
+    for subdivisions in subdivision_counts:
+        mesh_object = make_grid(subdivisions)
+        mesh = mesh_object.data
+        print('{0} verts, {1} faces (best of {2}):'.format(
+            len(mesh.vertices),
+            len(mesh.polygons),
+            REPEATS
+        ))
+        baseline = None
+        for name, function in methods:
+            seconds = best_time(function, mesh, matrix)
+            if baseline is None:
+                baseline = seconds
+            print('    {0:<32}{1:>10.4f}s{2:>8.1f}x'.format(
+                name,
+                seconds,
+                baseline / seconds
+            ))
+        bpy.data.objects.remove(mesh_object)
+        bpy.data.meshes.remove(mesh)
+
+
+if __name__ == '__main__':
+    main()
@@ -773,6 +773,22 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
             icon='AXIS_TOP',
             text="+Ref."
         )
+        layout.prop(
+            addon_data,
+            'grab_from_evaluated',
+            text='Grab from Evaluated Mesh (Modifiers)'
+        )
+        snap_settings = layout.row(align=True)
+        snap_settings.prop(
+            addon_data,
+            'snap_to_verts',
+            text='Snap Cursor Grabs to Verts'
+        )
+        snap_settings.prop(
+            addon_data,
+            'snap_tolerance',
+            text='Tolerance'
+        )
 
         # We start with a row that holds the prim list and buttons
         # for adding/subtracting prims (the data management section
@@ -932,6 +948,29 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                         icon='VERTEXSEL',
                         text="Grab All Global"
                     )
+                    pt_grab_all.operator(
+                        "maplus.grabspherefit",
+                        icon='MESH_UVSPHERE',
+                        text="Fit Sphere"
+                    )
+                    element_grabs = item_info_col.row(align=True)
+                    element_grab = element_grabs.operator(
+                        "maplus.grabelementpoint",
+                        icon='EDGESEL',
+                        text="Edge Midpoint"
+                    )
+                    element_grab.element_mode = 'EDGE_MIDPOINT'
+                    element_grab = element_grabs.operator(
+                        "maplus.grabelementpoint",
+                        icon='FACESEL',
+                        text="Face Center"
+                    )
+                    element_grab.element_mode = 'FACE_CENTER'
+                    element_grabs.operator(
+                        "maplus.grabsurfacepoint",
+                        icon='SNAP_FACE',
+                        text="Surface Point"
+                    )
                     item_info_col.separator()
                     special_grabs = item_info_col.row(align=True)
                     special_grabs.operator(
@@ -944,6 +983,11 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                         icon='PASTEDOWN',
                         text="Paste (From Clipboard)"
                     )
+                    special_grabs.operator(
+                        "maplus.snapcoordstoverts",
+                        icon='SNAP_ON',
+                        text=""
+                    )
                     item_info_col.separator()
 
                     maplus_guitools.layout_coordvec(
@@ -1015,6 +1059,34 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                         icon='VERTEXSEL',
                         text="Grab All Global"
                     )
+                    ln_grab_all.operator(
+                        "maplus.grablinefit",
+                        icon='IPO_LINEAR',
+                        text="Best Fit"
+                    )
+                    ln_grab_all.operator(
+                        "maplus.grabaxisfit",
+                        icon='MESH_CYLINDER',
+                        text="Fit Axis"
+                    )
+                    element_grabs = item_info_col.row(align=True)
+                    element_grab = element_grabs.operator(
+                        "maplus.grabelementline",
+                        icon='EDGESEL',
+                        text="Edge Direction"
+                    )
+                    element_grab.element_mode = 'EDGE_DIRECTION'
+                    element_grab = element_grabs.operator(
+                        "maplus.grabelementline",
+                        icon='FACESEL',
+                        text="Face Centers"
+                    )
+                    element_grab.element_mode = 'FACE_CENTERS'
+                    element_grabs.operator(
+                        "maplus.grabsurfacenormal",
+                        icon='SNAP_FACE',
+                        text="Surface Normal"
+                    )
                     item_info_col.separator()
                     special_grabs = item_info_col.row(align=True)
                     special_grabs.operator(
@@ -1034,6 +1106,11 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                         icon='PASTEDOWN',
                         text="Paste (From Clipboard)"
                     )
+                    special_grabs_extra.operator(
+                        "maplus.snapcoordstoverts",
+                        icon='SNAP_ON',
+                        text=""
+                    )
                     item_info_col.separator()
 
                     maplus_guitools.layout_coordvec(
@@ -1108,6 +1185,11 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                         icon='VERTEXSEL',
                         text="Grab All Global"
                     )
+                    plane_grab_all.operator(
+                        "maplus.grabplanefit",
+                        icon='MESH_PLANE',
+                        text="Best Fit"
+                    )
                     item_info_col.separator()
                     special_grabs = item_info_col.row(align=True)
                     special_grabs.operator(
@@ -1120,6 +1202,11 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                         icon='PASTEDOWN',
                         text="Paste (From Clipboard)"
                     )
+                    special_grabs.operator(
+                        "maplus.snapcoordstoverts",
+                        icon='SNAP_ON',
+                        text=""
+                    )
                     item_info_col.separator()
 
                     maplus_guitools.layout_coordvec(
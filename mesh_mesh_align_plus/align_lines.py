@@ -1,13 +1,13 @@
 """Align Lines tool, internals & UI."""
 
 
-import bmesh
 import bpy
-import mathutils
 
+from .utils import align_kernels as maplus_kernels
 from .utils import exceptions as maplus_except
 from .utils import geom as maplus_geom
 from .utils import gui_tools as maplus_guitools
+from .utils import transforms as maplus_transforms
 
 
 class MAPLUS_OT_AlignLinesBase(bpy.types.Operator):
@@ -16,11 +16,13 @@ class MAPLUS_OT_AlignLinesBase(bpy.types.Operator):
     bl_description = "Align lines base class"
     bl_options = {'REGISTER', 'UNDO'}
     target = None
+    # Set by the compute operators, which only store the per-object
+    # results on the transformation item
+    compute_only = False
 
     def execute(self, context):
         addon_data = bpy.context.scene.maplus_data
         prims = addon_data.prim_list
-        previous_mode = maplus_geom.get_active_object().mode
         if hasattr(self, "quick_op_target"):
             active_item = addon_data.quick_align_lines_transf
         else:
@@ -73,21 +75,12 @@ class MAPLUS_OT_AlignLinesBase(bpy.types.Operator):
                     )
                     return {'CANCELLED'}
 
-            if maplus_geom.get_active_object().type == 'MESH':
-                # a bmesh can only be initialized in edit mode...
-                if previous_mode != 'EDIT':
-                    bpy.ops.object.editmode_toggle()
-                else:
-                    # else we could already be in edit mode with some stale
-                    # updates, exiting and reentering forces an update
-                    bpy.ops.object.editmode_toggle()
-                    bpy.ops.object.editmode_toggle()
-
             # Get global coordinate data for each geometry item, with
             # modifiers applied. Grab either directly from the scene data
             # (for quick ops), or from the MAPlus primitives
             # CollectionProperty on the scene data (for advanced tools)
             if hasattr(self, 'quick_op_target'):
+                src_item = addon_data.quick_align_lines_src
                 if addon_data.quick_align_lines_auto_grab_src:
                     vert_attribs_to_set = ('line_start', 'line_end')
                     try:
@@ -106,14 +99,14 @@ class MAPLUS_OT_AlignLinesBase(bpy.types.Operator):
                         )
                         return {'CANCELLED'}
 
-                    maplus_geom.set_item_coords(
-                        addon_data.quick_align_lines_src,
-                        vert_attribs_to_set,
-                        vert_data
+                    src_item = maplus_geom.update_item(
+                        self,
+                        src_item,
+                        dict(zip(vert_attribs_to_set, vert_data))
                     )
 
                 src_global_data = maplus_geom.get_modified_global_coords(
-                    geometry=addon_data.quick_align_lines_src,
+                    geometry=src_item,
                     kind='LINE'
                 )
                 dest_global_data = maplus_geom.get_modified_global_coords(
@@ -140,133 +133,30 @@ class MAPLUS_OT_AlignLinesBase(bpy.types.Operator):
             dest_start = dest_global_data[0]
             dest_end = dest_global_data[1]
 
-            if self.target in {'OBJECT', 'OBJECT_ORIGIN'}:
-                for item in multi_edit_targets:
-                    # Get the object world matrix before we modify it here
-                    item_matrix_unaltered = item.matrix_world.copy()
-                    unaltered_inverse = item_matrix_unaltered.copy()
-                    unaltered_inverse.invert()
-
-                    # construct lines from the stored geometry
-                    src_line = src_end - src_start
-                    dest_line = dest_end - dest_start
-
-                    # Take modifiers on the transformation item into account,
-                    # in global (object) space
-                    if active_item.aln_flip_direction:
-                        src_line.negate()
-
-                    # find rotational difference between source and dest lines
-                    rotational_diff = src_line.rotation_difference(dest_line)
-                    parallelize_lines = rotational_diff.to_matrix()
-                    parallelize_lines.resize_4x4()
-
-                    # rotate active object so line one is parallel linear,
-                    # position will be corrected after this
-                    item.rotation_euler.rotate(
-                        rotational_diff
-                    )
-                    bpy.context.view_layer.update()
-
-                    # put the original line starting point (before the object
-                    # was rotated) into the local object space
-                    src_pivot_location_local = unaltered_inverse @ src_start
-
-                    # get final global position of pivot (source line
-                    # start coords) after object rotation
-                    new_global_src_pivot_coords = (
-                        item.matrix_world @
-                        src_pivot_location_local
-                    )
-                    # get translation, pivot to dest
-                    pivot_to_dest = (
-                        dest_start - new_global_src_pivot_coords
-                    )
-
-                    item.location = (
-                        item.location + pivot_to_dest
-                    )
-                    bpy.context.view_layer.update()
-
-            if self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}:
-                for item in multi_edit_targets:
-                    self.report(
-                        {'WARNING'},
-                        ('Warning: mesh transforms'
-                         ' on objects with non-uniform scaling'
-                         ' are not currently supported.')
-                    )
-                    # Init source mesh
-                    src_mesh = bmesh.new()
-                    src_mesh.from_mesh(item.data)
-
-                    # Get the object world matrix
-                    item_matrix_unaltered_loc = item.matrix_world.copy()
-                    unaltered_inverse_loc = item_matrix_unaltered_loc.copy()
-                    unaltered_inverse_loc.invert()
-
-                    # Stored geom data in local coords
-                    src_start_loc = unaltered_inverse_loc @ src_start
-                    src_end_loc = unaltered_inverse_loc @ src_end
-
-                    dest_start_loc = unaltered_inverse_loc @ dest_start
-                    dest_end_loc = unaltered_inverse_loc @ dest_end
-
-                    # Construct vectors for each line in local space
-                    loc_src_line = src_end_loc - src_start_loc
-                    loc_dest_line = dest_end_loc - dest_start_loc
-
-                    # Take modifiers on the transformation item into account,
-                    # in local (mesh) space
-                    if active_item.aln_flip_direction:
-                        loc_src_line.negate()
-
-                    # Get translation, move source pivot to local origin
-                    src_start_inv = src_start_loc.copy()
-                    src_start_inv.negate()
-                    src_pivot_to_loc_origin = mathutils.Matrix.Translation(
-                        src_start_inv
-                    )
-
-                    # Get edge alignment rotation (align src to dest)
-                    loc_rdiff = loc_src_line.rotation_difference(
-                        loc_dest_line
-                    )
-                    parallelize_lines_loc = loc_rdiff.to_matrix()
-                    parallelize_lines_loc.resize_4x4()
-
-                    # Get translation, move pivot to destination
-                    pivot_to_dest_loc = mathutils.Matrix.Translation(
-                        dest_start_loc
-                    )
-
-                    loc_make_collinear = (
-                        pivot_to_dest_loc @
-                        parallelize_lines_loc @
-                        src_pivot_to_loc_origin
+            transform = maplus_kernels.align_lines_matrix(
+                src_start,
+                src_end,
+                dest_start,
+                dest_end,
+                flip=active_item.aln_flip_direction
+            )
+            if self.compute_only:
+                maplus_transforms.store_transform_results(
+                    self,
+                    active_item,
+                    maplus_transforms.get_transform_results(
+                        multi_edit_targets,
+                        transform,
+                        self.target
                     )
-
-                    if self.target == 'MESH_SELECTED':
-                        src_mesh.transform(
-                            loc_make_collinear,
-                            filter={'SELECT'}
-                        )
-                    elif self.target == 'WHOLE_MESH':
-                        src_mesh.transform(loc_make_collinear)
-                    elif self.target == 'OBJECT_ORIGIN':
-                        # Note: a target of 'OBJECT_ORIGIN' is equivalent
-                        # to performing an object transf. + an inverse
-                        # whole mesh level transf. To the user,
-                        # the object appears to stay in the same place,
-                        # while only the object's origin moves.
-                        src_mesh.transform(loc_make_collinear.inverted())
-
-                    bpy.ops.object.mode_set(mode='OBJECT')
-                    src_mesh.to_mesh(item.data)
-                    src_mesh.free()
-
-            # Go back to whatever mode we were in before doing this
-            bpy.ops.object.mode_set(mode=previous_mode)
+                )
+            else:
+                maplus_transforms.apply_transform(
+                    self,
+                    multi_edit_targets,
+                    transform,
+                    self.target
+                )
 
         else:
             # The selected Blender objects are not compatible with the
@@ -342,6 +232,44 @@ class MAPLUS_OT_QuickAlignLinesWholeMesh(MAPLUS_OT_AlignLinesBase):
     quick_op_target = True
 
 
+class MAPLUS_OT_ComputeAlignLines(MAPLUS_OT_AlignLinesBase):
+    bl_idname = "maplus.computealignlines"
+    bl_label = "Compute Align Lines"
+    bl_description = (
+        "Computes the align lines transform of the active item for the"
+        " selected objects, and stores the per-object results on it"
+        " (computed_transforms) without changing anything"
+    )
+    # No undo step, nothing is changed
+    bl_options = {'REGISTER'}
+    compute_only = True
+    target: bpy.props.EnumProperty(
+        items=maplus_transforms.transform_target_items,
+        name="Target",
+        description="What the transform would be applied to",
+        default='OBJECT'
+    )
+
+
+class MAPLUS_OT_QuickComputeAlignLines(MAPLUS_OT_AlignLinesBase):
+    bl_idname = "maplus.quickcomputealignlines"
+    bl_label = "Quick Compute Align Lines"
+    bl_description = (
+        "Computes the quick align lines transform for the selected"
+        " objects, and stores the per-object results on the quick tool's"
+        " item (computed_transforms) without changing anything"
+    )
+    bl_options = {'REGISTER'}
+    compute_only = True
+    quick_op_target = True
+    target: bpy.props.EnumProperty(
+        items=maplus_transforms.transform_target_items,
+        name="Target",
+        description="What the transform would be applied to",
+        default='OBJECT'
+    )
+
+
 class MAPLUS_OT_ClearEasyAlignLines(bpy.types.Operator):
     bl_idname = "maplus.cleareasyalignlines"
     bl_label = "Reset Easy Align Lines"
@@ -392,7 +320,6 @@ class MAPLUS_OT_EasyAlignLines(bpy.types.Operator):
             - Reset to stage 1
         """
         addon_data = bpy.context.scene.maplus_data
-        previous_mode = maplus_geom.get_active_object().mode
         # Get valid objects from the target list
         valid_targets = [
             item
@@ -432,17 +359,6 @@ class MAPLUS_OT_EasyAlignLines(bpy.types.Operator):
         if not (addon_data.easy_aln_transf_type in {'WHOLE_MESH'}
                 and [item for item in multi_edit_targets if item.type != 'MESH']):
 
-            # Make sure we're in edit mode with no stale data for proper vert-grabbing
-            if maplus_geom.get_active_object().type == 'MESH':
-                # a bmesh can only be initialized in edit mode...
-                if previous_mode != 'EDIT':
-                    bpy.ops.object.editmode_toggle()
-                else:
-                    # else we could already be in edit mode with some stale
-                    # updates, exiting and reentering forces an update
-                    bpy.ops.object.editmode_toggle()
-                    bpy.ops.object.editmode_toggle()
-
             # Stage one (first-press) behavior
             if addon_data.easy_aln_is_first_press:
 
@@ -481,9 +397,6 @@ class MAPLUS_OT_EasyAlignLines(bpy.types.Operator):
                     vert_data
                 )
 
-                # Go back to whatever mode we were in before doing this
-                bpy.ops.object.mode_set(mode=previous_mode)
-
                 # Get/store the objects selected during the first press, these
                 # are used later during stage two, where the alignment will be run
                 # against all of these objects
@@ -559,128 +472,24 @@ class MAPLUS_OT_EasyAlignLines(bpy.types.Operator):
                 dest_start = dest_global_data[0]
                 dest_end = dest_global_data[1]
 
-                if addon_data.easy_aln_transf_type in {'OBJECT'}:
-                    for item in multi_edit_targets:
-                        # Get the object world matrix before we modify it here
-                        item_matrix_unaltered = item.matrix_world.copy()
-                        unaltered_inverse = item_matrix_unaltered.copy()
-                        unaltered_inverse.invert()
-
-                        # construct lines from the stored geometry
-                        src_line = src_end - src_start
-                        dest_line = dest_end - dest_start
-
-                        # Take modifiers on the transformation item into account,
-                        # in global (object) space
-                        if addon_data.easy_aln_transform_settings.aln_flip_direction:
-                            src_line.negate()
-
-                        # find rotational difference between source and dest lines
-                        rotational_diff = src_line.rotation_difference(dest_line)
-                        parallelize_lines = rotational_diff.to_matrix()
-                        parallelize_lines.resize_4x4()
-
-                        # rotate active object so line one is parallel linear,
-                        # position will be corrected after this
-                        item.rotation_euler.rotate(
-                            rotational_diff
-                        )
-                        bpy.context.view_layer.update()
-
-                        # put the original line starting point (before the object
-                        # was rotated) into the local object space
-                        src_pivot_location_local = unaltered_inverse @ src_start
-
-                        # get final global position of pivot (source line
-                        # start coords) after object rotation
-                        new_global_src_pivot_coords = (
-                                item.matrix_world @
-                                src_pivot_location_local
-                        )
-                        # get translation, pivot to dest
-                        pivot_to_dest = (
-                                dest_start - new_global_src_pivot_coords
-                        )
-
-                        item.location = (
-                                item.location + pivot_to_dest
-                        )
-                        bpy.context.view_layer.update()
-
-                if addon_data.easy_aln_transf_type in {'WHOLE_MESH'}:
-
-                    self.report(
-                        {'WARNING'},
-                        ('Warning: mesh transforms'
-                         ' on objects with non-uniform scaling'
-                         ' are not currently supported.')
-                    )
-
-                    for item in multi_edit_targets:
-
-                        # Init source mesh
-                        src_mesh = bmesh.new()
-                        src_mesh.from_mesh(item.data)
-
-                        # Get the object world matrix
-                        item_matrix_unaltered_loc = item.matrix_world.copy()
-                        unaltered_inverse_loc = item_matrix_unaltered_loc.copy()
-                        unaltered_inverse_loc.invert()
-
-                        # Stored geom data in local coords
-                        src_start_loc = unaltered_inverse_loc @ src_start
-                        src_end_loc = unaltered_inverse_loc @ src_end
-
-                        dest_start_loc = unaltered_inverse_loc @ dest_start
-                        dest_end_loc = unaltered_inverse_loc @ dest_end
-
-                        # Construct vectors for each line in local space
-                        loc_src_line = src_end_loc - src_start_loc
-                        loc_dest_line = dest_end_loc - dest_start_loc
-
-                        # Take modifiers on the transformation item into account,
-                        # in local (mesh) space
-                        if addon_data.easy_aln_transform_settings.aln_flip_direction:
-                            loc_src_line.negate()
-
-                        # Get translation, move source pivot to local origin
-                        src_start_inv = src_start_loc.copy()
-                        src_start_inv.negate()
-                        src_pivot_to_loc_origin = mathutils.Matrix.Translation(
-                            src_start_inv
-                        )
-
-                        # Get edge alignment rotation (align src to dest)
-                        loc_rdiff = loc_src_line.rotation_difference(
-                            loc_dest_line
-                        )
-                        parallelize_lines_loc = loc_rdiff.to_matrix()
-                        parallelize_lines_loc.resize_4x4()
-
-                        # Get translation, move pivot to destination
-                        pivot_to_dest_loc = mathutils.Matrix.Translation(
-                            dest_start_loc
-                        )
-
-                        loc_make_collinear = (
-                                pivot_to_dest_loc @
-                                parallelize_lines_loc @
-                                src_pivot_to_loc_origin
-                        )
-
-                        src_mesh.transform(loc_make_collinear)
-
-                        bpy.ops.object.mode_set(mode='OBJECT')
-                        src_mesh.to_mesh(item.data)
-                        src_mesh.free()
+                transform = maplus_kernels.align_lines_matrix(
+                    src_start,
+                    src_end,
+                    dest_start,
+                    dest_end,
+                    flip=addon_data.easy_aln_transform_settings.aln_flip_direction
+                )
+                maplus_transforms.apply_transform(
+                    self,
+                    multi_edit_targets,
+                    transform,
+                    addon_data.easy_aln_transf_type
+                )
 
                 # Clear stored source data once the transform is applied
                 addon_data.easy_aln_is_first_press = True
                 addon_data.easy_aln_designated_objects.clear()
 
-            # Go back to whatever mode we were in before doing this
-            bpy.ops.object.mode_set(mode=previous_mode)
-
         else:
             # The selected Blender objects are not compatible with the
             # requested transformation type (we can't apply a transform
@@ -860,6 +669,16 @@ class MAPLUS_PT_QuickAlignLinesGUI(bpy.types.Panel):
                         icon='LIGHT_HEMI',
                         text=""
                     )
+                    preserve_button_roundedge.operator(
+                        "maplus.quickalignlinesgrabfitsrc",
+                        icon='IPO_LINEAR',
+                        text=""
+                    )
+                    preserve_button_roundedge.operator(
+                        "maplus.quickalignlinesgrabaxisfitsrc",
+                        icon='MESH_CYLINDER',
+                        text=""
+                    )
                 else:
                     aln_src_geom_top.operator(
                             "maplus.showhidequickalnsrcgeom",
@@ -884,6 +703,34 @@ class MAPLUS_PT_QuickAlignLinesGUI(bpy.types.Panel):
                         icon='VERTEXSEL',
                         text="Grab All Global"
                     )
+                    ln_grab_all.operator(
+                        "maplus.quickalignlinesgrabfitsrc",
+                        icon='IPO_LINEAR',
+                        text="Best Fit"
+                    )
+                    ln_grab_all.operator(
+                        "maplus.quickalignlinesgrabaxisfitsrc",
+                        icon='MESH_CYLINDER',
+                        text="Fit Axis"
+                    )
+                    element_grabs = aln_src_geom_editor.row(align=True)
+                    element_grab = element_grabs.operator(
+                        "maplus.quickalignlinesgrabelementsrc",
+                        icon='EDGESEL',
+                        text="Edge Direction"
+                    )
+                    element_grab.element_mode = 'EDGE_DIRECTION'
+                    element_grab = element_grabs.operator(
+                        "maplus.quickalignlinesgrabelementsrc",
+                        icon='FACESEL',
+                        text="Face Centers"
+                    )
+                    element_grab.element_mode = 'FACE_CENTERS'
+                    element_grabs.operator(
+                        "maplus.quickalignlinesgrabsurfacesrc",
+                        icon='SNAP_FACE',
+                        text="Surface Normal"
+                    )
                     special_grabs = aln_src_geom_editor.row(align=True)
                     special_grabs.operator(
                         "maplus.quickalngrabnormalsrc",
@@ -901,6 +748,13 @@ class MAPLUS_PT_QuickAlignLinesGUI(bpy.types.Panel):
                         icon='PASTEDOWN',
                         text="Paste (From Clipboard)"
                     )
+                    snap_coords = special_grabs_extra.operator(
+                        "maplus.snapcoordstoverts",
+                        icon='SNAP_ON',
+                        text=""
+                    )
+                    snap_coords.target = 'ALNSRC'
+                    snap_coords.item_kind = 'LINE'
 
                     modifier_header = aln_src_geom_editor.row()
                     modifier_header.label(text="Line Modifiers:")
@@ -1000,6 +854,16 @@ class MAPLUS_PT_QuickAlignLinesGUI(bpy.types.Panel):
                     icon='LIGHT_HEMI',
                     text=""
                 )
+                preserve_button_roundedge.operator(
+                    "maplus.quickalignlinesgrabfitdest",
+                    icon='IPO_LINEAR',
+                    text=""
+                )
+                preserve_button_roundedge.operator(
+                    "maplus.quickalignlinesgrabaxisfitdest",
+                    icon='MESH_CYLINDER',
+                    text=""
+                )
             else:
                 aln_dest_geom_top.operator(
                         "maplus.showhidequickalndestgeom",
@@ -1024,6 +888,34 @@ class MAPLUS_PT_QuickAlignLinesGUI(bpy.types.Panel):
                     icon='VERTEXSEL',
                     text="Grab All Global"
                 )
+                ln_grab_all.operator(
+                    "maplus.quickalignlinesgrabfitdest",
+                    icon='IPO_LINEAR',
+                    text="Best Fit"
+                )
+                ln_grab_all.operator(
+                    "maplus.quickalignlinesgrabaxisfitdest",
+                    icon='MESH_CYLINDER',
+                    text="Fit Axis"
+                )
+                element_grabs = aln_dest_geom_editor.row(align=True)
+                element_grab = element_grabs.operator(
+                    "maplus.quickalignlinesgrabelementdest",
+                    icon='EDGESEL',
+                    text="Edge Direction"
+                )
+                element_grab.element_mode = 'EDGE_DIRECTION'
+                element_grab = element_grabs.operator(
+                    "maplus.quickalignlinesgrabelementdest",
+                    icon='FACESEL',
+                    text="Face Centers"
+                )
+                element_grab.element_mode = 'FACE_CENTERS'
+                element_grabs.operator(
+                    "maplus.quickalignlinesgrabsurfacedest",
+                    icon='SNAP_FACE',
+                    text="Surface Normal"
+                )
                 special_grabs = aln_dest_geom_editor.row(align=True)
                 special_grabs.operator(
                     "maplus.quickalngrabnormaldest",
@@ -1041,6 +933,13 @@ class MAPLUS_PT_QuickAlignLinesGUI(bpy.types.Panel):
                     icon='PASTEDOWN',
                     text="Paste (From Clipboard)"
                 )
+                snap_coords = special_grabs_extra.operator(
+                    "maplus.snapcoordstoverts",
+                    icon='SNAP_ON',
+                    text=""
+                )
+                snap_coords.target = 'ALNDEST'
+                snap_coords.item_kind = 'LINE'
 
                 modifier_header = aln_dest_geom_editor.row()
                 modifier_header.label(text="Line Modifiers:")
@@ -3,13 +3,14 @@
 
 import traceback
 
-import bmesh
 import bpy
 import mathutils
 
+from .utils import align_kernels as maplus_kernels
 from .utils import exceptions as maplus_except
 from .utils import geom as maplus_geom
 from .utils import gui_tools as maplus_guitools
+from .utils import transforms as maplus_transforms
 
 
 class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
@@ -17,15 +18,22 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
     bl_label = "Align Planes base"
     bl_description = "Align Planes base class"
     bl_options = {'REGISTER', 'UNDO'}
+    # Set by the compute operators, which only store the per-object
+    # results on the transformation item
+    compute_only = False
 
     def execute(self, context):
         addon_data = bpy.context.scene.maplus_data
         prims = addon_data.prim_list
-        previous_mode = maplus_geom.get_active_object().mode
         if not hasattr(self, "quick_op_target"):
             active_item = prims[addon_data.active_list_item]
         else:
             active_item = addon_data.quick_align_planes_transf
+        target = self.target
+        if (hasattr(self, 'quick_op_target')
+                and addon_data.quick_align_planes_set_origin_mode):
+            # *Set Origin* mode is always an OBJECT_ORIGIN transform
+            target = 'OBJECT_ORIGIN'
         # Gather selected Blender object(s) to apply the transform to
         multi_edit_targets = [
             item for item in bpy.context.scene.objects if (
@@ -33,7 +41,7 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
             )
         ]
         # Check prerequisites for mesh level transforms, need an active/selected object
-        if (self.target != 'OBJECT' and not (maplus_geom.get_active_object()
+        if (target != 'OBJECT' and not (maplus_geom.get_active_object()
                 and maplus_geom.get_select_state(maplus_geom.get_active_object()))):
             self.report(
                 {'ERROR'},
@@ -61,7 +69,7 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
 
         # Proceed only if selected Blender objects are compatible with the transform target
         # (Do not allow mesh-level transforms when there are non-mesh objects selected)
-        if not (self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}
+        if not (target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}
                 and [item for item in multi_edit_targets if item.type != 'MESH']):
 
             if not hasattr(self, "quick_op_target"):
@@ -74,21 +82,12 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
                     )
                     return {'CANCELLED'}
 
-            if maplus_geom.get_active_object().type == 'MESH':
-                # a bmesh can only be initialized in edit mode...
-                if previous_mode != 'EDIT':
-                    bpy.ops.object.editmode_toggle()
-                else:
-                    # else we could already be in edit mode with some stale
-                    # updates, exiting and reentering forces an update
-                    bpy.ops.object.editmode_toggle()
-                    bpy.ops.object.editmode_toggle()
-
             # Get global coordinate data for each geometry item, with
             # modifiers applied. Grab either directly from the scene data
             # (for quick ops), or from the MAPlus primitives
             # CollectionProperty on the scene data (for advanced tools)
             if hasattr(self, "quick_op_target"):
+                src_item = addon_data.quick_align_planes_src
                 if (addon_data.quick_align_planes_auto_grab_src
                         and not addon_data.quick_align_planes_set_origin_mode):
                     vert_attribs_to_set = (
@@ -112,14 +111,14 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
                         )
                         return {'CANCELLED'}
 
-                    maplus_geom.set_item_coords(
-                        addon_data.quick_align_planes_src,
-                        vert_attribs_to_set,
-                        vert_data
+                    src_item = maplus_geom.update_item(
+                        self,
+                        src_item,
+                        dict(zip(vert_attribs_to_set, vert_data))
                     )
 
                 src_global_data = maplus_geom.get_modified_global_coords(
-                    geometry=addon_data.quick_align_planes_src,
+                    geometry=src_item,
                     kind='PLANE'
                 )
                 dest_global_data = maplus_geom.get_modified_global_coords(
@@ -156,33 +155,6 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
                 dest_pt_b = dest_global_data[1]
             dest_pt_c = dest_global_data[2]
 
-            # We need global data for the object operation and for creation
-            # of a custom transform orientation if the user enables it.
-            # construct normal vector for first (source) plane
-            src_pln_ln_BA = src_pt_a - src_pt_b
-            src_pln_ln_BC = src_pt_c - src_pt_b
-            src_normal = src_pln_ln_BA.cross(src_pln_ln_BC)
-
-            # Take modifiers on the transformation item into account,
-            # in global (object) space
-            if active_item.apl_flip_normal:
-                src_normal.negate()
-
-            # construct normal vector for second (destination) plane
-            dest_pln_ln_BA = dest_pt_a - dest_pt_b
-            dest_pln_ln_BC = dest_pt_c - dest_pt_b
-            dest_normal = dest_pln_ln_BA.cross(dest_pln_ln_BC)
-
-            # find rotational difference between source and dest planes
-            rotational_diff = src_normal.rotation_difference(dest_normal)
-
-            # Set up edge alignment (BA plane1 to BA plane2)
-            new_lead_edge_orientation = src_pln_ln_BA.copy()
-            new_lead_edge_orientation.rotate(rotational_diff)
-            parallelize_edges = new_lead_edge_orientation.rotation_difference(
-                dest_pln_ln_BA
-            )
-
             # # ############################################################
             # # TODO: Create custom transform orientation for destination
             # # plane. This is disabled until a solution can be found.
@@ -244,343 +216,93 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
                 # with the mesh level transf. inverted), with a special set of SOURCE
                 # verts (a triangle at the current object's origin per object)
 
-                for item in multi_edit_targets:
-
-                    ######## COMMON DATA ########
+                # We have a separate/alternate storage plane for this data
+                dest_data_set_origin_mode = maplus_geom.get_modified_global_coords(
+                    geometry=addon_data.quick_align_planes_set_origin_mode_dest,
+                    kind='PLANE'
+                )
 
+                mesh_targets = maplus_transforms.get_unique_mesh_targets(
+                    multi_edit_targets
+                )
+                object_transforms = []
+                for item in mesh_targets:
                     # *Set Origin* mode uses a set of 3 pts at the object's origin
-                    src_pt_a = (
-                        item.matrix_world
-                        @ mathutils.Vector((1, 0.0, 0.0))
-                    )
-                    src_pt_b = (
-                        item.matrix_world
-                        @ mathutils.Vector((0.0, 0.0, 0.0))
-                    )
-                    src_pt_c = (
-                        item.matrix_world
-                        @ mathutils.Vector((0.0, 1, 0.0))
-                    )
-
-                    # We have a separate/alternate storage plane for this data
-                    dest_data_set_origin_mode = maplus_geom.get_modified_global_coords(
-                        geometry=addon_data.quick_align_planes_set_origin_mode_dest,
-                        kind='PLANE'
-                    )
-                    dest_pt_a = dest_data_set_origin_mode[0]
-                    dest_pt_b = dest_data_set_origin_mode[1]
-                    dest_pt_c = dest_data_set_origin_mode[2]
-
-                    # Set the pivot point here (co-located points on src/dest after alignment)
-                    src_pivot = src_pt_b
-                    dest_pivot = dest_pt_b
-                    if addon_data.quick_align_planes_set_origin_mode_alt_pivot:
-                        print('AAA')
-                        # *Set Origin* mode uses a set of 3 pts at the object's origin
-                        src_pt_a, src_pt_b = src_pt_b, src_pt_a
-
-                        src_pivot = src_pt_a
-                        dest_pivot = dest_pt_a
-
-                    # We need global data for the object operation and for creation
-                    # of a custom transform orientation if the user enables it.
-                    # construct normal vector for first (source) plane
-                    src_pln_ln_BA = src_pt_a - src_pt_b
-                    src_pln_ln_BC = src_pt_c - src_pt_b
-                    src_normal = src_pln_ln_BA.cross(src_pln_ln_BC)
-
-                    # construct normal vector for second (destination) plane
-                    dest_pln_ln_BA = dest_pt_a - dest_pt_b
-                    dest_pln_ln_BC = dest_pt_c - dest_pt_b
-                    dest_normal = dest_pln_ln_BA.cross(dest_pln_ln_BC)
-
-                    # find rotational difference between source and dest planes
-                    rotational_diff = src_normal.rotation_difference(dest_normal)
-
-                    # Set up edge alignment (BA plane1 to BA plane2)
-                    new_lead_edge_orientation = src_pln_ln_BA.copy()
-                    new_lead_edge_orientation.rotate(rotational_diff)
-                    parallelize_edges = new_lead_edge_orientation.rotation_difference(
-                        dest_pln_ln_BA
-                    )
-
-                    ######## OBJECT ########
-
-                    # Get the object world matrix before we modify it here
-                    item_matrix_unaltered = item.matrix_world.copy()
-                    unaltered_inverse = item_matrix_unaltered.copy()
-                    unaltered_inverse.invert()
-
-                    # Try to rotate the object by the rotational_diff
-                    item.rotation_euler.rotate(
-                        rotational_diff
-                    )
-                    bpy.context.view_layer.update()
-
-                    # Parallelize the leading edges
-                    item.rotation_euler.rotate(
-                        parallelize_edges
-                    )
-                    bpy.context.view_layer.update()
-
-                    # get local coords using active object as basis, in
-                    # other words, determine coords of the source pivot
-                    # relative to the active object's origin by reversing
-                    # the active object's transf from the pivot's coords
-                    local_src_pivot_coords = (
-                        unaltered_inverse @ src_pivot
-                    )
-
-                    # find the new global location of the pivot (we access
-                    # the item's matrix_world directly here since we
-                    # changed/updated it earlier)
-                    new_global_src_pivot_coords = (
-                        item.matrix_world @ local_src_pivot_coords
-                    )
-                    # figure out how to translate the object (the translation
-                    # vector) so that the source pivot sits on the destination
-                    # pivot's location
-                    # first vector is the global/absolute distance
-                    # between the two pivots
-                    pivot_to_dest = (
-                        dest_pivot -
-                        new_global_src_pivot_coords
-                    )
-                    item.location = (
-                        item.location +
-                        pivot_to_dest
-                    )
-                    bpy.context.view_layer.update()
-
-                    ######## MESH ########
-                    self.report(
-                        {'WARNING'},
-                        ('Warning: mesh transforms'
-                         ' on objects with non-uniform scaling'
-                         ' are not currently supported.')
-                    )
-                    src_mesh = bmesh.new()
-                    src_mesh.from_mesh(item.data)
-
-                    item_matrix_unaltered_loc = item.matrix_world.copy()
-                    unaltered_inverse_loc = item_matrix_unaltered_loc.copy()
-                    unaltered_inverse_loc.invert()
-
-                    # Stored geom data in local coords
-                    src_a_loc = unaltered_inverse_loc @ src_pt_a
-                    src_b_loc = unaltered_inverse_loc @ src_pt_b
-                    src_c_loc = unaltered_inverse_loc @ src_pt_c
-
-                    dest_a_loc = unaltered_inverse_loc @ dest_pt_a
-                    dest_b_loc = unaltered_inverse_loc @ dest_pt_b
-                    dest_c_loc = unaltered_inverse_loc @ dest_pt_c
-
-                    src_ba_loc = src_a_loc - src_b_loc
-                    src_bc_loc = src_c_loc - src_b_loc
-                    src_normal_loc = src_ba_loc.cross(src_bc_loc)
-
-                    dest_ba_loc = dest_a_loc - dest_b_loc
-                    dest_bc_loc = dest_c_loc - dest_b_loc
-                    dest_normal_loc = dest_ba_loc.cross(dest_bc_loc)
+                    src_pts = [
+                        item.matrix_world @ mathutils.Vector((1, 0.0, 0.0)),
+                        item.matrix_world @ mathutils.Vector((0.0, 0.0, 0.0)),
+                        item.matrix_world @ mathutils.Vector((0.0, 1, 0.0))
+                    ]
 
                     # Set the pivot point here (co-located points on src/dest after alignment)
-                    src_pivot_loc = src_b_loc
-                    dest_pivot_loc = dest_b_loc
+                    pivot_index = 1
                     if addon_data.quick_align_planes_set_origin_mode_alt_pivot:
-                        # *Set Origin* mode uses a set of 3 pts at the object's origin
-                        print('BBB')
-                        src_pivot_loc = src_a_loc
-                        dest_pivot_loc = dest_a_loc
-
-                    # Get translation, move source pivot to local origin
-                    src_pivot_inv = src_pivot_loc.copy()
-                    src_pivot_inv.negate()
-                    src_pivot_to_loc_origin = mathutils.Matrix.Translation(
-                        src_pivot_inv
-                    )
-
-                    # Get rotational diff between planes
-                    loc_rot_diff = src_normal_loc.rotation_difference(
-                        dest_normal_loc
+                        src_pts[0], src_pts[1] = src_pts[1], src_pts[0]
+                        pivot_index = 0
+
+                    object_transforms.append(
+                        maplus_kernels.align_planes_matrix(
+                            src_pts,
+                            dest_data_set_origin_mode[:3],
+                            pivot_index=pivot_index
+                        )
                     )
-                    parallelize_planes_loc = loc_rot_diff.to_matrix()
-                    parallelize_planes_loc.resize_4x4()
 
-                    # Get edge alignment rotation (align leading plane edges)
-                    new_lead_edge_ornt_loc = (
-                            parallelize_planes_loc @ src_ba_loc
+                # Users of the same mesh share its transform
+                mesh_transforms = {
+                    item.data.session_uid: object_transform
+                    for item, object_transform in zip(
+                        mesh_targets,
+                        object_transforms
                     )
-                    edge_align_loc = (
-                        new_lead_edge_ornt_loc.rotation_difference(
-                            dest_ba_loc
+                }
+                target_transforms = [
+                    mesh_transforms[item.data.session_uid]
+                    for item in multi_edit_targets
+                ]
+                if self.compute_only:
+                    maplus_transforms.store_transform_results(
+                        self,
+                        active_item,
+                        maplus_transforms.get_transform_results(
+                            multi_edit_targets,
+                            target_transforms,
+                            'OBJECT_ORIGIN'
                         )
                     )
-                    parallelize_edges_loc = edge_align_loc.to_matrix()
-                    parallelize_edges_loc.resize_4x4()
-
-                    # Get translation, move pivot to destination
-                    pivot_to_dest_loc = mathutils.Matrix.Translation(
-                        dest_pivot_loc
-                    )
-
-                    mesh_coplanar = (
-                            pivot_to_dest_loc @
-                            parallelize_edges_loc @
-                            parallelize_planes_loc @
-                            src_pivot_to_loc_origin
+                else:
+                    # Special *Set Origin* mode needs only an
+                    # OBJECT_ORIGIN transform
+                    maplus_transforms.apply_transform(
+                        self,
+                        multi_edit_targets,
+                        target_transforms,
+                        'OBJECT_ORIGIN'
                     )
 
-                    # Special *Set Origin* mode needs only a
-                    # mesh level OBJECT_ORIGIN transform only
-                    src_mesh.transform(mesh_coplanar.inverted())
-
-                    bpy.ops.object.mode_set(mode='OBJECT')
-                    src_mesh.to_mesh(item.data)
-
             else:
-                if self.target in {'OBJECT', 'OBJECT_ORIGIN'}:
-                    for item in multi_edit_targets:
-                        # Get the object world matrix before we modify it here
-                        item_matrix_unaltered = item.matrix_world.copy()
-                        unaltered_inverse = item_matrix_unaltered.copy()
-                        unaltered_inverse.invert()
-
-                        # Try to rotate the object by the rotational_diff
-                        item.rotation_euler.rotate(
-                            rotational_diff
-                        )
-                        bpy.context.view_layer.update()
-
-                        # Parallelize the leading edges
-                        item.rotation_euler.rotate(
-                            parallelize_edges
-                        )
-                        bpy.context.view_layer.update()
-
-                        # get local coords using active object as basis, in
-                        # other words, determine coords of the source pivot
-                        # relative to the active object's origin by reversing
-                        # the active object's transf from the pivot's coords
-                        local_src_pivot_coords = (
-                            unaltered_inverse @ src_pt_b
-                        )
-
-                        # find the new global location of the pivot (we access
-                        # the item's matrix_world directly here since we
-                        # changed/updated it earlier)
-                        new_global_src_pivot_coords = (
-                            item.matrix_world @ local_src_pivot_coords
-                        )
-                        # figure out how to translate the object (the translation
-                        # vector) so that the source pivot sits on the destination
-                        # pivot's location
-                        # first vector is the global/absolute distance
-                        # between the two pivots
-                        pivot_to_dest = (
-                            dest_pt_b -
-                            new_global_src_pivot_coords
-                        )
-                        item.location = (
-                            item.location +
-                            pivot_to_dest
-                        )
-                        bpy.context.view_layer.update()
-
-                if self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}:
-                    for item in multi_edit_targets:
-                        self.report(
-                            {'WARNING'},
-                            ('Warning: mesh transforms'
-                             ' on objects with non-uniform scaling'
-                             ' are not currently supported.')
-                        )
-                        src_mesh = bmesh.new()
-                        src_mesh.from_mesh(item.data)
-
-                        item_matrix_unaltered_loc = item.matrix_world.copy()
-                        unaltered_inverse_loc = item_matrix_unaltered_loc.copy()
-                        unaltered_inverse_loc.invert()
-
-                        # Stored geom data in local coords
-                        src_a_loc = unaltered_inverse_loc @ src_pt_a
-                        src_b_loc = unaltered_inverse_loc @ src_pt_b
-                        src_c_loc = unaltered_inverse_loc @ src_pt_c
-
-                        dest_a_loc = unaltered_inverse_loc @ dest_pt_a
-                        dest_b_loc = unaltered_inverse_loc @ dest_pt_b
-                        dest_c_loc = unaltered_inverse_loc @ dest_pt_c
-
-                        src_ba_loc = src_a_loc - src_b_loc
-                        src_bc_loc = src_c_loc - src_b_loc
-                        src_normal_loc = src_ba_loc.cross(src_bc_loc)
-
-                        # Take modifiers on the transformation item into account,
-                        # in local (mesh) space
-                        if active_item.apl_flip_normal:
-                            src_normal_loc.negate()
-
-                        dest_ba_loc = dest_a_loc - dest_b_loc
-                        dest_bc_loc = dest_c_loc - dest_b_loc
-                        dest_normal_loc = dest_ba_loc.cross(dest_bc_loc)
-
-                        # Get translation, move source pivot to local origin
-                        src_b_inv = src_b_loc.copy()
-                        src_b_inv.negate()
-                        src_pivot_to_loc_origin = mathutils.Matrix.Translation(
-                            src_b_inv
-                        )
-
-                        # Get rotational diff between planes
-                        loc_rot_diff = src_normal_loc.rotation_difference(
-                            dest_normal_loc
-                        )
-                        parallelize_planes_loc = loc_rot_diff.to_matrix()
-                        parallelize_planes_loc.resize_4x4()
-
-                        # Get edge alignment rotation (align leading plane edges)
-                        new_lead_edge_ornt_loc = (
-                            parallelize_planes_loc @ src_ba_loc
-                        )
-                        edge_align_loc = (
-                            new_lead_edge_ornt_loc.rotation_difference(
-                                dest_ba_loc
-                            )
-                        )
-                        parallelize_edges_loc = edge_align_loc.to_matrix()
-                        parallelize_edges_loc.resize_4x4()
-
-                        # Get translation, move pivot to destination
-                        pivot_to_dest_loc = mathutils.Matrix.Translation(
-                            dest_b_loc
-                        )
-
-                        mesh_coplanar = (
-                            pivot_to_dest_loc @
-                            parallelize_edges_loc @
-                            parallelize_planes_loc @
-                            src_pivot_to_loc_origin
+                transform = maplus_kernels.align_planes_matrix(
+                    (src_pt_a, src_pt_b, src_pt_c),
+                    (dest_pt_a, dest_pt_b, dest_pt_c),
+                    flip_normal=active_item.apl_flip_normal
+                )
+                if self.compute_only:
+                    maplus_transforms.store_transform_results(
+                        self,
+                        active_item,
+                        maplus_transforms.get_transform_results(
+                            multi_edit_targets,
+                            transform,
+                            target
                         )
-
-                        if self.target == 'MESH_SELECTED':
-                            src_mesh.transform(
-                                mesh_coplanar,
-                                filter={'SELECT'}
-                            )
-                        elif self.target == 'WHOLE_MESH':
-                            src_mesh.transform(mesh_coplanar)
-                        elif self.target == 'OBJECT_ORIGIN':
-                            # Note: a target of 'OBJECT_ORIGIN' is equivalent
-                            # to performing an object transf. + an inverse
-                            # whole mesh level transf. To the user,
-                            # the object appears to stay in the same place,
-                            # while only the object's origin moves.
-                            src_mesh.transform(mesh_coplanar.inverted())
-
-                        bpy.ops.object.mode_set(mode='OBJECT')
-                        src_mesh.to_mesh(item.data)
-
-            # Go back to whatever mode we were in before doing this
-            bpy.ops.object.mode_set(mode=previous_mode)
+                    )
+                else:
+                    maplus_transforms.apply_transform(
+                        self,
+                        multi_edit_targets,
+                        transform,
+                        target
+                    )
 
         else:
             # The selected Blender objects are not compatible with the
@@ -677,6 +399,70 @@ class MAPLUS_OT_QuickAlignPlanesWholeMesh(MAPLUS_OT_AlignPlanesBase):
         return True
 
 
+class MAPLUS_OT_ComputeAlignPlanes(MAPLUS_OT_AlignPlanesBase):
+    bl_idname = "maplus.computealignplanes"
+    bl_label = "Compute Align Planes"
+    bl_description = (
+        "Computes the align planes transform of the active item for the"
+        " selected objects, and stores the per-object results on it"
+        " (computed_transforms) without changing anything"
+    )
+    # No undo step, nothing is changed
+    bl_options = {'REGISTER'}
+    compute_only = True
+    target: bpy.props.EnumProperty(
+        items=maplus_transforms.transform_target_items,
+        name="Target",
+        description="What the transform would be applied to",
+        default='OBJECT'
+    )
+
+
+class MAPLUS_OT_QuickComputeAlignPlanes(MAPLUS_OT_AlignPlanesBase):
+    bl_idname = "maplus.quickcomputealignplanes"
+    bl_label = "Quick Compute Align Planes"
+    bl_description = (
+        "Computes the quick align planes transform for the selected"
+        " objects, and stores the per-object results on the quick tool's"
+        " item (computed_transforms) without changing anything"
+    )
+    bl_options = {'REGISTER'}
+    compute_only = True
+    quick_op_target = True
+    target: bpy.props.EnumProperty(
+        items=maplus_transforms.transform_target_items,
+        name="Target",
+        description="What the transform would be applied to",
+        default='OBJECT'
+    )
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        if addon_data.quick_align_planes_set_origin_mode:
+            return False
+        return True
+
+
+class MAPLUS_OT_QuickComputeAlignPlanesSetOrigin(MAPLUS_OT_AlignPlanesBase):
+    bl_idname = "maplus.quickcomputealignplanessetorigin"
+    bl_label = "Quick Compute Align Planes Set Origin"
+    bl_description = (
+        "Computes the quick align planes *Set Origin* transform for the"
+        " selected objects, and stores the per-object results on the quick"
+        " tool's item (computed_transforms) without changing anything"
+    )
+    bl_options = {'REGISTER'}
+    compute_only = True
+    quick_op_target = True
+    target = 'OBJECT_ORIGIN'
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        return addon_data.quick_align_planes_set_origin_mode
+
+
 class MAPLUS_OT_ClearEasyAlignPlanes(bpy.types.Operator):
     bl_idname = "maplus.cleareasyalignplanes"
     bl_label = "Reset Easy Align Planes"
@@ -752,7 +538,6 @@ class MAPLUS_OT_EasyAlignPlanes(bpy.types.Operator):
         object in the target list (stored as noted above during the stage 1).
         """
         addon_data = bpy.context.scene.maplus_data
-        previous_mode = maplus_geom.get_active_object().mode
         # Get valid objects from the target list
         valid_targets = [
             item
@@ -792,17 +577,6 @@ class MAPLUS_OT_EasyAlignPlanes(bpy.types.Operator):
         if not (addon_data.easy_apl_transf_type in {'WHOLE_MESH'}
                 and [item for item in multi_edit_targets if item.type != 'MESH']):
 
-            # Make sure we're in edit mode with no stale data for proper vert-grabbing
-            if maplus_geom.get_active_object().type == 'MESH':
-                # a bmesh can only be initialized in edit mode...
-                if previous_mode != 'EDIT':
-                    bpy.ops.object.editmode_toggle()
-                else:
-                    # else we could already be in edit mode with some stale
-                    # updates, exiting and reentering forces an update
-                    bpy.ops.object.editmode_toggle()
-                    bpy.ops.object.editmode_toggle()
-
             # Stage one (first-press) behavior
             if addon_data.easy_apl_is_first_press:
 
@@ -835,9 +609,6 @@ class MAPLUS_OT_EasyAlignPlanes(bpy.types.Operator):
                     vert_data
                 )
 
-                # Go back to whatever mode we were in before doing this
-                bpy.ops.object.mode_set(mode=previous_mode)
-
                 # Get/store the objects selected during the first press, these
                 # are used later during stage two, where the alignment will be run
                 # against all of these objects
@@ -918,171 +689,22 @@ class MAPLUS_OT_EasyAlignPlanes(bpy.types.Operator):
                     dest_pt_b = dest_global_data[1]
                 dest_pt_c = dest_global_data[2]
 
-                # We need global data for the object operation and for creation
-                # of a custom transform orientation if the user enables it.
-                # construct normal vector for first (source) plane
-                src_pln_ln_BA = src_pt_a - src_pt_b
-                src_pln_ln_BC = src_pt_c - src_pt_b
-                src_normal = src_pln_ln_BA.cross(src_pln_ln_BC)
-
-                # Take modifiers on the transformation item into account,
-                # in global (object) space
-                if addon_data.easy_apl_transform_settings.apl_flip_normal:
-                    src_normal.negate()
-
-                # construct normal vector for second (destination) plane
-                dest_pln_ln_BA = dest_pt_a - dest_pt_b
-                dest_pln_ln_BC = dest_pt_c - dest_pt_b
-                dest_normal = dest_pln_ln_BA.cross(dest_pln_ln_BC)
-
-                # find rotational difference between source and dest planes
-                rotational_diff = src_normal.rotation_difference(dest_normal)
-
-                # Set up edge alignment (BA plane1 to BA plane2)
-                new_lead_edge_orientation = src_pln_ln_BA.copy()
-                new_lead_edge_orientation.rotate(rotational_diff)
-                parallelize_edges = new_lead_edge_orientation.rotation_difference(
-                    dest_pln_ln_BA
+                transform = maplus_kernels.align_planes_matrix(
+                    (src_pt_a, src_pt_b, src_pt_c),
+                    (dest_pt_a, dest_pt_b, dest_pt_c),
+                    flip_normal=addon_data.easy_apl_transform_settings.apl_flip_normal
+                )
+                maplus_transforms.apply_transform(
+                    self,
+                    multi_edit_targets,
+                    transform,
+                    addon_data.easy_apl_transf_type
                 )
-
-                if addon_data.easy_apl_transf_type in {'OBJECT'}:
-                    for item in multi_edit_targets:
-                        # Get the object world matrix before we modify it here
-                        item_matrix_unaltered = item.matrix_world.copy()
-                        unaltered_inverse = item_matrix_unaltered.copy()
-                        unaltered_inverse.invert()
-
-                        # Try to rotate the object by the rotational_diff
-                        item.rotation_euler.rotate(
-                            rotational_diff
-                        )
-                        bpy.context.view_layer.update()
-
-                        # Parallelize the leading edges
-                        item.rotation_euler.rotate(
-                            parallelize_edges
-                        )
-                        bpy.context.view_layer.update()
-
-                        # get local coords using active object as basis, in
-                        # other words, determine coords of the source pivot
-                        # relative to the active object's origin by reversing
-                        # the active object's transf from the pivot's coords
-                        local_src_pivot_coords = (
-                            unaltered_inverse @ src_pt_b
-                        )
-
-                        # find the new global location of the pivot (we access
-                        # the item's matrix_world directly here since we
-                        # changed/updated it earlier)
-                        new_global_src_pivot_coords = (
-                            item.matrix_world @ local_src_pivot_coords
-                        )
-                        # figure out how to translate the object (the translation
-                        # vector) so that the source pivot sits on the destination
-                        # pivot's location
-                        # first vector is the global/absolute distance
-                        # between the two pivots
-                        pivot_to_dest = (
-                            dest_pt_b -
-                            new_global_src_pivot_coords
-                        )
-                        item.location = (
-                            item.location +
-                            pivot_to_dest
-                        )
-                        bpy.context.view_layer.update()
-
-                if addon_data.easy_apl_transf_type in {'WHOLE_MESH'}:
-
-                    self.report(
-                        {'WARNING'},
-                        ('Warning: mesh transforms'
-                         ' on objects with non-uniform scaling'
-                         ' are not currently supported.')
-                    )
-
-                    for item in multi_edit_targets:
-
-                        src_mesh = bmesh.new()
-                        src_mesh.from_mesh(item.data)
-
-                        item_matrix_unaltered_loc = item.matrix_world.copy()
-                        unaltered_inverse_loc = item_matrix_unaltered_loc.copy()
-                        unaltered_inverse_loc.invert()
-
-                        # Stored geom data in local coords
-                        src_a_loc = unaltered_inverse_loc @ src_pt_a
-                        src_b_loc = unaltered_inverse_loc @ src_pt_b
-                        src_c_loc = unaltered_inverse_loc @ src_pt_c
-
-                        dest_a_loc = unaltered_inverse_loc @ dest_pt_a
-                        dest_b_loc = unaltered_inverse_loc @ dest_pt_b
-                        dest_c_loc = unaltered_inverse_loc @ dest_pt_c
-
-                        src_ba_loc = src_a_loc - src_b_loc
-                        src_bc_loc = src_c_loc - src_b_loc
-                        src_normal_loc = src_ba_loc.cross(src_bc_loc)
-
-                        # Take modifiers on the transformation item into account,
-                        # in local (mesh) space
-                        if addon_data.easy_apl_transform_settings.apl_flip_normal:
-                            src_normal_loc.negate()
-
-                        dest_ba_loc = dest_a_loc - dest_b_loc
-                        dest_bc_loc = dest_c_loc - dest_b_loc
-                        dest_normal_loc = dest_ba_loc.cross(dest_bc_loc)
-
-                        # Get translation, move source pivot to local origin
-                        src_b_inv = src_b_loc.copy()
-                        src_b_inv.negate()
-                        src_pivot_to_loc_origin = mathutils.Matrix.Translation(
-                            src_b_inv
-                        )
-
-                        # Get rotational diff between planes
-                        loc_rot_diff = src_normal_loc.rotation_difference(
-                            dest_normal_loc
-                        )
-                        parallelize_planes_loc = loc_rot_diff.to_matrix()
-                        parallelize_planes_loc.resize_4x4()
-
-                        # Get edge alignment rotation (align leading plane edges)
-                        new_lead_edge_ornt_loc = (
-                            parallelize_planes_loc @ src_ba_loc
-                        )
-                        edge_align_loc = (
-                            new_lead_edge_ornt_loc.rotation_difference(
-                                dest_ba_loc
-                            )
-                        )
-                        parallelize_edges_loc = edge_align_loc.to_matrix()
-                        parallelize_edges_loc.resize_4x4()
-
-                        # Get translation, move pivot to destination
-                        pivot_to_dest_loc = mathutils.Matrix.Translation(
-                            dest_b_loc
-                        )
-
-                        mesh_coplanar = (
-                            pivot_to_dest_loc @
-                            parallelize_edges_loc @
-                            parallelize_planes_loc @
-                            src_pivot_to_loc_origin
-                        )
-
-                        src_mesh.transform(mesh_coplanar)
-
-                        bpy.ops.object.mode_set(mode='OBJECT')
-                        src_mesh.to_mesh(item.data)
 
                 # Clear stored source data once the transform is applied
                 addon_data.easy_apl_is_first_press = True
                 addon_data.easy_apl_designated_objects.clear()
 
-            # Go back to whatever mode we were in before doing this
-            bpy.ops.object.mode_set(mode=previous_mode)
-
         else:
             # The selected Blender objects are not compatible with the
             # requested transformation type (we can't apply a transform
@@ -1238,6 +860,11 @@ class MAPLUS_PT_QuickAlignPlanesGUI(bpy.types.Panel):
                         icon='OUTLINER_OB_MESH',
                         text="Grab Source"
                     )
+                    preserve_button_roundedge.operator(
+                        "maplus.quickalignplanesgrabfitsrc",
+                        icon='MESH_PLANE',
+                        text=""
+                    )
                 else:
                     apl_src_geom_top.operator(
                         "maplus.showhidequickaplsrcgeom",
@@ -1262,6 +889,11 @@ class MAPLUS_PT_QuickAlignPlanesGUI(bpy.types.Panel):
                         icon='VERTEXSEL',
                         text="Grab All Global"
                     )
+                    plane_grab_all.operator(
+                        "maplus.quickalignplanesgrabfitsrc",
+                        icon='MESH_PLANE',
+                        text="Best Fit"
+                    )
                     special_grabs = apl_src_geom_editor.row(align=True)
                     special_grabs.operator(
                         "maplus.copyfromaplsrc",
@@ -1273,6 +905,13 @@ class MAPLUS_PT_QuickAlignPlanesGUI(bpy.types.Panel):
                         icon='PASTEDOWN',
                         text="Paste (From Clipboard)"
                     )
+                    snap_coords = special_grabs.operator(
+                        "maplus.snapcoordstoverts",
+                        icon='SNAP_ON',
+                        text=""
+                    )
+                    snap_coords.target = 'APLSRC'
+                    snap_coords.item_kind = 'PLANE'
 
                     maplus_guitools.layout_coordvec(
                         parent_layout=apl_src_geom_editor,
@@ -1381,6 +1020,11 @@ class MAPLUS_PT_QuickAlignPlanesGUI(bpy.types.Panel):
                         icon='OUTLINER_OB_MESH',
                         text="Grab Destination"
                 )
+                preserve_button_roundedge.operator(
+                        "maplus.quickalignplanesgrabfitdest",
+                        icon='MESH_PLANE',
+                        text=""
+                )
             else:
                 apl_dest_geom_top.operator(
                         "maplus.showhidequickapldestgeom",
@@ -1405,6 +1049,11 @@ class MAPLUS_PT_QuickAlignPlanesGUI(bpy.types.Panel):
                     icon='VERTEXSEL',
                     text="Grab All Global"
                 )
+                plane_grab_all.operator(
+                    "maplus.quickalignplanesgrabfitdest",
+                    icon='MESH_PLANE',
+                    text="Best Fit"
+                )
                 special_grabs = apl_dest_geom_editor.row(align=True)
                 special_grabs.operator(
                     "maplus.copyfromapldest",
@@ -1416,6 +1065,13 @@ class MAPLUS_PT_QuickAlignPlanesGUI(bpy.types.Panel):
                     icon='PASTEDOWN',
                     text="Paste (From Clipboard)"
                 )
+                snap_coords = special_grabs.operator(
+                    "maplus.snapcoordstoverts",
+                    icon='SNAP_ON',
+                    text=""
+                )
+                snap_coords.target = 'APLDEST'
+                snap_coords.item_kind = 'PLANE'
 
                 maplus_guitools.layout_coordvec(
                     parent_layout=apl_dest_geom_editor,
@@ -1576,6 +1232,11 @@ class MAPLUS_PT_QuickAlignPlanesGUI(bpy.types.Panel):
                         icon='VERTEXSEL',
                         text="Grab All Global"
                     )
+                    plane_grab_all.operator(
+                        "maplus.quickalignplanessetoriginmodegrabfitdest",
+                        icon='MESH_PLANE',
+                        text="Best Fit"
+                    )
                     special_grabs = apl_set_origin_mode_dest_geom_editor.row(align=True)
                     special_grabs.operator(
                         "maplus.copyfromaplsetoriginmodedest",
@@ -1587,6 +1248,13 @@ class MAPLUS_PT_QuickAlignPlanesGUI(bpy.types.Panel):
                         icon='PASTEDOWN',
                         text="Paste (From Clipboard)"
                     )
+                    snap_coords = special_grabs.operator(
+                        "maplus.snapcoordstoverts",
+                        icon='SNAP_ON',
+                        text=""
+                    )
+                    snap_coords.target = 'APL_SET_ORIGIN_MODE_DEST'
+                    snap_coords.item_kind = 'PLANE'
 
                     maplus_guitools.layout_coordvec(
                         parent_layout=apl_set_origin_mode_dest_geom_editor,
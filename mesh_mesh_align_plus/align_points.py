@@ -1,13 +1,13 @@
 """Align Points tool, internals & UI."""
 
 
-import bmesh
 import bpy
-import mathutils
 
+from .utils import align_kernels as maplus_kernels
 from .utils import exceptions as maplus_except
 from .utils import geom as maplus_geom
 from .utils import gui_tools as maplus_guitools
+from .utils import transforms as maplus_transforms
 
 
 class MAPLUS_OT_AlignPointsBase(bpy.types.Operator):
@@ -16,11 +16,13 @@ class MAPLUS_OT_AlignPointsBase(bpy.types.Operator):
     bl_description = "Align points base class"
     bl_options = {'REGISTER', 'UNDO'}
     target = None
+    # Set by the compute operators, which only store the per-object
+    # results on the transformation item
+    compute_only = False
 
     def execute(self, context):
         addon_data = bpy.context.scene.maplus_data
         prims = addon_data.prim_list
-        previous_mode = maplus_geom.get_active_object().mode
         if not hasattr(self, "quick_op_target"):
             active_item = prims[addon_data.active_list_item]
         else:
@@ -75,21 +77,12 @@ class MAPLUS_OT_AlignPointsBase(bpy.types.Operator):
                     )
                     return {'CANCELLED'}
 
-            if maplus_geom.get_active_object().type == 'MESH':
-                # a bmesh can only be initialized in edit mode...todo/better way?
-                if previous_mode != 'EDIT':
-                    bpy.ops.object.editmode_toggle()
-                else:
-                    # else we could already be in edit mode with some stale
-                    # updates, exiting and reentering forces an update
-                    bpy.ops.object.editmode_toggle()
-                    bpy.ops.object.editmode_toggle()
-
             # Get global coordinate data for each geometry item, with
             # modifiers applied. Grab either directly from the scene data
             # (for quick ops), or from the MAPlus primitives
             # CollectionProperty on the scene data (for advanced tools)
             if hasattr(self, 'quick_op_target'):
+                src_item = addon_data.quick_align_pts_src
                 if addon_data.quick_align_pts_auto_grab_src:
                     vert_attribs_to_set = ('point',)
                     try:
@@ -108,14 +101,14 @@ class MAPLUS_OT_AlignPointsBase(bpy.types.Operator):
                         )
                         return {'CANCELLED'}
 
-                    maplus_geom.set_item_coords(
-                        addon_data.quick_align_pts_src,
-                        vert_attribs_to_set,
-                        vert_data
+                    src_item = maplus_geom.update_item(
+                        self,
+                        src_item,
+                        dict(zip(vert_attribs_to_set, vert_data))
                     )
 
                 src_global_data = maplus_geom.get_modified_global_coords(
-                    geometry=addon_data.quick_align_pts_src,
+                    geometry=src_item,
                     kind='POINT'
                 )
                 dest_global_data = maplus_geom.get_modified_global_coords(
@@ -139,84 +132,30 @@ class MAPLUS_OT_AlignPointsBase(bpy.types.Operator):
             src_pt = src_global_data[0]
             dest_pt = dest_global_data[0]
 
-            if self.target in {'OBJECT', 'OBJECT_ORIGIN'}:
-                for item in multi_edit_targets:
-                    align_points = dest_pt - src_pt
-
-                    # Take modifiers on the transformation item into account,
-                    # in global (object) space
-                    if active_item.apt_make_unit_vector:
-                        align_points.normalize()
-                    if active_item.apt_flip_direction:
-                        align_points.negate()
-                    align_points *= active_item.apt_multiplier
-
-                    item.location += align_points
-
-            if self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}:
-                for item in multi_edit_targets:
-                    self.report(
-                        {'WARNING'},
-                        ('Warning: mesh transforms'
-                         ' on objects with non-uniform scaling'
-                         ' are not currently supported.')
-                    )
-                    # Init source mesh
-                    src_mesh = bmesh.new()
-                    src_mesh.from_mesh(item.data)
-
-                    active_obj_transf = maplus_geom.get_active_object().matrix_world.copy()
-                    inverse_active = active_obj_transf.copy()
-                    inverse_active.invert()
-
-                    # Stored geom data in local coords
-                    src_pt_loc = inverse_active @ src_pt
-                    dest_pt_loc = inverse_active @ dest_pt
-
-                    # Get translation vector (in local space), src to dest
-                    align_points_vec = dest_pt_loc - src_pt_loc
-
-                    # Take modifiers on the transformation item into account,
-                    # in local (mesh) space
-                    if active_item.apt_make_unit_vector:
-                        # There are special considerations for this modifier
-                        # since we need to achieve a global length of
-                        # one, but can only transform it in local space
-                        # (NOTE: assumes only uniform scaling on the
-                        # active object)
-                        scaling_factor = 1.0 / item.scale[0]
-                        align_points_vec.normalize()
-                        align_points_vec *= scaling_factor
-                    if active_item.apt_flip_direction:
-                        align_points_vec.negate()
-                    align_points_vec *= active_item.apt_multiplier
-
-                    align_points_loc = mathutils.Matrix.Translation(
-                        align_points_vec
+            transform = maplus_kernels.align_points_matrix(
+                src_pt,
+                dest_pt,
+                make_unit=active_item.apt_make_unit_vector,
+                flip=active_item.apt_flip_direction,
+                multiplier=active_item.apt_multiplier
+            )
+            if self.compute_only:
+                maplus_transforms.store_transform_results(
+                    self,
+                    active_item,
+                    maplus_transforms.get_transform_results(
+                        multi_edit_targets,
+                        transform,
+                        self.target
                     )
-
-                    if self.target == 'MESH_SELECTED':
-                        src_mesh.transform(
-                            align_points_loc,
-                            filter={'SELECT'}
-                        )
-                    elif self.target == 'WHOLE_MESH':
-                        src_mesh.transform(align_points_loc)
-                    elif self.target == 'OBJECT_ORIGIN':
-                        # Note: a target of 'OBJECT_ORIGIN' is equivalent
-                        # to performing an object transf. + an inverse
-                        # whole mesh level transf. To the user,
-                        # the object appears to stay in the same place,
-                        # while only the object's origin moves.
-                        src_mesh.transform(align_points_loc.inverted())
-
-                    # write and then release the mesh data
-                    bpy.ops.object.mode_set(mode='OBJECT')
-                    src_mesh.to_mesh(item.data)
-                    src_mesh.free()
-
-            # Go back to whatever mode we were in before doing this
-            bpy.ops.object.mode_set(mode=previous_mode)
+                )
+            else:
+                maplus_transforms.apply_transform(
+                    self,
+                    multi_edit_targets,
+                    transform,
+                    self.target
+                )
 
         else:
             # The selected Blender objects are not compatible with the
@@ -304,6 +243,44 @@ class MAPLUS_OT_QuickAlignPointsWholeMesh(MAPLUS_OT_AlignPointsBase):
     quick_op_target = True
 
 
+class MAPLUS_OT_ComputeAlignPoints(MAPLUS_OT_AlignPointsBase):
+    bl_idname = "maplus.computealignpoints"
+    bl_label = "Compute Align Points"
+    bl_description = (
+        "Computes the align points transform of the active item for the"
+        " selected objects, and stores the per-object results on it"
+        " (computed_transforms) without changing anything"
+    )
+    # No undo step, nothing is changed
+    bl_options = {'REGISTER'}
+    compute_only = True
+    target: bpy.props.EnumProperty(
+        items=maplus_transforms.transform_target_items,
+        name="Target",
+        description="What the transform would be applied to",
+        default='OBJECT'
+    )
+
+
+class MAPLUS_OT_QuickComputeAlignPoints(MAPLUS_OT_AlignPointsBase):
+    bl_idname = "maplus.quickcomputealignpoints"
+    bl_label = "Quick Compute Align Points"
+    bl_description = (
+        "Computes the quick align points transform for the selected"
+        " objects, and stores the per-object results on the quick tool's"
+        " item (computed_transforms) without changing anything"
+    )
+    bl_options = {'REGISTER'}
+    compute_only = True
+    quick_op_target = True
+    target: bpy.props.EnumProperty(
+        items=maplus_transforms.transform_target_items,
+        name="Target",
+        description="What the transform would be applied to",
+        default='OBJECT'
+    )
+
+
 class MAPLUS_OT_ClearEasyAlignPoints(bpy.types.Operator):
     bl_idname = "maplus.cleareasyalignpoints"
     bl_label = "Reset Easy Align Points"
@@ -352,7 +329,6 @@ class MAPLUS_OT_EasyAlignPoints(bpy.types.Operator):
             - Reset to stage 1
         """
         addon_data = bpy.context.scene.maplus_data
-        previous_mode = maplus_geom.get_active_object().mode
         # Get valid objects from the target list
         valid_targets = [
             item
@@ -392,17 +368,6 @@ class MAPLUS_OT_EasyAlignPoints(bpy.types.Operator):
         if not (addon_data.easy_apt_transf_type in {'WHOLE_MESH'}
                 and [item for item in multi_edit_targets if item.type != 'MESH']):
 
-            # Make sure we're in edit mode with no stale data for proper vert-grabbing
-            if maplus_geom.get_active_object().type == 'MESH':
-                # a bmesh can only be initialized in edit mode...
-                if previous_mode != 'EDIT':
-                    bpy.ops.object.editmode_toggle()
-                else:
-                    # else we could already be in edit mode with some stale
-                    # updates, exiting and reentering forces an update
-                    bpy.ops.object.editmode_toggle()
-                    bpy.ops.object.editmode_toggle()
-
             # Stage one (first-press) behavior
             if addon_data.easy_apt_is_first_press:
 
@@ -438,9 +403,6 @@ class MAPLUS_OT_EasyAlignPoints(bpy.types.Operator):
                     vert_data
                 )
 
-                # Go back to whatever mode we were in before doing this
-                bpy.ops.object.mode_set(mode=previous_mode)
-
                 # Get/store the objects selected during the first press, these
                 # are used later during stage two, where the alignment will be run
                 # against all of these objects
@@ -510,79 +472,24 @@ class MAPLUS_OT_EasyAlignPoints(bpy.types.Operator):
                 src_pt = src_global_data[0]
                 dest_pt = dest_global_data[0]
 
-                if addon_data.easy_apt_transf_type in {'OBJECT'}:
-                    for item in multi_edit_targets:
-                        align_points = dest_pt - src_pt
-
-                        # Take modifiers on the transformation item into account,
-                        # in global (object) space
-                        if addon_data.easy_apt_transform_settings.apt_make_unit_vector:
-                            align_points.normalize()
-                        if addon_data.easy_apt_transform_settings.apt_flip_direction:
-                            align_points.negate()
-                        align_points *= addon_data.easy_apt_transform_settings.apt_multiplier
-
-                        item.location += align_points
-
-                if addon_data.easy_apt_transf_type in {'WHOLE_MESH'}:
-
-                    self.report(
-                        {'WARNING'},
-                        ('Warning: mesh transforms'
-                         ' on objects with non-uniform scaling'
-                         ' are not currently supported.')
-                    )
-
-                    for item in multi_edit_targets:
-
-                        # Init source mesh
-                        src_mesh = bmesh.new()
-                        src_mesh.from_mesh(item.data)
-
-                        active_obj_transf = maplus_geom.get_active_object().matrix_world.copy()
-                        inverse_active = active_obj_transf.copy()
-                        inverse_active.invert()
-
-                        # Stored geom data in local coords
-                        src_pt_loc = inverse_active @ src_pt
-                        dest_pt_loc = inverse_active @ dest_pt
-
-                        # Get translation vector (in local space), src to dest
-                        align_points_vec = dest_pt_loc - src_pt_loc
-
-                        # Take modifiers on the transformation item into account,
-                        # in local (mesh) space
-                        if addon_data.easy_apt_transform_settings.apt_make_unit_vector:
-                            # There are special considerations for this modifier
-                            # since we need to achieve a global length of
-                            # one, but can only transform it in local space
-                            # (NOTE: assumes only uniform scaling on the
-                            # active object)
-                            scaling_factor = 1.0 / item.scale[0]
-                            align_points_vec.normalize()
-                            align_points_vec *= scaling_factor
-                        if addon_data.easy_apt_transform_settings.apt_flip_direction:
-                            align_points_vec.negate()
-                        align_points_vec *= addon_data.easy_apt_transform_settings.apt_multiplier
-
-                        align_points_loc = mathutils.Matrix.Translation(
-                            align_points_vec
-                        )
-
-                        src_mesh.transform(align_points_loc)
-
-                        # write and then release the mesh data
-                        bpy.ops.object.mode_set(mode='OBJECT')
-                        src_mesh.to_mesh(item.data)
-                        src_mesh.free()
+                transform = maplus_kernels.align_points_matrix(
+                    src_pt,
+                    dest_pt,
+                    make_unit=addon_data.easy_apt_transform_settings.apt_make_unit_vector,
+                    flip=addon_data.easy_apt_transform_settings.apt_flip_direction,
+                    multiplier=addon_data.easy_apt_transform_settings.apt_multiplier
+                )
+                maplus_transforms.apply_transform(
+                    self,
+                    multi_edit_targets,
+                    transform,
+                    addon_data.easy_apt_transf_type
+                )
 
                 # Clear stored source data once the transform is applied
                 addon_data.easy_apt_is_first_press = True
                 addon_data.easy_apt_designated_objects.clear()
 
-            # Go back to whatever mode we were in before doing this
-            bpy.ops.object.mode_set(mode=previous_mode)
-
         else:
             # The selected Blender objects are not compatible with the
             # requested transformation type (we can't apply a transform
@@ -761,6 +668,11 @@ class MAPLUS_PT_QuickAlignPointsGUI(bpy.types.Panel):
                             icon='GROUP_VERTEX',
                             text=""
                     )
+                    preserve_button_roundedge.operator(
+                            "maplus.quickalignpointsgrabspherefitsrc",
+                            icon='MESH_UVSPHERE',
+                            text=""
+                    )
 
                 else:
                     apt_src_geom_top.operator(
@@ -786,6 +698,29 @@ class MAPLUS_PT_QuickAlignPointsGUI(bpy.types.Panel):
                         icon='VERTEXSEL',
                         text="Grab All Global"
                     )
+                    pt_grab_all.operator(
+                        "maplus.quickalignpointsgrabspherefitsrc",
+                        icon='MESH_UVSPHERE',
+                        text="Fit Sphere"
+                    )
+                    element_grabs = apt_src_geom_editor.row(align=True)
+                    element_grab = element_grabs.operator(
+                        "maplus.quickalignpointsgrabelementsrc",
+                        icon='EDGESEL',
+                        text="Edge Midpoint"
+                    )
+                    element_grab.element_mode = 'EDGE_MIDPOINT'
+                    element_grab = element_grabs.operator(
+                        "maplus.quickalignpointsgrabelementsrc",
+                        icon='FACESEL',
+                        text="Face Center"
+                    )
+                    element_grab.element_mode = 'FACE_CENTER'
+                    element_grabs.operator(
+                        "maplus.quickalignpointsgrabsurfacesrc",
+                        icon='SNAP_FACE',
+                        text="Surface Point"
+                    )
                     special_grabs = apt_src_geom_editor.row(align=True)
                     special_grabs.operator(
                         "maplus.copyfromaptsrc",
@@ -797,6 +732,13 @@ class MAPLUS_PT_QuickAlignPointsGUI(bpy.types.Panel):
                         icon='PASTEDOWN',
                         text="Paste (From Clipboard)"
                     )
+                    snap_coords = special_grabs.operator(
+                        "maplus.snapcoordstoverts",
+                        icon='SNAP_ON',
+                        text=""
+                    )
+                    snap_coords.target = 'APTSRC'
+                    snap_coords.item_kind = 'POINT'
 
                     modifier_header = apt_src_geom_editor.row()
                     modifier_header.label(text="Point Modifiers:")
@@ -866,6 +808,11 @@ class MAPLUS_PT_QuickAlignPointsGUI(bpy.types.Panel):
                         icon='GROUP_VERTEX',
                         text=""
                 )
+                preserve_button_roundedge.operator(
+                        "maplus.quickalignpointsgrabspherefitdest",
+                        icon='MESH_UVSPHERE',
+                        text=""
+                )
 
             else:
                 apt_dest_geom_top.operator(
@@ -891,6 +838,29 @@ class MAPLUS_PT_QuickAlignPointsGUI(bpy.types.Panel):
                     icon='VERTEXSEL',
                     text="Grab All Global"
                 )
+                pt_grab_all.operator(
+                    "maplus.quickalignpointsgrabspherefitdest",
+                    icon='MESH_UVSPHERE',
+                    text="Fit Sphere"
+                )
+                element_grabs = apt_dest_geom_editor.row(align=True)
+                element_grab = element_grabs.operator(
+                    "maplus.quickalignpointsgrabelementdest",
+                    icon='EDGESEL',
+                    text="Edge Midpoint"
+                )
+                element_grab.element_mode = 'EDGE_MIDPOINT'
+                element_grab = element_grabs.operator(
+                    "maplus.quickalignpointsgrabelementdest",
+                    icon='FACESEL',
+                    text="Face Center"
+                )
+                element_grab.element_mode = 'FACE_CENTER'
+                element_grabs.operator(
+                    "maplus.quickalignpointsgrabsurfacedest",
+                    icon='SNAP_FACE',
+                    text="Surface Point"
+                )
                 special_grabs = apt_dest_geom_editor.row(align=True)
                 special_grabs.operator(
                     "maplus.copyfromaptdest",
@@ -902,6 +872,13 @@ class MAPLUS_PT_QuickAlignPointsGUI(bpy.types.Panel):
                     icon='PASTEDOWN',
                     text="Paste (From Clipboard)"
                 )
+                snap_coords = special_grabs.operator(
+                    "maplus.snapcoordstoverts",
+                    icon='SNAP_ON',
+                    text=""
+                )
+                snap_coords.target = 'APTDEST'
+                snap_coords.item_kind = 'POINT'
 
                 modifier_header = apt_dest_geom_editor.row()
                 modifier_header.label(text="Point Modifiers:")
@@ -3,13 +3,13 @@
 
 import math
 
-import bmesh
 import bpy
-import mathutils
 
+from .utils import align_kernels as maplus_kernels
 from .utils import exceptions as maplus_except
 from .utils import geom as maplus_geom
 from .utils import gui_tools as maplus_guitools
+from .utils import transforms as maplus_transforms
 
 
 class MAPLUS_OT_AxisRotateBase(bpy.types.Operator):
@@ -18,11 +18,13 @@ class MAPLUS_OT_AxisRotateBase(bpy.types.Operator):
     bl_description = "Axis rotate base class"
     bl_options = {'REGISTER', 'UNDO'}
     target = None
+    # Set by the compute operators, which only store the per-object
+    # results on the transformation item
+    compute_only = False
 
     def execute(self, context):
         addon_data = bpy.context.scene.maplus_data
         prims = addon_data.prim_list
-        previous_mode = maplus_geom.get_active_object().mode
         if not hasattr(self, "quick_op_target"):
             active_item = prims[addon_data.active_list_item]
         else:
@@ -74,21 +76,12 @@ class MAPLUS_OT_AxisRotateBase(bpy.types.Operator):
                     )
                     return {'CANCELLED'}
 
-            if maplus_geom.get_active_object().type == 'MESH':
-                # a bmesh can only be initialized in edit mode...
-                if previous_mode != 'EDIT':
-                    bpy.ops.object.editmode_toggle()
-                else:
-                    # else we could already be in edit mode with some stale
-                    # updates, exiting and reentering forces an update
-                    bpy.ops.object.editmode_toggle()
-                    bpy.ops.object.editmode_toggle()
-
             # Get global coordinate data for each geometry item, with
             # modifiers applied. Grab either directly from the scene data
             # (for quick ops), or from the MAPlus primitives
             # CollectionProperty on the scene data (for advanced tools)
             if hasattr(self, 'quick_op_target'):
+                src_item = addon_data.quick_axis_rotate_src
                 if addon_data.quick_axis_rotate_auto_grab_src:
                     vert_attribs_to_set = ('line_start', 'line_end')
                     try:
@@ -107,14 +100,14 @@ class MAPLUS_OT_AxisRotateBase(bpy.types.Operator):
                         )
                         return {'CANCELLED'}
 
-                    maplus_geom.set_item_coords(
-                        addon_data.quick_axis_rotate_src,
-                        vert_attribs_to_set,
-                        vert_data
+                    src_item = maplus_geom.update_item(
+                        self,
+                        src_item,
+                        dict(zip(vert_attribs_to_set, vert_data))
                     )
 
                 src_global_data = maplus_geom.get_modified_global_coords(
-                    geometry=addon_data.quick_axis_rotate_src,
+                    geometry=src_item,
                     kind='LINE'
                 )
 
@@ -136,119 +129,28 @@ class MAPLUS_OT_AxisRotateBase(bpy.types.Operator):
             else:
                 converted_rot_amount = math.radians(active_item.axr_amount)
 
-            if self.target in {'OBJECT', 'OBJECT_ORIGIN'}:
-                for item in multi_edit_targets:
-                    # (Note that there are no transformation modifiers for this
-                    # transformation type, so that section is omitted here)
-
-                    # Get the object world matrix before we modify it here
-                    item_matrix_unaltered = item.matrix_world.copy()
-                    unaltered_inverse = item_matrix_unaltered.copy()
-                    unaltered_inverse.invert()
-
-                    # Construct the axis vector and corresponding matrix
-                    axis = axis_end - axis_start
-                    axis_rot = mathutils.Matrix.Rotation(
-                        converted_rot_amount,
-                        4,
-                        axis
-                    )
-
-                    # Perform the rotation (axis will be realigned later)
-                    item.rotation_euler.rotate(axis_rot)
-                    bpy.context.view_layer.update()
-
-                    # put the original line starting point (before the object
-                    # was rotated) into the local object space
-                    src_pivot_location_local = unaltered_inverse @ axis_start
-
-                    # Calculate the new pivot location (after the
-                    # first rotation), so that the axis can be moved
-                    # back into place
-                    new_pivot_loc_global = (
-                        item.matrix_world @
-                        src_pivot_location_local
-                    )
-                    pivot_to_dest = axis_start - new_pivot_loc_global
-
-                    item.location += pivot_to_dest
-                    bpy.context.view_layer.update()
-
-            if self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}:
-                for item in multi_edit_targets:
-                    self.report(
-                        {'WARNING'},
-                        ('Warning: mesh transforms'
-                         ' on objects with non-uniform scaling'
-                         ' are not currently supported.')
-                    )
-                    # (Note that there are no transformation modifiers for this
-                    # transformation type, so that section is omitted here)
-
-                    # Init source mesh
-                    src_mesh = bmesh.new()
-                    src_mesh.from_mesh(item.data)
-
-                    # Get the object world matrix
-                    item_matrix_unaltered_loc = item.matrix_world.copy()
-                    unaltered_inverse_loc = item_matrix_unaltered_loc.copy()
-                    unaltered_inverse_loc.invert()
-
-                    # Stored geom data in local coords
-                    axis_start_loc = unaltered_inverse_loc @ axis_start
-                    axis_end_loc = unaltered_inverse_loc @ axis_end
-
-                    # Get axis vector in local space
-                    axis_loc = axis_end_loc - axis_start_loc
-
-                    # Get translation, pivot to local origin
-                    axis_start_inv = axis_start_loc.copy()
-                    axis_start_inv.negate()
-                    src_pivot_to_loc_origin = mathutils.Matrix.Translation(
-                        axis_start_inv
-                    )
-                    src_pivot_to_loc_origin.resize_4x4()
-
-                    # Get local axis rotation
-                    axis_rot_at_loc_origin = mathutils.Matrix.Rotation(
-                        converted_rot_amount,
-                        4,
-                        axis_loc
-                    )
-
-                    # Get translation, pivot to dest
-                    pivot_to_dest = mathutils.Matrix.Translation(
-                        axis_start_loc
+            transform = maplus_kernels.axis_rotate_matrix(
+                axis_start,
+                axis_end,
+                converted_rot_amount
+            )
+            if self.compute_only:
+                maplus_transforms.store_transform_results(
+                    self,
+                    active_item,
+                    maplus_transforms.get_transform_results(
+                        multi_edit_targets,
+                        transform,
+                        self.target
                     )
-                    pivot_to_dest.resize_4x4()
-
-                    axis_rotate_loc = (
-                        pivot_to_dest @
-                        axis_rot_at_loc_origin @
-                        src_pivot_to_loc_origin
-                    )
-
-                    if self.target == 'MESH_SELECTED':
-                        src_mesh.transform(
-                            axis_rotate_loc,
-                            filter={'SELECT'}
-                        )
-                    elif self.target == 'WHOLE_MESH':
-                        src_mesh.transform(axis_rotate_loc)
-                    elif self.target == 'OBJECT_ORIGIN':
-                        # Note: a target of 'OBJECT_ORIGIN' is equivalent
-                        # to performing an object transf. + an inverse
-                        # whole mesh level transf. To the user,
-                        # the object appears to stay in the same place,
-                        # while only the object's origin moves.
-                        src_mesh.transform(axis_rotate_loc.inverted())
-
-                    bpy.ops.object.mode_set(mode='OBJECT')
-                    src_mesh.to_mesh(item.data)
-                    src_mesh.free()
-
-            # Go back to whatever mode we were in before doing this
-            bpy.ops.object.mode_set(mode=previous_mode)
+                )
+            else:
+                maplus_transforms.apply_transform(
+                    self,
+                    multi_edit_targets,
+                    transform,
+                    self.target
+                )
 
         else:
             # The selected Blender objects are not compatible with the
@@ -324,6 +226,44 @@ class MAPLUS_OT_QuickAxisRotateWholeMesh(MAPLUS_OT_AxisRotateBase):
     quick_op_target = True
 
 
+class MAPLUS_OT_ComputeAxisRotate(MAPLUS_OT_AxisRotateBase):
+    bl_idname = "maplus.computeaxisrotate"
+    bl_label = "Compute Axis Rotate"
+    bl_description = (
+        "Computes the axis rotate transform of the active item for the"
+        " selected objects, and stores the per-object results on it"
+        " (computed_transforms) without changing anything"
+    )
+    # No undo step, nothing is changed
+    bl_options = {'REGISTER'}
+    compute_only = True
+    target: bpy.props.EnumProperty(
+        items=maplus_transforms.transform_target_items,
+        name="Target",
+        description="What the transform would be applied to",
+        default='OBJECT'
+    )
+
+
+class MAPLUS_OT_QuickComputeAxisRotate(MAPLUS_OT_AxisRotateBase):
+    bl_idname = "maplus.quickcomputeaxisrotate"
+    bl_label = "Quick Compute Axis Rotate"
+    bl_description = (
+        "Computes the quick axis rotate transform for the selected"
+        " objects, and stores the per-object results on the quick tool's"
+        " item (computed_transforms) without changing anything"
+    )
+    bl_options = {'REGISTER'}
+    compute_only = True
+    quick_op_target = True
+    target: bpy.props.EnumProperty(
+        items=maplus_transforms.transform_target_items,
+        name="Target",
+        description="What the transform would be applied to",
+        default='OBJECT'
+    )
+
+
 class MAPLUS_OT_ClearEasyAxisRotate(bpy.types.Operator):
     bl_idname = "maplus.cleareasyaxisrotate"
     bl_label = "Reset Easy Axis Rotate"
@@ -502,7 +442,6 @@ class MAPLUS_OT_EasyAxisRotate(bpy.types.Operator):
     def execute(self, context):
         """Simplified operator, does geom grab and axis rotation together."""
         addon_data = bpy.context.scene.maplus_data
-        previous_mode = maplus_geom.get_active_object().mode
         selected = [
             item
             for item in bpy.context.scene.objects if maplus_geom.get_select_state(item)
@@ -540,17 +479,6 @@ class MAPLUS_OT_EasyAxisRotate(bpy.types.Operator):
         if not (addon_data.easy_axr_transf_type in {'WHOLE_MESH'}
                 and [item for item in multi_edit_targets if item.type != 'MESH']):
 
-            # Make sure we're in edit mode with no stale data for proper vert-grabbing
-            if maplus_geom.get_active_object().type == 'MESH':
-                # a bmesh can only be initialized in edit mode...
-                if previous_mode != 'EDIT':
-                    bpy.ops.object.editmode_toggle()
-                else:
-                    # else we could already be in edit mode with some stale
-                    # updates, exiting and reentering forces an update
-                    bpy.ops.object.editmode_toggle()
-                    bpy.ops.object.editmode_toggle()
-
             # Auto-grab the SOURCE key from selected verts on the active obj
             vert_attribs_to_set = (
                 'line_start',
@@ -598,109 +526,17 @@ class MAPLUS_OT_EasyAxisRotate(bpy.types.Operator):
             if addon_data.easy_axr_flip_dir:
                 converted_rot_amount *= -1
 
-            if addon_data.easy_axr_transf_type in {'OBJECT'}:
-                for item in multi_edit_targets:
-                    # (Note that there are no transformation modifiers for this
-                    # transformation type, so that section is omitted here)
-
-                    # Get the object world matrix before we modify it here
-                    item_matrix_unaltered = item.matrix_world.copy()
-                    unaltered_inverse = item_matrix_unaltered.copy()
-                    unaltered_inverse.invert()
-
-                    # Construct the axis vector and corresponding matrix
-                    axis = axis_end - axis_start
-                    axis_rot = mathutils.Matrix.Rotation(
-                        converted_rot_amount,
-                        4,
-                        axis
-                    )
-
-                    # Perform the rotation (axis will be realigned later)
-                    item.rotation_euler.rotate(axis_rot)
-                    bpy.context.view_layer.update()
-
-                    # put the original line starting point (before the object
-                    # was rotated) into the local object space
-                    src_pivot_location_local = unaltered_inverse @ axis_start
-
-                    # Calculate the new pivot location (after the
-                    # first rotation), so that the axis can be moved
-                    # back into place
-                    new_pivot_loc_global = (
-                            item.matrix_world @
-                            src_pivot_location_local
-                    )
-                    pivot_to_dest = axis_start - new_pivot_loc_global
-
-                    item.location += pivot_to_dest
-                    bpy.context.view_layer.update()
-
-            if addon_data.easy_axr_transf_type in {'WHOLE_MESH'}:
-
-                self.report(
-                    {'WARNING'},
-                    ('Warning: mesh transforms'
-                     ' on objects with non-uniform scaling'
-                     ' are not currently supported.')
-                )
-
-                for item in multi_edit_targets:
-
-                    # (Note that there are no transformation modifiers for this
-                    # transformation type, so that section is omitted here)
-
-                    # Init source mesh
-                    src_mesh = bmesh.new()
-                    src_mesh.from_mesh(item.data)
-
-                    # Get the object world matrix
-                    item_matrix_unaltered_loc = item.matrix_world.copy()
-                    unaltered_inverse_loc = item_matrix_unaltered_loc.copy()
-                    unaltered_inverse_loc.invert()
-
-                    # Stored geom data in local coords
-                    axis_start_loc = unaltered_inverse_loc @ axis_start
-                    axis_end_loc = unaltered_inverse_loc @ axis_end
-
-                    # Get axis vector in local space
-                    axis_loc = axis_end_loc - axis_start_loc
-
-                    # Get translation, pivot to local origin
-                    axis_start_inv = axis_start_loc.copy()
-                    axis_start_inv.negate()
-                    src_pivot_to_loc_origin = mathutils.Matrix.Translation(
-                        axis_start_inv
-                    )
-                    src_pivot_to_loc_origin.resize_4x4()
-
-                    # Get local axis rotation
-                    axis_rot_at_loc_origin = mathutils.Matrix.Rotation(
-                        converted_rot_amount,
-                        4,
-                        axis_loc
-                    )
-
-                    # Get translation, pivot to dest
-                    pivot_to_dest = mathutils.Matrix.Translation(
-                        axis_start_loc
-                    )
-                    pivot_to_dest.resize_4x4()
-
-                    axis_rotate_loc = (
-                            pivot_to_dest @
-                            axis_rot_at_loc_origin @
-                            src_pivot_to_loc_origin
-                    )
-
-                    src_mesh.transform(axis_rotate_loc)
-
-                    bpy.ops.object.mode_set(mode='OBJECT')
-                    src_mesh.to_mesh(item.data)
-                    src_mesh.free()
-
-            # Go back to whatever mode we were in before doing this
-            bpy.ops.object.mode_set(mode=previous_mode)
+            transform = maplus_kernels.axis_rotate_matrix(
+                axis_start,
+                axis_end,
+                converted_rot_amount
+            )
+            maplus_transforms.apply_transform(
+                self,
+                multi_edit_targets,
+                transform,
+                addon_data.easy_axr_transf_type
+            )
 
         else:
             # The selected Blender objects are not compatible with the
@@ -878,6 +714,16 @@ class MAPLUS_PT_QuickAxisRotateGUI(bpy.types.Panel):
                         icon='LIGHT_HEMI',
                         text=""
                     )
+                    preserve_button_roundedge.operator(
+                        "maplus.quickaxisrotategrabfitsrc",
+                        icon='IPO_LINEAR',
+                        text=""
+                    )
+                    preserve_button_roundedge.operator(
+                        "maplus.quickaxisrotategrabaxisfitsrc",
+                        icon='MESH_CYLINDER',
+                        text=""
+                    )
                 else:
                     axr_src_geom_top.operator(
                             "maplus.showhidequickaxrsrcgeom",
@@ -902,6 +748,34 @@ class MAPLUS_PT_QuickAxisRotateGUI(bpy.types.Panel):
                         icon='VERTEXSEL',
                         text="Grab All Global"
                     )
+                    ln_grab_all.operator(
+                        "maplus.quickaxisrotategrabfitsrc",
+                        icon='IPO_LINEAR',
+                        text="Best Fit"
+                    )
+                    ln_grab_all.operator(
+                        "maplus.quickaxisrotategrabaxisfitsrc",
+                        icon='MESH_CYLINDER',
+                        text="Fit Axis"
+                    )
+                    element_grabs = axr_src_geom_editor.row(align=True)
+                    element_grab = element_grabs.operator(
+                        "maplus.quickaxisrotategrabelementsrc",
+                        icon='EDGESEL',
+                        text="Edge Direction"
+                    )
+                    element_grab.element_mode = 'EDGE_DIRECTION'
+                    element_grab = element_grabs.operator(
+                        "maplus.quickaxisrotategrabelementsrc",
+                        icon='FACESEL',
+                        text="Face Centers"
+                    )
+                    element_grab.element_mode = 'FACE_CENTERS'
+                    element_grabs.operator(
+                        "maplus.quickaxisrotategrabsurfacesrc",
+                        icon='SNAP_FACE',
+                        text="Surface Normal"
+                    )
 
                     special_grabs = axr_src_geom_editor.row(align=True)
                     special_grabs.operator(
@@ -920,6 +794,13 @@ class MAPLUS_PT_QuickAxisRotateGUI(bpy.types.Panel):
                         icon='PASTEDOWN',
                         text="Paste (From Clipboard)"
                     )
+                    snap_coords = special_grabs_extra.operator(
+                        "maplus.snapcoordstoverts",
+                        icon='SNAP_ON',
+                        text=""
+                    )
+                    snap_coords.target = 'AXRSRC'
+                    snap_coords.item_kind = 'LINE'
 
                     modifier_header = axr_src_geom_editor.row()
                     modifier_header.label(text="Line Modifiers:")
@@ -0,0 +1,299 @@
+"""Batch Align tool (many transformations in one step), internals."""
+
+
+import collections
+
+import bpy
+import numpy as np
+
+from .utils import align_kernels as maplus_kernels
+from .utils import geom as maplus_geom
+from .utils import storage as maplus_storage
+from .utils import transforms as maplus_transforms
+
+
+# The transformation item attribs pointing to its source and dest items
+# (None for transformations that only have a source), and the kind of
+# geometry those items have to be
+batch_transf_attribs = {
+    'ALIGNPOINTS': ('apt_pt_one', 'apt_pt_two', 'POINT'),
+    'DIRECTIONALSLIDE': ('ds_direction', None, 'LINE'),
+    'SCALEMATCHEDGE': ('sme_edge_one', 'sme_edge_two', 'LINE'),
+    'ALIGNLINES': ('aln_src_line', 'aln_dest_line', 'LINE'),
+    'AXISROTATE': ('axr_axis', None, 'LINE'),
+    'ALIGNPLANES': ('apl_src_plane', 'apl_dest_plane', 'PLANE'),
+}
+
+
+def get_batch_matrices(transf_type, transf_items, src_coords, dest_coords):
+    """Compute the transforms of rows of one transformation type at once.
+
+    :param transf_type: The rows' transformation type (a transf_type value)
+    :param transf_items: The rows' transformation items (for the settings)
+    :param src_coords: The rows' global source coords, shape (N, k, 3)
+        for items with k coords (1 for points, 2 for lines, 3 for planes)
+    :param dest_coords: The rows' global dest coords (same shape), or None
+        for transformations without a dest
+    :returns: The global transforms, shape (N, 4, 4)
+    """
+    def get_settings(attrib):
+        return [getattr(item, attrib) for item in transf_items]
+
+    if transf_type == 'ALIGNPOINTS':
+        return maplus_kernels.align_points_matrices(
+            src_coords[:, 0],
+            dest_coords[:, 0],
+            make_unit=get_settings('apt_make_unit_vector'),
+            flip=get_settings('apt_flip_direction'),
+            multiplier=get_settings('apt_multiplier')
+        )
+    if transf_type == 'DIRECTIONALSLIDE':
+        return maplus_kernels.directional_slide_matrices(
+            src_coords[:, 0],
+            src_coords[:, 1],
+            make_unit=get_settings('ds_make_unit_vec'),
+            flip=get_settings('ds_flip_direction'),
+            multiplier=get_settings('ds_multiplier')
+        )
+    if transf_type == 'SCALEMATCHEDGE':
+        return maplus_kernels.scale_match_edge_matrices(
+            src_coords[:, 0],
+            src_coords[:, 1],
+            dest_coords[:, 0],
+            dest_coords[:, 1]
+        )
+    if transf_type == 'ALIGNLINES':
+        return maplus_kernels.align_lines_matrices(
+            src_coords[:, 0],
+            src_coords[:, 1],
+            dest_coords[:, 0],
+            dest_coords[:, 1],
+            flip=get_settings('aln_flip_direction')
+        )
+    if transf_type == 'AXISROTATE':
+        # Get rotation in proper units (radians)
+        angles = np.array(get_settings('axr_amount'))
+        if bpy.context.scene.unit_settings.system_rotation != 'RADIANS':
+            angles = np.radians(angles)
+        return maplus_kernels.axis_rotate_matrices(
+            src_coords[:, 0],
+            src_coords[:, 1],
+            angles
+        )
+    if transf_type == 'ALIGNPLANES':
+        # The alternate pivot swaps points A and B on both planes
+        alternate_pivot = np.array(get_settings('apl_alternate_pivot'))
+        src_coords = src_coords.copy()
+        dest_coords = dest_coords.copy()
+        src_coords[alternate_pivot] = src_coords[alternate_pivot][:, [1, 0, 2]]
+        dest_coords[alternate_pivot] = dest_coords[alternate_pivot][:, [1, 0, 2]]
+        return maplus_kernels.align_planes_matrices(
+            src_coords,
+            dest_coords,
+            flip_normal=get_settings('apl_flip_normal')
+        )
+    raise ValueError('Unsupported transformation type: ' + transf_type)
+
+
+# Meant for scripts, e.g. aligning two parts by their own transformation
+# items, with the source/dest lines of the second one overridden:
+#
+#     bpy.ops.maplus.batchalign(target='OBJECT', rows=[
+#         {'targets': [{'val_str': 'Bolt'}], 'transformation': 4},
+#         {'targets': [{'val_str': 'Nut'}, {'val_str': 'Washer'}],
+#          'transformation': 4, 'src': 7, 'dest': 8},
+#     ])
+class MAPLUS_OT_BatchAlign(bpy.types.Operator):
+    bl_idname = "maplus.batchalign"
+    bl_label = "Batch Align"
+    bl_description = (
+        "Applies many transformations in one step, each one to its own"
+        " set of objects (rows of target objects and transformation items)"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    rows: bpy.props.CollectionProperty(
+        type=maplus_storage.MAPlusBatchAlignRow
+    )
+    target: bpy.props.EnumProperty(
+        items=[
+            ('OBJECT', 'Object', 'Transform the target objects'),
+            ('OBJECT_ORIGIN',
+             'Object Origin',
+             "Move the target objects' origins only"),
+            ('MESH_SELECTED',
+             'Mesh Piece',
+             "Transform the target objects' selected verts"),
+            ('WHOLE_MESH', 'Whole Mesh', "Transform the target objects' meshes"),
+        ],
+        name="Target",
+        default='OBJECT',
+        description="What to apply the transformations to"
+    )
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        prims = addon_data.prim_list
+        scene_objects = bpy.context.scene.objects
+
+        if not self.rows:
+            self.report({'ERROR'}, 'Cannot complete: no rows to apply.')
+            return {'CANCELLED'}
+
+        # Gather the geometry of each row (grouped by transformation type,
+        # so each type's transforms can be computed in one go)
+        typed_rows = collections.defaultdict(list)
+        row_objects = []
+        row_mesh_data = {}
+        for row_index, row in enumerate(self.rows):
+            if not 0 <= row.transformation < len(prims):
+                self.report(
+                    {'ERROR'},
+                    'Row {0}: transformation index out of range.'.format(
+                        row_index
+                    )
+                )
+                return {'CANCELLED'}
+            transf_item = prims[row.transformation]
+            if (transf_item.kind != 'TRANSFORMATION'
+                    or transf_item.transf_type not in batch_transf_attribs):
+                self.report(
+                    {'ERROR'},
+                    ('Row {0}: "{1}" is not a transformation'
+                     ' (or its type is not set).').format(
+                        row_index,
+                        transf_item.name
+                    )
+                )
+                return {'CANCELLED'}
+            src_attrib, dest_attrib, kind = batch_transf_attribs[
+                transf_item.transf_type
+            ]
+
+            geometry = []
+            row_items = (
+                ('source', row.src, src_attrib),
+                ('destination', row.dest, dest_attrib)
+            )
+            for role, override, attrib in row_items:
+                if attrib is None:
+                    geometry.append(None)
+                    continue
+                item_index = override if override >= 0 else getattr(
+                    transf_item,
+                    attrib
+                )
+                coords = []
+                if 0 <= item_index < len(prims):
+                    coords = maplus_geom.get_modified_global_coords(
+                        geometry=prims[item_index],
+                        kind=kind
+                    )
+                if not coords:
+                    self.report(
+                        {'ERROR'},
+                        'Row {0}: the {1} item is not a {2}.'.format(
+                            row_index,
+                            role,
+                            kind.lower()
+                        )
+                    )
+                    return {'CANCELLED'}
+                geometry.append(coords)
+
+            if transf_item.transf_type == 'SCALEMATCHEDGE':
+                if any((coords[1] - coords[0]).length == 0
+                       for coords in geometry):
+                    self.report(
+                        {'ERROR'},
+                        ('Row {0}: Divide by zero error:'
+                         ' zero length edge encountered').format(row_index)
+                    )
+                    return {'CANCELLED'}
+
+            objects = []
+            for target_name in row.targets:
+                item = scene_objects.get(target_name.val_str)
+                if item is None:
+                    self.report(
+                        {'ERROR'},
+                        'Row {0}: no object named "{1}" in the scene.'.format(
+                            row_index,
+                            target_name.val_str
+                        )
+                    )
+                    return {'CANCELLED'}
+                if self.target != 'OBJECT':
+                    if item.type != 'MESH':
+                        self.report(
+                            {'ERROR'},
+                            ('Cannot complete: Cannot apply mesh-level'
+                             ' transformations to non-mesh object "{0}".').format(
+                                item.name
+                            )
+                        )
+                        return {'CANCELLED'}
+                    # A mesh can only be transformed by one row
+                    mesh_row = row_mesh_data.setdefault(
+                        item.data.session_uid,
+                        row_index
+                    )
+                    if mesh_row != row_index:
+                        self.report(
+                            {'ERROR'},
+                            ('Rows {0} and {1} both transform the mesh'
+                             ' data of "{2}".').format(
+                                mesh_row,
+                                row_index,
+                                item.name
+                            )
+                        )
+                        return {'CANCELLED'}
+                objects.append(item)
+            row_objects.append(objects)
+            typed_rows[transf_item.transf_type].append(
+                (row_index, transf_item, geometry)
+            )
+
+        all_objects = [item for objects in row_objects for item in objects]
+        if len(set(all_objects)) != len(all_objects):
+            self.report(
+                {'ERROR'},
+                'Cannot complete: an object is targeted more than once.'
+            )
+            return {'CANCELLED'}
+
+        # One batched kernel call per transformation type
+        row_matrices = np.empty((len(self.rows), 4, 4))
+        for transf_type, rows in typed_rows.items():
+            row_indices, transf_items, geometry = zip(*rows)
+            src_coords = np.array([coords[0] for coords in geometry])
+            dest_coords = (
+                np.array([coords[1] for coords in geometry])
+                if geometry[0][1] is not None else None
+            )
+            row_matrices[list(row_indices)] = get_batch_matrices(
+                transf_type,
+                transf_items,
+                src_coords,
+                dest_coords
+            )
+
+        maplus_transforms.apply_transform(
+            self,
+            all_objects,
+            [
+                row_matrices[row_index]
+                for row_index, objects in enumerate(row_objects)
+                for item in objects
+            ],
+            self.target
+        )
+        self.report(
+            {'INFO'},
+            'Applied {0} row(s) to {1} object(s)'.format(
+                len(self.rows),
+                len(all_objects)
+            )
+        )
+
+        return {'FINISHED'}
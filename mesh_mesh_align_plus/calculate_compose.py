@@ -1345,6 +1345,29 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='VERTEXSEL',
                     text="Grab All Global"
                 )
+                pt_grab_all.operator(
+                    "maplus.grabspherefitslot1",
+                    icon='MESH_UVSPHERE',
+                    text="Fit Sphere"
+                )
+                element_grabs = slot1_geom_editor.row(align=True)
+                element_grab = element_grabs.operator(
+                    "maplus.grabelementpointslot1",
+                    icon='EDGESEL',
+                    text="Edge Midpoint"
+                )
+                element_grab.element_mode = 'EDGE_MIDPOINT'
+                element_grab = element_grabs.operator(
+                    "maplus.grabelementpointslot1",
+                    icon='FACESEL',
+                    text="Face Center"
+                )
+                element_grab.element_mode = 'FACE_CENTER'
+                element_grabs.operator(
+                    "maplus.grabsurfacepointslot1",
+                    icon='SNAP_FACE',
+                    text="Surface Point"
+                )
                 special_grabs = slot1_geom_editor.row(align=True)
                 special_grabs.operator(
                     "maplus.copyfromslot1",
@@ -1356,6 +1379,12 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='PASTEDOWN',
                     text="Paste (From Clipboard)"
                 )
+                snap_coords = special_grabs.operator(
+                    "maplus.snapcoordstoverts",
+                    icon='SNAP_ON',
+                    text=""
+                )
+                snap_coords.target = 'SLOT1'
 
                 modifier_header = slot1_geom_editor.row()
                 modifier_header.label(text="Point Modifiers:")
@@ -1415,6 +1444,34 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='VERTEXSEL',
                     text="Grab All Global"
                 )
+                ln_grab_all.operator(
+                    "maplus.grablinefitslot1",
+                    icon='IPO_LINEAR',
+                    text="Best Fit"
+                )
+                ln_grab_all.operator(
+                    "maplus.grabaxisfitslot1",
+                    icon='MESH_CYLINDER',
+                    text="Fit Axis"
+                )
+                element_grabs = slot1_geom_editor.row(align=True)
+                element_grab = element_grabs.operator(
+                    "maplus.grabelementlineslot1",
+                    icon='EDGESEL',
+                    text="Edge Direction"
+                )
+                element_grab.element_mode = 'EDGE_DIRECTION'
+                element_grab = element_grabs.operator(
+                    "maplus.grabelementlineslot1",
+                    icon='FACESEL',
+                    text="Face Centers"
+                )
+                element_grab.element_mode = 'FACE_CENTERS'
+                element_grabs.operator(
+                    "maplus.grabsurfacenormalslot1",
+                    icon='SNAP_FACE',
+                    text="Surface Normal"
+                )
 
                 special_grabs = slot1_geom_editor.row(align=True)
                 special_grabs.operator(
@@ -1433,6 +1490,12 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='PASTEDOWN',
                     text="Paste (From Clipboard)"
                 )
+                snap_coords = special_grabs_extra.operator(
+                    "maplus.snapcoordstoverts",
+                    icon='SNAP_ON',
+                    text=""
+                )
+                snap_coords.target = 'SLOT1'
 
                 modifier_header = slot1_geom_editor.row()
                 modifier_header.label(text="Line Modifiers:")
@@ -1522,6 +1585,11 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='VERTEXSEL',
                     text="Grab All Global"
                 )
+                plane_grab_all.operator(
+                    "maplus.grabplanefitslot1",
+                    icon='MESH_PLANE',
+                    text="Best Fit"
+                )
                 special_grabs = slot1_geom_editor.row(align=True)
                 special_grabs.operator(
                     "maplus.copyfromslot1",
@@ -1533,6 +1601,12 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='PASTEDOWN',
                     text="Paste (From Clipboard)"
                 )
+                snap_coords = special_grabs.operator(
+                    "maplus.snapcoordstoverts",
+                    icon='SNAP_ON',
+                    text=""
+                )
+                snap_coords.target = 'SLOT1'
 
                 maplus_guitools.layout_coordvec(
                     parent_layout=slot1_geom_editor,
@@ -1671,6 +1745,29 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='VERTEXSEL',
                     text="Grab All Global"
                 )
+                pt_grab_all.operator(
+                    "maplus.grabspherefitslot2",
+                    icon='MESH_UVSPHERE',
+                    text="Fit Sphere"
+                )
+                element_grabs = slot2_geom_editor.row(align=True)
+                element_grab = element_grabs.operator(
+                    "maplus.grabelementpointslot2",
+                    icon='EDGESEL',
+                    text="Edge Midpoint"
+                )
+                element_grab.element_mode = 'EDGE_MIDPOINT'
+                element_grab = element_grabs.operator(
+                    "maplus.grabelementpointslot2",
+                    icon='FACESEL',
+                    text="Face Center"
+                )
+                element_grab.element_mode = 'FACE_CENTER'
+                element_grabs.operator(
+                    "maplus.grabsurfacepointslot2",
+                    icon='SNAP_FACE',
+                    text="Surface Point"
+                )
                 special_grabs = slot2_geom_editor.row(align=True)
                 special_grabs.operator(
                     "maplus.copyfromslot2",
@@ -1682,6 +1779,12 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='PASTEDOWN',
                     text="Paste (From Clipboard)"
                 )
+                snap_coords = special_grabs.operator(
+                    "maplus.snapcoordstoverts",
+                    icon='SNAP_ON',
+                    text=""
+                )
+                snap_coords.target = 'SLOT2'
 
                 modifier_header = slot2_geom_editor.row()
                 modifier_header.label(text="Point Modifiers:")
@@ -1740,6 +1843,34 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='VERTEXSEL',
                     text="Grab All Global"
                 )
+                ln_grab_all.operator(
+                    "maplus.grablinefitslot2",
+                    icon='IPO_LINEAR',
+                    text="Best Fit"
+                )
+                ln_grab_all.operator(
+                    "maplus.grabaxisfitslot2",
+                    icon='MESH_CYLINDER',
+                    text="Fit Axis"
+                )
+                element_grabs = slot2_geom_editor.row(align=True)
+                element_grab = element_grabs.operator(
+                    "maplus.grabelementlineslot2",
+                    icon='EDGESEL',
+                    text="Edge Direction"
+                )
+                element_grab.element_mode = 'EDGE_DIRECTION'
+                element_grab = element_grabs.operator(
+                    "maplus.grabelementlineslot2",
+                    icon='FACESEL',
+                    text="Face Centers"
+                )
+                element_grab.element_mode = 'FACE_CENTERS'
+                element_grabs.operator(
+                    "maplus.grabsurfacenormalslot2",
+                    icon='SNAP_FACE',
+                    text="Surface Normal"
+                )
 
                 special_grabs = slot2_geom_editor.row(align=True)
                 special_grabs.operator(
@@ -1758,6 +1889,12 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='PASTEDOWN',
                     text="Paste (From Clipboard)"
                 )
+                snap_coords = special_grabs_extra.operator(
+                    "maplus.snapcoordstoverts",
+                    icon='SNAP_ON',
+                    text=""
+                )
+                snap_coords.target = 'SLOT2'
 
                 modifier_header = slot2_geom_editor.row()
                 modifier_header.label(text="Line Modifiers:")
@@ -1846,6 +1983,11 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='VERTEXSEL',
                     text="Grab All Global"
                 )
+                plane_grab_all.operator(
+                    "maplus.grabplanefitslot2",
+                    icon='MESH_PLANE',
+                    text="Best Fit"
+                )
                 special_grabs = slot2_geom_editor.row(align=True)
                 special_grabs.operator(
                     "maplus.copyfromslot2",
@@ -1857,6 +1999,12 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='PASTEDOWN',
                     text="Paste (From Clipboard)"
                 )
+                snap_coords = special_grabs.operator(
+                    "maplus.snapcoordstoverts",
+                    icon='SNAP_ON',
+                    text=""
+                )
+                snap_coords.target = 'SLOT2'
 
                 maplus_guitools.layout_coordvec(
                     parent_layout=slot2_geom_editor,
@@ -2007,6 +2155,29 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='VERTEXSEL',
                     text="Grab All Global"
                 )
+                pt_grab_all.operator(
+                    "maplus.grabspherefitcalcresult",
+                    icon='MESH_UVSPHERE',
+                    text="Fit Sphere"
+                )
+                element_grabs = calcresult_geom_editor.row(align=True)
+                element_grab = element_grabs.operator(
+                    "maplus.grabelementpointcalcresult",
+                    icon='EDGESEL',
+                    text="Edge Midpoint"
+                )
+                element_grab.element_mode = 'EDGE_MIDPOINT'
+                element_grab = element_grabs.operator(
+                    "maplus.grabelementpointcalcresult",
+                    icon='FACESEL',
+                    text="Face Center"
+                )
+                element_grab.element_mode = 'FACE_CENTER'
+                element_grabs.operator(
+                    "maplus.grabsurfacepointcalcresult",
+                    icon='SNAP_FACE',
+                    text="Surface Point"
+                )
                 special_grabs = calcresult_geom_editor.row(align=True)
                 special_grabs.operator(
                     "maplus.copyfromcalcresult",
@@ -2018,6 +2189,12 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='PASTEDOWN',
                     text="Paste (From Clipboard)"
                 )
+                snap_coords = special_grabs.operator(
+                    "maplus.snapcoordstoverts",
+                    icon='SNAP_ON',
+                    text=""
+                )
+                snap_coords.target = 'CALCRESULT'
 
                 modifier_header = calcresult_geom_editor.row()
                 modifier_header.label(text="Point Modifiers:")
@@ -2076,6 +2253,34 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='VERTEXSEL',
                     text="Grab All Global"
                 )
+                ln_grab_all.operator(
+                    "maplus.grablinefitcalcresult",
+                    icon='IPO_LINEAR',
+                    text="Best Fit"
+                )
+                ln_grab_all.operator(
+                    "maplus.grabaxisfitcalcresult",
+                    icon='MESH_CYLINDER',
+                    text="Fit Axis"
+                )
+                element_grabs = calcresult_geom_editor.row(align=True)
+                element_grab = element_grabs.operator(
+                    "maplus.grabelementlinecalcresult",
+                    icon='EDGESEL',
+                    text="Edge Direction"
+                )
+                element_grab.element_mode = 'EDGE_DIRECTION'
+                element_grab = element_grabs.operator(
+                    "maplus.grabelementlinecalcresult",
+                    icon='FACESEL',
+                    text="Face Centers"
+                )
+                element_grab.element_mode = 'FACE_CENTERS'
+                element_grabs.operator(
+                    "maplus.grabsurfacenormalcalcresult",
+                    icon='SNAP_FACE',
+                    text="Surface Normal"
+                )
 
                 special_grabs = calcresult_geom_editor.row(align=True)
                 special_grabs.operator(
@@ -2094,6 +2299,12 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='PASTEDOWN',
                     text="Paste (From Clipboard)"
                 )
+                snap_coords = special_grabs_extra.operator(
+                    "maplus.snapcoordstoverts",
+                    icon='SNAP_ON',
+                    text=""
+                )
+                snap_coords.target = 'CALCRESULT'
 
                 modifier_header = calcresult_geom_editor.row()
                 modifier_header.label(text="Line Modifiers:")
@@ -2182,6 +2393,11 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='VERTEXSEL',
                     text="Grab All Global"
                 )
+                plane_grab_all.operator(
+                    "maplus.grabplanefitcalcresult",
+                    icon='MESH_PLANE',
+                    text="Best Fit"
+                )
                 special_grabs = calcresult_geom_editor.row(align=True)
                 special_grabs.operator(
                     "maplus.copyfromcalcresult",
@@ -2193,6 +2409,12 @@ class MAPLUS_PT_CalculateAndComposeGUI(bpy.types.Panel):
                     icon='PASTEDOWN',
                     text="Paste (From Clipboard)"
                 )
+                snap_coords = special_grabs.operator(
+                    "maplus.snapcoordstoverts",
+                    icon='SNAP_ON',
+                    text=""
+                )
+                snap_coords.target = 'CALCRESULT'
 
                 maplus_guitools.layout_coordvec(
                     parent_layout=calcresult_geom_editor,
@@ -1,13 +1,13 @@
 """Directional Slide tool, internals & UI."""
 
 
-import bmesh
 import bpy
-import mathutils
 
+from .utils import align_kernels as maplus_kernels
 from .utils import exceptions as maplus_except
 from .utils import geom as maplus_geom
 from .utils import gui_tools as maplus_guitools
+from .utils import transforms as maplus_transforms
 
 
 class MAPLUS_OT_DirectionalSlideBase(bpy.types.Operator):
@@ -15,11 +15,13 @@ class MAPLUS_OT_DirectionalSlideBase(bpy.types.Operator):
     bl_label = "Directional Slide Base"
     bl_description = "Directional slide base class"
     bl_options = {'REGISTER', 'UNDO'}
+    # Set by the compute operators, which only store the per-object
+    # results on the transformation item
+    compute_only = False
 
     def execute(self, context):
         addon_data = bpy.context.scene.maplus_data
         prims = addon_data.prim_list
-        previous_mode = maplus_geom.get_active_object().mode
         if not hasattr(self, "quick_op_target"):
             active_item = prims[addon_data.active_list_item]
         else:
@@ -71,21 +73,12 @@ class MAPLUS_OT_DirectionalSlideBase(bpy.types.Operator):
                     )
                     return {'CANCELLED'}
 
-            if maplus_geom.get_active_object().type == 'MESH':
-                # a bmesh can only be initialized in edit mode...
-                if previous_mode != 'EDIT':
-                    bpy.ops.object.editmode_toggle()
-                else:
-                    # else we could already be in edit mode with some stale
-                    # updates, exiting and reentering forces an update
-                    bpy.ops.object.editmode_toggle()
-                    bpy.ops.object.editmode_toggle()
-
             # Get global coordinate data for each geometry item, with
             # modifiers applied. Grab either directly from the scene data
             # (for quick ops), or from the MAPlus primitives
             # CollectionProperty on the scene data (for advanced tools)
             if hasattr(self, 'quick_op_target'):
+                src_item = addon_data.quick_directional_slide_src
                 if addon_data.quick_directional_slide_auto_grab_src:
                     vert_attribs_to_set = ('line_start', 'line_end')
                     try:
@@ -104,14 +97,14 @@ class MAPLUS_OT_DirectionalSlideBase(bpy.types.Operator):
                         )
                         return {'CANCELLED'}
 
-                    maplus_geom.set_item_coords(
-                        addon_data.quick_directional_slide_src,
-                        vert_attribs_to_set,
-                        vert_data
+                    src_item = maplus_geom.update_item(
+                        self,
+                        src_item,
+                        dict(zip(vert_attribs_to_set, vert_data))
                     )
 
                 src_global_data = maplus_geom.get_modified_global_coords(
-                    geometry=addon_data.quick_directional_slide_src,
+                    geometry=src_item,
                     kind='LINE'
                 )
 
@@ -127,84 +120,30 @@ class MAPLUS_OT_DirectionalSlideBase(bpy.types.Operator):
             dir_start = src_global_data[0]
             dir_end = src_global_data[1]
 
-            if self.target in {'OBJECT', 'OBJECT_ORIGIN'}:
-                for item in multi_edit_targets:
-                    # Make the vector specifying the direction and
-                    # magnitude to slide in
-                    direction = dir_end - dir_start
-
-                    # Take modifiers on the transformation item into account,
-                    # in global (object) space
-                    if active_item.ds_make_unit_vec:
-                        direction.normalize()
-                    if active_item.ds_flip_direction:
-                        direction.negate()
-                    direction *= active_item.ds_multiplier
-
-                    item.location += direction
-
-            if self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}:
-                for item in multi_edit_targets:
-                    self.report(
-                        {'WARNING'},
-                        ('Warning: mesh transforms'
-                         ' on objects with non-uniform scaling'
-                         ' are not currently supported.')
+            transform = maplus_kernels.directional_slide_matrix(
+                dir_start,
+                dir_end,
+                make_unit=active_item.ds_make_unit_vec,
+                flip=active_item.ds_flip_direction,
+                multiplier=active_item.ds_multiplier
+            )
+            if self.compute_only:
+                maplus_transforms.store_transform_results(
+                    self,
+                    active_item,
+                    maplus_transforms.get_transform_results(
+                        multi_edit_targets,
+                        transform,
+                        self.target
                     )
-                    # Init source mesh
-                    src_mesh = bmesh.new()
-                    src_mesh.from_mesh(item.data)
-
-                    # Get the object world matrix
-                    item_matrix_unaltered_loc = item.matrix_world.copy()
-                    unaltered_inverse_loc = item_matrix_unaltered_loc.copy()
-                    unaltered_inverse_loc.invert()
-
-                    # Stored geom data in local coords
-                    dir_start_loc = unaltered_inverse_loc @ dir_start
-                    dir_end_loc = unaltered_inverse_loc @ dir_end
-
-                    # Get translation vector in local space
-                    direction_loc = dir_end_loc - dir_start_loc
-
-                    # Take modifiers on the transformation item into account,
-                    # in local (mesh) space
-                    if active_item.ds_make_unit_vec:
-                        # There are special considerations for this modifier
-                        # since we need to achieve a global length of
-                        # one, but can only transform it in local space
-                        # (NOTE: assumes only uniform scaling on the
-                        # active object)
-                        scaling_factor = 1.0 / item.scale[0]
-                        direction_loc.normalize()
-                        direction_loc *= scaling_factor
-                    if active_item.ds_flip_direction:
-                        direction_loc.negate()
-                    direction_loc *= active_item.ds_multiplier
-                    dir_slide = mathutils.Matrix.Translation(direction_loc)
-
-                    if self.target == 'MESH_SELECTED':
-                        src_mesh.transform(
-                            dir_slide,
-                            filter={'SELECT'}
-                        )
-                    elif self.target == 'WHOLE_MESH':
-                        src_mesh.transform(dir_slide)
-                    elif self.target == 'OBJECT_ORIGIN':
-                        # Note: a target of 'OBJECT_ORIGIN' is equivalent
-                        # to performing an object transf. + an inverse
-                        # whole mesh level transf. To the user,
-                        # the object appears to stay in the same place,
-                        # while only the object's origin moves.
-                        src_mesh.transform(dir_slide.inverted())
-
-                    # write and then release the mesh data
-                    bpy.ops.object.mode_set(mode='OBJECT')
-                    src_mesh.to_mesh(item.data)
-                    src_mesh.free()
-
-            # Go back to whatever mode we were in before doing this
-            bpy.ops.object.mode_set(mode=previous_mode)
+                )
+            else:
+                maplus_transforms.apply_transform(
+                    self,
+                    multi_edit_targets,
+                    transform,
+                    self.target
+                )
 
         else:
             # The selected Blender objects are not compatible with the
@@ -282,6 +221,44 @@ class MAPLUS_OT_QuickDirectionalSlideWholeMesh(MAPLUS_OT_DirectionalSlideBase):
     quick_op_target = True
 
 
+class MAPLUS_OT_ComputeDirectionalSlide(MAPLUS_OT_DirectionalSlideBase):
+    bl_idname = "maplus.computedirectionalslide"
+    bl_label = "Compute Directional Slide"
+    bl_description = (
+        "Computes the directional slide transform of the active item for the"
+        " selected objects, and stores the per-object results on it"
+        " (computed_transforms) without changing anything"
+    )
+    # No undo step, nothing is changed
+    bl_options = {'REGISTER'}
+    compute_only = True
+    target: bpy.props.EnumProperty(
+        items=maplus_transforms.transform_target_items,
+        name="Target",
+        description="What the transform would be applied to",
+        default='OBJECT'
+    )
+
+
+class MAPLUS_OT_QuickComputeDirectionalSlide(MAPLUS_OT_DirectionalSlideBase):
+    bl_idname = "maplus.quickcomputedirectionalslide"
+    bl_label = "Quick Compute Directional Slide"
+    bl_description = (
+        "Computes the quick directional slide transform for the selected"
+        " objects, and stores the per-object results on the quick tool's"
+        " item (computed_transforms) without changing anything"
+    )
+    bl_options = {'REGISTER'}
+    compute_only = True
+    quick_op_target = True
+    target: bpy.props.EnumProperty(
+        items=maplus_transforms.transform_target_items,
+        name="Target",
+        description="What the transform would be applied to",
+        default='OBJECT'
+    )
+
+
 class MAPLUS_OT_EasyDirectionalSlide(bpy.types.Operator):
     bl_idname = "maplus.easydirectionalslide"
     bl_label = "Easy Directional Slide"
@@ -293,7 +270,6 @@ class MAPLUS_OT_EasyDirectionalSlide(bpy.types.Operator):
     def execute(self, context):
         """Simplified operator, does geom grab and translate operation together."""
         addon_data = bpy.context.scene.maplus_data
-        previous_mode = maplus_geom.get_active_object().mode
         selected = [
             item
             for item in bpy.context.scene.objects if maplus_geom.get_select_state(item)
@@ -331,17 +307,6 @@ class MAPLUS_OT_EasyDirectionalSlide(bpy.types.Operator):
         if not (addon_data.easy_ds_transf_type in {'WHOLE_MESH'}
                 and [item for item in multi_edit_targets if item.type != 'MESH']):
 
-            # Make sure we're in edit mode with no stale data for proper vert-grabbing
-            if maplus_geom.get_active_object().type == 'MESH':
-                # a bmesh can only be initialized in edit mode...
-                if previous_mode != 'EDIT':
-                    bpy.ops.object.editmode_toggle()
-                else:
-                    # else we could already be in edit mode with some stale
-                    # updates, exiting and reentering forces an update
-                    bpy.ops.object.editmode_toggle()
-                    bpy.ops.object.editmode_toggle()
-
             # Auto-grab the SOURCE key from selected verts on the active obj
             vert_attribs_to_set = (
                 'line_start',
@@ -370,9 +335,6 @@ class MAPLUS_OT_EasyDirectionalSlide(bpy.types.Operator):
                 vert_data
             )
 
-            # Go back to whatever mode we were in before doing this
-            bpy.ops.object.mode_set(mode=previous_mode)
-
             src_global_data = maplus_geom.get_modified_global_coords(
                 geometry=addon_data.easy_directional_slide_src,
                 kind='LINE'
@@ -384,74 +346,19 @@ class MAPLUS_OT_EasyDirectionalSlide(bpy.types.Operator):
             dir_start = src_global_data[0]
             dir_end = src_global_data[1]
 
-            if addon_data.easy_ds_transf_type in {'OBJECT'}:
-                for item in multi_edit_targets:
-                    # Make the vector specifying the direction and
-                    # magnitude to slide in
-                    direction = dir_end - dir_start
-
-                    # Take modifiers on the transformation item into account,
-                    # in global (object) space
-                    if addon_data.easy_ds_transform_settings.ds_make_unit_vec:
-                        direction.normalize()
-                    if addon_data.easy_ds_transform_settings.ds_flip_direction:
-                        direction.negate()
-                    direction *= addon_data.easy_ds_transform_settings.ds_multiplier
-
-                    item.location += direction
-
-            if addon_data.easy_ds_transf_type in {'WHOLE_MESH'}:
-
-                self.report(
-                    {'WARNING'},
-                    ('Warning: mesh transforms'
-                     ' on objects with non-uniform scaling'
-                     ' are not currently supported.')
-                )
-
-                for item in multi_edit_targets:
-
-                    # Init source mesh
-                    src_mesh = bmesh.new()
-                    src_mesh.from_mesh(item.data)
-
-                    # Get the object world matrix
-                    item_matrix_unaltered_loc = item.matrix_world.copy()
-                    unaltered_inverse_loc = item_matrix_unaltered_loc.copy()
-                    unaltered_inverse_loc.invert()
-
-                    # Stored geom data in local coords
-                    dir_start_loc = unaltered_inverse_loc @ dir_start
-                    dir_end_loc = unaltered_inverse_loc @ dir_end
-
-                    # Get translation vector in local space
-                    direction_loc = dir_end_loc - dir_start_loc
-
-                    # Take modifiers on the transformation item into account,
-                    # in local (mesh) space
-                    if addon_data.easy_ds_transform_settings.ds_make_unit_vec:
-                        # There are special considerations for this modifier
-                        # since we need to achieve a global length of
-                        # one, but can only transform it in local space
-                        # (NOTE: assumes only uniform scaling on the
-                        # active object)
-                        scaling_factor = 1.0 / item.scale[0]
-                        direction_loc.normalize()
-                        direction_loc *= scaling_factor
-                    if addon_data.easy_ds_transform_settings.ds_flip_direction:
-                        direction_loc.negate()
-                    direction_loc *= addon_data.easy_ds_transform_settings.ds_multiplier
-                    dir_slide = mathutils.Matrix.Translation(direction_loc)
-
-                    src_mesh.transform(dir_slide)
-
-                    # write and then release the mesh data
-                    bpy.ops.object.mode_set(mode='OBJECT')
-                    src_mesh.to_mesh(item.data)
-                    src_mesh.free()
-
-            # Go back to whatever mode we were in before doing this
-            bpy.ops.object.mode_set(mode=previous_mode)
+            transform = maplus_kernels.directional_slide_matrix(
+                dir_start,
+                dir_end,
+                make_unit=addon_data.easy_ds_transform_settings.ds_make_unit_vec,
+                flip=addon_data.easy_ds_transform_settings.ds_flip_direction,
+                multiplier=addon_data.easy_ds_transform_settings.ds_multiplier
+            )
+            maplus_transforms.apply_transform(
+                self,
+                multi_edit_targets,
+                transform,
+                addon_data.easy_ds_transf_type
+            )
 
         else:
             # The selected Blender objects are not compatible with the
@@ -615,6 +522,11 @@ class MAPLUS_PT_QuickDirectionalSlideGUI(bpy.types.Panel):
                         icon='LIGHT_HEMI',
                         text=""
                     )
+                    preserve_button_roundedge.operator(
+                        "maplus.quickdirectionalslidegrabfitsrc",
+                        icon='IPO_LINEAR',
+                        text=""
+                    )
 
                 else:
                     ds_src_geom_top.operator(
@@ -640,6 +552,29 @@ class MAPLUS_PT_QuickDirectionalSlideGUI(bpy.types.Panel):
                         icon='VERTEXSEL',
                         text="Grab All Global"
                     )
+                    ln_grab_all.operator(
+                        "maplus.quickdirectionalslidegrabfitsrc",
+                        icon='IPO_LINEAR',
+                        text="Best Fit"
+                    )
+                    element_grabs = ds_src_geom_editor.row(align=True)
+                    element_grab = element_grabs.operator(
+                        "maplus.quickdirectionalslidegrabelementsrc",
+                        icon='EDGESEL',
+                        text="Edge Direction"
+                    )
+                    element_grab.element_mode = 'EDGE_DIRECTION'
+                    element_grab = element_grabs.operator(
+                        "maplus.quickdirectionalslidegrabelementsrc",
+                        icon='FACESEL',
+                        text="Face Centers"
+                    )
+                    element_grab.element_mode = 'FACE_CENTERS'
+                    element_grabs.operator(
+                        "maplus.quickdirectionalslidegrabsurfacesrc",
+                        icon='SNAP_FACE',
+                        text="Surface Normal"
+                    )
                     special_grabs = ds_src_geom_editor.row(align=True)
                     special_grabs.operator(
                         "maplus.quickdsgrabnormalsrc",
@@ -657,6 +592,13 @@ class MAPLUS_PT_QuickDirectionalSlideGUI(bpy.types.Panel):
                         icon='PASTEDOWN',
                         text="Paste (From Clipboard)"
                     )
+                    snap_coords = special_grabs_extra.operator(
+                        "maplus.snapcoordstoverts",
+                        icon='SNAP_ON',
+                        text=""
+                    )
+                    snap_coords.target = 'DSSRC'
+                    snap_coords.item_kind = 'LINE'
 
                     modifier_header = ds_src_geom_editor.row()
                     modifier_header.label(text="Line Modifiers:")
@@ -1,13 +1,13 @@
 """Scale Match Edge tool, internals & UI."""
 
 
-import bmesh
 import bpy
-import mathutils
 
+from .utils import align_kernels as maplus_kernels
 from .utils import exceptions as maplus_except
 from .utils import geom as maplus_geom
 from .utils import gui_tools as maplus_guitools
+from .utils import transforms as maplus_transforms
 
 
 class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
@@ -16,11 +16,13 @@ class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
     bl_description = "Scale match edge base class"
     bl_options = {'REGISTER', 'UNDO'}
     target = None
+    # Set by the compute operators, which only store the per-object
+    # results on the transformation item
+    compute_only = False
 
     def execute(self, context):
         addon_data = bpy.context.scene.maplus_data
         prims = addon_data.prim_list
-        previous_mode = maplus_geom.get_active_object().mode
         if hasattr(self, "quick_op_target"):
             active_item = addon_data.quick_scale_match_edge_transf
         else:
@@ -73,16 +75,6 @@ class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
                     )
                     return {'CANCELLED'}
 
-            if maplus_geom.get_active_object().type == 'MESH':
-                # a bmesh can only be initialized in edit mode...
-                if previous_mode != 'EDIT':
-                    bpy.ops.object.editmode_toggle()
-                else:
-                    # else we could already be in edit mode with some stale
-                    # updates, exiting and reentering forces an update
-                    bpy.ops.object.editmode_toggle()
-                    bpy.ops.object.editmode_toggle()
-
             # Get global coordinate data for each geometry item, with
             # applicable modifiers applied. Grab either (A) directly from
             # the scene data (for quick ops), (B) from the MAPlus primitives
@@ -91,6 +83,8 @@ class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
             if hasattr(self, "quick_op_target"):
                 # Numeric mode is part of this op's quick tools
                 if addon_data.quick_sme_numeric_mode:
+                    src_item = addon_data.quick_sme_numeric_src
+                    dest_item = addon_data.quick_sme_numeric_dest
                     if addon_data.quick_sme_numeric_auto:
                         vert_attribs_to_set = ('line_start', 'line_end')
                         try:
@@ -113,35 +107,40 @@ class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
                             )
                             return {'CANCELLED'}
 
-                        maplus_geom.set_item_coords(
-                            addon_data.quick_sme_numeric_src,
-                            vert_attribs_to_set,
-                            vert_data
+                        src_item = maplus_geom.update_item(
+                            self,
+                            src_item,
+                            dict(zip(vert_attribs_to_set, vert_data))
                         )
-                        maplus_geom.set_item_coords(
-                            addon_data.quick_sme_numeric_dest,
-                            vert_attribs_to_set,
-                            vert_data
+                        dest_item = maplus_geom.update_item(
+                            self,
+                            dest_item,
+                            dict(zip(vert_attribs_to_set, vert_data))
                         )
 
-                    addon_data.quick_sme_numeric_dest.ln_make_unit_vec = (
-                        True
-                    )
-                    addon_data.quick_sme_numeric_dest.ln_multiplier = (
-                        addon_data.quick_sme_numeric_length
+                    dest_item = maplus_geom.update_item(
+                        self,
+                        dest_item,
+                        {
+                            'ln_make_unit_vec': True,
+                            'ln_multiplier': (
+                                addon_data.quick_sme_numeric_length
+                            )
+                        }
                     )
 
                     src_global_data = maplus_geom.get_modified_global_coords(
-                        geometry=addon_data.quick_sme_numeric_src,
+                        geometry=src_item,
                         kind='LINE'
                     )
                     dest_global_data = maplus_geom.get_modified_global_coords(
-                        geometry=addon_data.quick_sme_numeric_dest,
+                        geometry=dest_item,
                         kind='LINE'
                     )
 
                 # Non-numeric (normal quick op) mode
                 else:
+                    src_item = addon_data.quick_scale_match_edge_src
                     if addon_data.quick_scale_match_edge_auto_grab_src:
                         vert_attribs_to_set = ('line_start', 'line_end')
                         try:
@@ -164,14 +163,14 @@ class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
                             )
                             return {'CANCELLED'}
 
-                        maplus_geom.set_item_coords(
-                            addon_data.quick_scale_match_edge_src,
-                            vert_attribs_to_set,
-                            vert_data
+                        src_item = maplus_geom.update_item(
+                            self,
+                            src_item,
+                            dict(zip(vert_attribs_to_set, vert_data))
                         )
 
                     src_global_data = maplus_geom.get_modified_global_coords(
-                        geometry=addon_data.quick_scale_match_edge_src,
+                        geometry=src_item,
                         kind='LINE'
                     )
                     dest_global_data = maplus_geom.get_modified_global_coords(
@@ -209,116 +208,30 @@ class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
                     'Divide by zero error: zero length edge encountered'
                 )
                 return {'CANCELLED'}
-            scale_factor = dest_edge.length/src_edge.length
-
-            if self.target in {'OBJECT', 'OBJECT_ORIGIN'}:
-                for item in multi_edit_targets:
-                    # Get the object world matrix before we modify it here
-                    item_matrix_unaltered = item.matrix_world.copy()
-                    unaltered_inverse = item_matrix_unaltered.copy()
-                    unaltered_inverse.invert()
-
-                    # (Note that there are no transformation modifiers for this
-                    # transformation type, so that section is omitted here)
-                    item.scale = [
-                        scale_factor * num
-                        for num in item.scale
-                    ]
-                    bpy.context.view_layer.update()
-
-                    # put the original line starting point (before the object
-                    # was transformed) into the local object space
-                    src_pivot_location_local = unaltered_inverse @ src_start
-
-                    # get final global position of pivot (source line
-                    # start coords) after object rotation
-                    new_global_src_pivot_coords = (
-                        item.matrix_world @
-                        src_pivot_location_local
-                    )
 
-                    # get translation, new to old (original) pivot location
-                    new_to_old_pivot = (
-                        src_start - new_global_src_pivot_coords
-                    )
-
-                    item.location = (
-                       item.location + new_to_old_pivot
-                    )
-                    bpy.context.view_layer.update()
-
-            if self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}:
-                for item in multi_edit_targets:
-                    # (Note that there are no transformation modifiers for this
-                    # transformation type, so that section is omitted here)
-                    self.report(
-                        {'WARNING'},
-                        ('Warning: mesh transforms'
-                         ' on objects with non-uniform scaling'
-                         ' are not currently supported.')
-                    )
-
-                    # Init source mesh
-                    src_mesh = bmesh.new()
-                    src_mesh.from_mesh(item.data)
-
-                    item_matrix_unaltered_loc = item.matrix_world.copy()
-                    unaltered_inverse_loc = item_matrix_unaltered_loc.copy()
-                    unaltered_inverse_loc.invert()
-
-                    # Stored geom data in local coords
-                    src_start_loc = unaltered_inverse_loc @ src_start
-                    src_end_loc = unaltered_inverse_loc @ src_end
-
-                    dest_start_loc = unaltered_inverse_loc @ dest_start
-                    dest_end_loc = unaltered_inverse_loc @ dest_end
-
-                    # Construct vectors for each line in local space
-                    loc_src_line = src_end_loc - src_start_loc
-                    loc_dest_line = dest_end_loc - dest_start_loc
-
-                    # Get the scale match matrix
-                    scaling_match = mathutils.Matrix.Scale(
-                        scale_factor,
-                        4
-                    )
-
-                    # Get the new pivot location
-                    new_pivot_location_loc = scaling_match @ src_start_loc
-
-                    # Get the translation, new to old pivot location
-                    new_to_old_pivot_vec = (
-                        src_start_loc - new_pivot_location_loc
-                    )
-                    new_to_old_pivot = mathutils.Matrix.Translation(
-                        new_to_old_pivot_vec
+            transform = maplus_kernels.scale_match_edge_matrix(
+                src_start,
+                src_end,
+                dest_start,
+                dest_end
+            )
+            if self.compute_only:
+                maplus_transforms.store_transform_results(
+                    self,
+                    active_item,
+                    maplus_transforms.get_transform_results(
+                        multi_edit_targets,
+                        transform,
+                        self.target
                     )
-
-                    # Get combined scale + move
-                    match_transf = new_to_old_pivot @ scaling_match
-
-                    if self.target == 'MESH_SELECTED':
-                        src_mesh.transform(
-                            match_transf,
-                            filter={'SELECT'}
-                        )
-                    elif self.target == 'WHOLE_MESH':
-                        src_mesh.transform(match_transf)
-                    elif self.target == 'OBJECT_ORIGIN':
-                        # Note: a target of 'OBJECT_ORIGIN' is equivalent
-                        # to performing an object transf. + an inverse
-                        # whole mesh level transf. To the user,
-                        # the object appears to stay in the same place,
-                        # while only the object's origin moves.
-                        src_mesh.transform(match_transf.inverted())
-
-                    # write and then release the mesh data
-                    bpy.ops.object.mode_set(mode='OBJECT')
-                    src_mesh.to_mesh(item.data)
-                    src_mesh.free()
-
-            # Go back to whatever mode we were in before doing this
-            bpy.ops.object.mode_set(mode=previous_mode)
+                )
+            else:
+                maplus_transforms.apply_transform(
+                    self,
+                    multi_edit_targets,
+                    transform,
+                    self.target
+                )
 
         else:
             # The selected Blender objects are not compatible with the
@@ -412,6 +325,44 @@ class MAPLUS_OT_QuickScaleMatchEdgeWholeMesh(MAPLUS_OT_ScaleMatchEdgeBase):
     quick_op_target = True
 
 
+class MAPLUS_OT_ComputeScaleMatchEdge(MAPLUS_OT_ScaleMatchEdgeBase):
+    bl_idname = "maplus.computescalematchedge"
+    bl_label = "Compute Match Edge Scale"
+    bl_description = (
+        "Computes the match edge scale transform of the active item for the"
+        " selected objects, and stores the per-object results on it"
+        " (computed_transforms) without changing anything"
+    )
+    # No undo step, nothing is changed
+    bl_options = {'REGISTER'}
+    compute_only = True
+    target: bpy.props.EnumProperty(
+        items=maplus_transforms.transform_target_items,
+        name="Target",
+        description="What the transform would be applied to",
+        default='OBJECT'
+    )
+
+
+class MAPLUS_OT_QuickComputeScaleMatchEdge(MAPLUS_OT_ScaleMatchEdgeBase):
+    bl_idname = "maplus.quickcomputescalematchedge"
+    bl_label = "Quick Compute Match Edge Scale"
+    bl_description = (
+        "Computes the quick match edge scale transform for the selected"
+        " objects, and stores the per-object results on the quick tool's"
+        " item (computed_transforms) without changing anything"
+    )
+    bl_options = {'REGISTER'}
+    compute_only = True
+    quick_op_target = True
+    target: bpy.props.EnumProperty(
+        items=maplus_transforms.transform_target_items,
+        name="Target",
+        description="What the transform would be applied to",
+        default='OBJECT'
+    )
+
+
 class MAPLUS_OT_ClearEasyScaleMatchEdge(bpy.types.Operator):
     bl_idname = "maplus.cleareasyscalematchedge"
     bl_label = "Reset Easy Scale Match Edge"
@@ -450,7 +401,6 @@ class MAPLUS_OT_EasyScaleMatchEdge(bpy.types.Operator):
     def execute(self, context):
         """TODO fix"""
         addon_data = bpy.context.scene.maplus_data
-        previous_mode = maplus_geom.get_active_object().mode
         # Get valid objects from the target list
         valid_targets = [
             item
@@ -490,17 +440,6 @@ class MAPLUS_OT_EasyScaleMatchEdge(bpy.types.Operator):
         if not (addon_data.easy_sme_transf_type in {'WHOLE_MESH'}
                 and [item for item in multi_edit_targets if item.type != 'MESH']):
 
-            # Make sure we're in edit mode with no stale data for proper vert-grabbing
-            if maplus_geom.get_active_object().type == 'MESH':
-                # a bmesh can only be initialized in edit mode...
-                if previous_mode != 'EDIT':
-                    bpy.ops.object.editmode_toggle()
-                else:
-                    # else we could already be in edit mode with some stale
-                    # updates, exiting and reentering forces an update
-                    bpy.ops.object.editmode_toggle()
-                    bpy.ops.object.editmode_toggle()
-
             # Stage one (first-press) behavior
             if addon_data.easy_sme_is_first_press:
 
@@ -532,9 +471,6 @@ class MAPLUS_OT_EasyScaleMatchEdge(bpy.types.Operator):
                     vert_data
                 )
 
-                # Go back to whatever mode we were in before doing this
-                bpy.ops.object.mode_set(mode=previous_mode)
-
                 # Get/store the objects selected during the first press, these
                 # are used later during stage two, where the alignment will be run
                 # against all of these objects
@@ -613,107 +549,24 @@ class MAPLUS_OT_EasyScaleMatchEdge(bpy.types.Operator):
                         'Divide by zero error: zero length edge encountered'
                     )
                     return {'CANCELLED'}
-                scale_factor = dest_edge.length / src_edge.length
-
-                if addon_data.easy_sme_transf_type in {'OBJECT'}:
-                    for item in multi_edit_targets:
-                        # Get the object world matrix before we modify it here
-                        item_matrix_unaltered = item.matrix_world.copy()
-                        unaltered_inverse = item_matrix_unaltered.copy()
-                        unaltered_inverse.invert()
-
-                        # (Note that there are no transformation modifiers for this
-                        # transformation type, so that section is omitted here)
-                        item.scale = [
-                            scale_factor * num
-                            for num in item.scale
-                        ]
-                        bpy.context.view_layer.update()
-
-                        # put the original line starting point (before the object
-                        # was transformed) into the local object space
-                        src_pivot_location_local = unaltered_inverse @ src_start
-
-                        # get final global position of pivot (source line
-                        # start coords) after object rotation
-                        new_global_src_pivot_coords = (
-                                item.matrix_world @
-                                src_pivot_location_local
-                        )
-
-                        # get translation, new to old (original) pivot location
-                        new_to_old_pivot = (
-                                src_start - new_global_src_pivot_coords
-                        )
-
-                        item.location = (
-                                item.location + new_to_old_pivot
-                        )
-                        bpy.context.view_layer.update()
-
-                if addon_data.easy_sme_transf_type in {'WHOLE_MESH'}:
-
-                    self.report(
-                        {'WARNING'},
-                        ('Warning: mesh transforms'
-                         ' on objects with non-uniform scaling'
-                         ' are not currently supported.')
-                    )
-
-                    for item in multi_edit_targets:
-                        # Init source mesh
-                        src_mesh = bmesh.new()
-                        src_mesh.from_mesh(item.data)
-
-                        item_matrix_unaltered_loc = item.matrix_world.copy()
-                        unaltered_inverse_loc = item_matrix_unaltered_loc.copy()
-                        unaltered_inverse_loc.invert()
-
-                        # Stored geom data in local coords
-                        src_start_loc = unaltered_inverse_loc @ src_start
-                        src_end_loc = unaltered_inverse_loc @ src_end
-
-                        dest_start_loc = unaltered_inverse_loc @ dest_start
-                        dest_end_loc = unaltered_inverse_loc @ dest_end
-
-                        # Construct vectors for each line in local space
-                        loc_src_line = src_end_loc - src_start_loc
-                        loc_dest_line = dest_end_loc - dest_start_loc
-
-                        # Get the scale match matrix
-                        scaling_match = mathutils.Matrix.Scale(
-                            scale_factor,
-                            4
-                        )
-
-                        # Get the new pivot location
-                        new_pivot_location_loc = scaling_match @ src_start_loc
-
-                        # Get the translation, new to old pivot location
-                        new_to_old_pivot_vec = (
-                                src_start_loc - new_pivot_location_loc
-                        )
-                        new_to_old_pivot = mathutils.Matrix.Translation(
-                            new_to_old_pivot_vec
-                        )
-
-                        # Get combined scale + move
-                        match_transf = new_to_old_pivot @ scaling_match
 
-                        src_mesh.transform(match_transf)
-
-                        # write and then release the mesh data
-                        bpy.ops.object.mode_set(mode='OBJECT')
-                        src_mesh.to_mesh(item.data)
-                        src_mesh.free()
+                transform = maplus_kernels.scale_match_edge_matrix(
+                    src_start,
+                    src_end,
+                    dest_start,
+                    dest_end
+                )
+                maplus_transforms.apply_transform(
+                    self,
+                    multi_edit_targets,
+                    transform,
+                    addon_data.easy_sme_transf_type
+                )
 
                 # Clear stored source data once the transform is applied
                 addon_data.easy_sme_is_first_press = True
                 addon_data.easy_sme_designated_objects.clear()
 
-            # Go back to whatever mode we were in before doing this
-            bpy.ops.object.mode_set(mode=previous_mode)
-
         else:
             # The selected Blender objects are not compatible with the
             # requested transformation type (we can't apply a transform
@@ -870,6 +723,11 @@ class MAPLUS_PT_QuickSMEGUI(bpy.types.Panel):
                             icon='CURVE_PATH',
                             text="Grab Source"
                     )
+                    preserve_button_roundedge.operator(
+                        "maplus.quickscalematchedgegrabfitsrc",
+                        icon='IPO_LINEAR',
+                        text=""
+                    )
                 else:
                     sme_src_geom_top.operator(
                             "maplus.showhidequicksmesrcgeom",
@@ -894,6 +752,29 @@ class MAPLUS_PT_QuickSMEGUI(bpy.types.Panel):
                         icon='VERTEXSEL',
                         text="Grab All Global"
                     )
+                    ln_grab_all.operator(
+                        "maplus.quickscalematchedgegrabfitsrc",
+                        icon='IPO_LINEAR',
+                        text="Best Fit"
+                    )
+                    element_grabs = sme_src_geom_editor.row(align=True)
+                    element_grab = element_grabs.operator(
+                        "maplus.quickscalematchedgegrabelementsrc",
+                        icon='EDGESEL',
+                        text="Edge Direction"
+                    )
+                    element_grab.element_mode = 'EDGE_DIRECTION'
+                    element_grab = element_grabs.operator(
+                        "maplus.quickscalematchedgegrabelementsrc",
+                        icon='FACESEL',
+                        text="Face Centers"
+                    )
+                    element_grab.element_mode = 'FACE_CENTERS'
+                    element_grabs.operator(
+                        "maplus.quickscalematchedgegrabsurfacesrc",
+                        icon='SNAP_FACE',
+                        text="Surface Normal"
+                    )
 
                     special_grabs = sme_src_geom_editor.row(align=True)
                     special_grabs.operator(
@@ -912,6 +793,13 @@ class MAPLUS_PT_QuickSMEGUI(bpy.types.Panel):
                         icon='PASTEDOWN',
                         text="Paste (From Clipboard)"
                     )
+                    snap_coords = special_grabs_extra.operator(
+                        "maplus.snapcoordstoverts",
+                        icon='SNAP_ON',
+                        text=""
+                    )
+                    snap_coords.target = 'SMESRC'
+                    snap_coords.item_kind = 'LINE'
 
                     modifier_header = sme_src_geom_editor.row()
                     modifier_header.label(text="Line Modifiers:")
@@ -1006,6 +894,11 @@ class MAPLUS_PT_QuickSMEGUI(bpy.types.Panel):
                         icon='CURVE_PATH',
                         text="Grab Destination"
                 )
+                preserve_button_roundedge.operator(
+                    "maplus.quickscalematchedgegrabfitdest",
+                    icon='IPO_LINEAR',
+                    text=""
+                )
             else:
                 sme_dest_geom_top.operator(
                         "maplus.showhidequicksmedestgeom",
@@ -1030,6 +923,29 @@ class MAPLUS_PT_QuickSMEGUI(bpy.types.Panel):
                     icon='VERTEXSEL',
                     text="Grab All Global"
                 )
+                ln_grab_all.operator(
+                    "maplus.quickscalematchedgegrabfitdest",
+                    icon='IPO_LINEAR',
+                    text="Best Fit"
+                )
+                element_grabs = sme_dest_geom_editor.row(align=True)
+                element_grab = element_grabs.operator(
+                    "maplus.quickscalematchedgegrabelementdest",
+                    icon='EDGESEL',
+                    text="Edge Direction"
+                )
+                element_grab.element_mode = 'EDGE_DIRECTION'
+                element_grab = element_grabs.operator(
+                    "maplus.quickscalematchedgegrabelementdest",
+                    icon='FACESEL',
+                    text="Face Centers"
+                )
+                element_grab.element_mode = 'FACE_CENTERS'
+                element_grabs.operator(
+                    "maplus.quickscalematchedgegrabsurfacedest",
+                    icon='SNAP_FACE',
+                    text="Surface Normal"
+                )
                 special_grabs = sme_dest_geom_editor.row(align=True)
                 special_grabs.operator(
                     "maplus.quicksmegrabnormaldest",
@@ -1047,6 +963,13 @@ class MAPLUS_PT_QuickSMEGUI(bpy.types.Panel):
                     icon='PASTEDOWN',
                     text="Paste (From Clipboard)"
                 )
+                snap_coords = special_grabs_extra.operator(
+                    "maplus.snapcoordstoverts",
+                    icon='SNAP_ON',
+                    text=""
+                )
+                snap_coords.target = 'SMEDEST'
+                snap_coords.item_kind = 'LINE'
 
                 modifier_header = sme_dest_geom_editor.row()
                 modifier_header.label(text="Line Modifiers:")
@@ -0,0 +1,195 @@
+"""Reverting transforms recorded in the undo journal (see utils.journal)."""
+
+
+import bmesh
+import bpy
+import numpy as np
+
+from .utils import geom as maplus_geom
+from .utils import journal as maplus_journal
+from .utils import transforms as maplus_transforms
+
+
+def get_vert_count(mesh):
+    if mesh.is_editmode:
+        return len(bmesh.from_edit_mesh(mesh).verts)
+    return len(mesh.vertices)
+
+
+def get_point_layer_count(mesh, vector_attributes=False):
+    """Get a mesh's number of point layers (see geom.get_point_layers)."""
+    if mesh.is_editmode:
+        return 1 + len(maplus_geom.get_edit_point_layers(
+            bmesh.from_edit_mesh(mesh),
+            vector_attributes
+        ))
+    return len(maplus_geom.get_point_layers(mesh, vector_attributes))
+
+
+def get_step_datablocks(entry):
+    """Get the object or mesh of each step of an entry.
+
+    Looked up by session_uid, so a renamed object or mesh is still found
+    (and another one that took its name isn't).
+
+    :returns: A list with one object or mesh per step, None for the ones
+        that were removed
+    """
+    objects = {item.session_uid: item for item in bpy.data.objects}
+    meshes = {mesh.session_uid: mesh for mesh in bpy.data.meshes}
+    return [
+        (meshes if step.kind == 'MESH' else objects).get(step.session_uid)
+        for step in entry.steps
+    ]
+
+
+def get_stale_step(entry, datablocks):
+    """Get the first step of an entry that can't be reverted (or None).
+
+    A step can't be reverted if its object or mesh was removed, or if
+    the mesh's vert count (or for a snapshot, its number of shape keys
+    or attributes) changed since.
+
+    :param datablocks: The steps' objects and meshes, from
+        get_step_datablocks
+    """
+    for step, datablock in zip(entry.steps, datablocks):
+        if datablock is None:
+            return step
+        if step.kind != 'MESH':
+            continue
+        mesh = datablock
+        vert_count = get_vert_count(mesh)
+        if (step.snapshot is not None
+                and step.snapshot.shape[:2] != (
+                    get_point_layer_count(mesh, step.vector_attributes),
+                    vert_count
+                )):
+            return step
+        if (step.select_mask is not None
+                and len(step.select_mask) != (vert_count + 7) // 8):
+            return step
+    return None
+
+
+def set_point_coords(mesh, coords, vector_attributes=False):
+    """Write point layers from journal.get_point_coords back to a mesh."""
+    if mesh.is_editmode:
+        edit_mesh = bmesh.from_edit_mesh(mesh)
+        layers = maplus_geom.get_edit_point_layers(
+            edit_mesh,
+            vector_attributes
+        )
+        for vert, co in zip(edit_mesh.verts, coords[0]):
+            vert.co = co
+        for layer, layer_coords in zip(layers, coords[1:]):
+            for vert, co in zip(edit_mesh.verts, layer_coords):
+                vert[layer] = co
+        bmesh.update_edit_mesh(mesh, destructive=False)
+        return
+    maplus_geom.write_point_layers(
+        maplus_geom.get_point_layers(mesh, vector_attributes),
+        coords
+    )
+    mesh.update()
+
+
+def revert_mesh_step(mesh, step):
+    """Revert a mesh data transform (by its inverse, or from a snapshot)."""
+    if step.snapshot is not None:
+        set_point_coords(mesh, step.snapshot, step.vector_attributes)
+        return
+    select_mask = None
+    if step.select_mask is not None:
+        select_mask = np.unpackbits(
+            step.select_mask,
+            count=get_vert_count(mesh)
+        ).astype(bool)
+    maplus_transforms.transform_mesh(
+        mesh,
+        maplus_transforms.to_matrix(np.linalg.inv(step.matrix)),
+        select_mask,
+        step.vector_attributes
+    )
+
+
+def revert_journal_entry(entry, datablocks):
+    """Revert all the object and mesh transforms of a journal entry.
+
+    The mesh data and 'OBJECT_LOCAL' steps (in local space) are reverted
+    first, the global object transforms last, in one batch like
+    transforms.transform_objects applies them (parents before children).
+
+    :param datablocks: The steps' objects and meshes, from
+        get_step_datablocks (none of them None)
+    """
+    object_steps = []
+    for step, datablock in reversed(list(zip(entry.steps, datablocks))):
+        if step.kind == 'MESH':
+            revert_mesh_step(datablock, step)
+        elif step.kind == 'OBJECT_LOCAL':
+            item = datablock
+            if step.snapshot is not None:
+                item.matrix_world = step.snapshot
+            else:
+                item.matrix_world = item.matrix_world @ (
+                    maplus_transforms.to_matrix(np.linalg.inv(step.matrix))
+                )
+        else:
+            object_steps.append((step, datablock))
+
+    final_matrices = []
+    for step, item in object_steps:
+        if step.snapshot is not None:
+            final_matrices.append((item, step.snapshot))
+        else:
+            final_matrices.append((
+                item,
+                maplus_transforms.to_matrix(np.linalg.inv(step.matrix)) @
+                item.matrix_world
+            ))
+    final_matrices.sort(
+        key=lambda pair: maplus_transforms.get_parent_depth(pair[0])
+    )
+    for item, matrix_world in final_matrices:
+        item.matrix_world = matrix_world
+    bpy.context.view_layer.update()
+
+
+class MAPLUS_OT_RevertLastTransform(bpy.types.Operator):
+    bl_idname = "maplus.revertlasttransform"
+    bl_label = "Revert Last Transform"
+    bl_description = (
+        "Reverts the last transform recorded in the undo journal (see the"
+        " addon preferences) by applying its inverse"
+    )
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return bool(maplus_journal.entries)
+
+    def execute(self, context):
+        if not maplus_journal.entries:
+            self.report(
+                {'ERROR'},
+                'Cannot revert: the undo journal is empty.'
+            )
+            return {'CANCELLED'}
+
+        entry = maplus_journal.entries.pop()
+        datablocks = get_step_datablocks(entry)
+        stale_step = get_stale_step(entry, datablocks)
+        if stale_step is not None:
+            # (The entry can never be reverted, so it's dropped)
+            self.report(
+                {'ERROR'},
+                ('Cannot revert "{0}": "{1}" was removed or its geometry'
+                 ' changed.').format(entry.label, stale_step.name)
+            )
+            return {'CANCELLED'}
+
+        revert_journal_entry(entry, datablocks)
+        self.report({'INFO'}, 'Reverted "{0}"'.format(entry.label))
+
+        return {'FINISHED'}
@@ -0,0 +1,320 @@
+"""Alignment math for the transformation tools, independent of bpy.
+
+Each tool kernel takes global coords (any 3 element sequences, like
+mathutils Vectors, tuples or numpy arrays) and returns the global 4x4
+transform for that tool as a numpy float64 array. The operators apply
+these matrices directly at object level, and at mesh level after
+converting them to an object's local space with get_local_matrix.
+
+Every tool also has a batched kernel (the *_matrices functions), which
+computes the transforms for N source/dest pairs at once from (N, 3)
+coord arrays and returns an (N, 4, 4) array. The single pair kernels
+are wrappers around these.
+
+Nothing here imports bpy or mathutils, so the kernels can be used (and
+tested or benchmarked) outside of Blender. The rotations match the ones
+mathutils.Vector.rotation_difference produces, including its choice of
+rotation axis for opposite vectors. There's no separate mathutils
+implementation, mathutils Vectors are taken as they are (see
+tests/test_align_kernels.py, which also compares the rotations with
+mathutils when it's importable).
+"""
+
+
+import numpy as np
+
+
+def as_vector(co):
+    """Get a coord as a numpy float64 array of shape (3,)."""
+    return np.asarray(tuple(co), dtype=np.float64).reshape(3)
+
+
+def as_vectors(coords):
+    """Get a sequence of coords as a numpy float64 array of shape (N, 3)."""
+    return np.asarray(coords, dtype=np.float64).reshape((-1, 3))
+
+
+def as_rows(values, count, dtype=np.float64):
+    """Broadcast a scalar or per-row sequence to an array of shape (N,)."""
+    return np.broadcast_to(np.asarray(values, dtype=dtype), (count,))
+
+
+def norms(vecs):
+    """Get the lengths of an (N, 3) array of vectors, shape (N, 1)."""
+    return np.sqrt(np.einsum('ij,ij->i', vecs, vecs))[:, np.newaxis]
+
+
+def cross(vecs_a, vecs_b):
+    """Get the cross products of (..., 3) arrays of 3d vectors.
+
+    (np.cross is general over array shapes and much slower for few vectors)
+    """
+    return np.stack((
+        vecs_a[..., 1] * vecs_b[..., 2] - vecs_a[..., 2] * vecs_b[..., 1],
+        vecs_a[..., 2] * vecs_b[..., 0] - vecs_a[..., 0] * vecs_b[..., 2],
+        vecs_a[..., 0] * vecs_b[..., 1] - vecs_a[..., 1] * vecs_b[..., 0]
+    ), axis=-1)
+
+
+def get_translation_matrices(offsets):
+    """Get (N, 4, 4) translation matrices from (N, 3) offsets."""
+    offsets = as_vectors(offsets)
+    matrices = np.tile(np.identity(4), (len(offsets), 1, 1))
+    matrices[:, :3, 3] = offsets
+    return matrices
+
+
+def get_pivot_matrices(linear, src_pivots, dest_pivots=None):
+    """Get 4x4 matrices applying 3x3 linear transforms about pivots.
+
+    :param linear: (N, 3, 3) rotations/scalings, applied about src_pivots
+    :param src_pivots: (N, 3) pivot points
+    :param dest_pivots: Where the pivots are moved to afterwards, defaults
+        to src_pivots (no translation)
+    :returns: An (N, 4, 4) numpy array
+    """
+    src_pivots = as_vectors(src_pivots)
+    dest_pivots = (
+        src_pivots if dest_pivots is None else as_vectors(dest_pivots)
+    )
+    matrices = np.tile(np.identity(4), (len(src_pivots), 1, 1))
+    matrices[:, :3, :3] = linear
+    matrices[:, :3, 3] = dest_pivots - np.einsum(
+        'nij,nj->ni',
+        matrices[:, :3, :3],
+        src_pivots
+    )
+    return matrices
+
+
+def get_local_matrix(matrix, object_matrix):
+    """Convert a global 4x4 transform to an object's local space.
+
+    The result transforms the object's mesh data so that, seen through
+    object_matrix, the mesh moves by the global transform (exactly, also
+    for non-uniformly scaled objects).
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    object_matrix = np.asarray(object_matrix, dtype=np.float64)
+    return np.linalg.inv(object_matrix) @ matrix @ object_matrix
+
+
+def get_orthogonal_vectors(vecs):
+    """Get vectors orthogonal to (N, 3) vecs (the ones mathutils picks)."""
+    x, y, z = np.abs(vecs).T
+    dominant_axes = np.where(
+        x > y,
+        np.where(x > z, 0, 2),
+        np.where(y > z, 1, 2)
+    )
+    vx, vy, vz = vecs.T
+    candidates = np.array((
+        (-vy - vz, vx, vx),
+        (vy, -vx - vz, vy),
+        (vz, vz, -vx - vy)
+    ))
+    return candidates[dominant_axes, :, np.arange(len(vecs))]
+
+
+def get_axis_rotations(axes, angles):
+    """Get (N, 3, 3) rotation matrices of angles (radians) around axes."""
+    axes = as_vectors(axes)
+    axes = axes / norms(axes)
+    angles = as_rows(angles, len(axes))[:, np.newaxis, np.newaxis]
+    cross_products = np.zeros((len(axes), 3, 3))
+    cross_products[:, 0, 1] = -axes[:, 2]
+    cross_products[:, 0, 2] = axes[:, 1]
+    cross_products[:, 1, 0] = axes[:, 2]
+    cross_products[:, 1, 2] = -axes[:, 0]
+    cross_products[:, 2, 0] = -axes[:, 1]
+    cross_products[:, 2, 1] = axes[:, 0]
+    return (
+        np.cos(angles) * np.identity(3) +
+        np.sin(angles) * cross_products +
+        (1.0 - np.cos(angles)) * np.einsum('ni,nj->nij', axes, axes)
+    )
+
+
+def get_rotation_differences(src_vecs, dest_vecs):
+    """Get the shortest (N, 3, 3) rotations turning src_vecs to dest_vecs.
+
+    Like mathutils.Vector.rotation_difference, parallel vectors give
+    the identity and opposite vectors a half turn.
+    """
+    src_vecs = as_vectors(src_vecs)
+    dest_vecs = as_vectors(dest_vecs)
+    src_vecs = src_vecs / norms(src_vecs)
+    dest_vecs = dest_vecs / norms(dest_vecs)
+    axes = cross(src_vecs, dest_vecs)
+    axis_lengths = norms(axes)[:, 0]
+    dots = np.einsum('ij,ij->i', src_vecs, dest_vecs)
+
+    # Parallel vectors (no rotation) get an arbitrary axis and no angle,
+    # opposite ones a half turn around the axis mathutils would use
+    degenerate = axis_lengths <= np.finfo(np.float32).eps
+    angles = np.where(
+        degenerate,
+        np.where(dots > 0.0, 0.0, np.pi),
+        np.arctan2(axis_lengths, dots)
+    )
+    axes[degenerate] = get_orthogonal_vectors(src_vecs[degenerate])
+    return get_axis_rotations(axes, angles)
+
+
+def get_slide_vectors(starts, ends, make_unit=False, flip=False,
+                      multiplier=1.0):
+    """Get (N, 3) translation vectors (start to end) with the tool modifiers.
+
+    The modifiers can be single values or one per row.
+    """
+    directions = as_vectors(ends) - as_vectors(starts)
+    count = len(directions)
+    make_unit = as_rows(make_unit, count, bool)
+    directions[make_unit] /= norms(directions[make_unit])
+    directions[as_rows(flip, count, bool)] *= -1.0
+    return directions * as_rows(multiplier, count)[:, np.newaxis]
+
+
+def align_points_matrices(src_pts, dest_pts, make_unit=False, flip=False,
+                          multiplier=1.0):
+    """Get align points transforms, moving src_pts to dest_pts."""
+    return get_translation_matrices(
+        get_slide_vectors(src_pts, dest_pts, make_unit, flip, multiplier)
+    )
+
+
+def directional_slide_matrices(dir_starts, dir_ends, make_unit=False,
+                               flip=False, multiplier=1.0):
+    """Get directional slide transforms, along dir_starts to dir_ends."""
+    return get_translation_matrices(
+        get_slide_vectors(dir_starts, dir_ends, make_unit, flip, multiplier)
+    )
+
+
+def align_lines_matrices(src_starts, src_ends, dest_starts, dest_ends,
+                         flip=False):
+    """Get align lines transforms.
+
+    The source lines are rotated parallel to the dest lines, about their
+    starts, and their starts are moved to the dest line starts.
+    """
+    src_lines = as_vectors(src_ends) - as_vectors(src_starts)
+    src_lines[as_rows(flip, len(src_lines), bool)] *= -1.0
+    dest_lines = as_vectors(dest_ends) - as_vectors(dest_starts)
+    return get_pivot_matrices(
+        get_rotation_differences(src_lines, dest_lines),
+        src_starts,
+        dest_starts
+    )
+
+
+def align_planes_matrices(src_pts, dest_pts, flip_normal=False,
+                          pivot_index=1):
+    """Get align planes transforms.
+
+    The source planes (points A, B, C) are rotated parallel to the dest
+    planes and their leading edges (B to A) are aligned with the dest
+    ones, about their pivots (B by default), which are moved to the
+    dest pivots.
+
+    :param src_pts: The source planes' A, B and C points, shape (N, 3, 3)
+    :param dest_pts: The dest planes' A, B and C points, shape (N, 3, 3)
+    :param flip_normal: Flip the source planes' normals (single value
+        or one per row)
+    :param pivot_index: Which point is the pivot (on all planes)
+    """
+    src_pts = as_vectors(src_pts).reshape((-1, 3, 3))
+    dest_pts = as_vectors(dest_pts).reshape((-1, 3, 3))
+    src_a, src_b, src_c = src_pts.transpose((1, 0, 2))
+    dest_a, dest_b, dest_c = dest_pts.transpose((1, 0, 2))
+
+    src_ba = src_a - src_b
+    src_normals = cross(src_ba, src_c - src_b)
+    src_normals[as_rows(flip_normal, len(src_normals), bool)] *= -1.0
+    dest_ba = dest_a - dest_b
+    dest_normals = cross(dest_ba, dest_c - dest_b)
+
+    parallelize_planes = get_rotation_differences(src_normals, dest_normals)
+    parallelize_edges = get_rotation_differences(
+        np.einsum('nij,nj->ni', parallelize_planes, src_ba),
+        dest_ba
+    )
+    return get_pivot_matrices(
+        parallelize_edges @ parallelize_planes,
+        src_pts[:, pivot_index],
+        dest_pts[:, pivot_index]
+    )
+
+
+def axis_rotate_matrices(axis_starts, axis_ends, angles):
+    """Get axis rotate transforms (angles in radians)."""
+    return get_pivot_matrices(
+        get_axis_rotations(
+            as_vectors(axis_ends) - as_vectors(axis_starts),
+            angles
+        ),
+        axis_starts
+    )
+
+
+def scale_match_edge_matrices(src_starts, src_ends, dest_starts, dest_ends):
+    """Get scale match edge transforms.
+
+    The source edges are scaled uniformly about their starts, to the
+    lengths of the dest edges (no edge can have a zero length).
+    """
+    src_lengths = norms(as_vectors(src_ends) - as_vectors(src_starts))
+    dest_lengths = norms(as_vectors(dest_ends) - as_vectors(dest_starts))
+    scale_factors = (dest_lengths / src_lengths)[:, :, np.newaxis]
+    return get_pivot_matrices(
+        np.identity(3) * scale_factors,
+        src_starts
+    )
+
+
+def align_points_matrix(src_pt, dest_pt, make_unit=False, flip=False,
+                        multiplier=1.0):
+    """Get the align points transform, moving src_pt to dest_pt."""
+    return align_points_matrices(
+        [src_pt], [dest_pt], make_unit, flip, multiplier
+    )[0]
+
+
+def directional_slide_matrix(dir_start, dir_end, make_unit=False,
+                             flip=False, multiplier=1.0):
+    """Get the directional slide transform, along dir_start to dir_end."""
+    return directional_slide_matrices(
+        [dir_start], [dir_end], make_unit, flip, multiplier
+    )[0]
+
+
+def align_lines_matrix(src_start, src_end, dest_start, dest_end,
+                       flip=False):
+    """Get the align lines transform (see align_lines_matrices)."""
+    return align_lines_matrices(
+        [src_start], [src_end], [dest_start], [dest_end], flip
+    )[0]
+
+
+def align_planes_matrix(src_pts, dest_pts, flip_normal=False,
+                        pivot_index=1):
+    """Get the align planes transform (see align_planes_matrices).
+
+    :param src_pts: The source plane's A, B and C points
+    :param dest_pts: The dest plane's A, B and C points
+    """
+    return align_planes_matrices(
+        [src_pts], [dest_pts], flip_normal, pivot_index
+    )[0]
+
+
+def axis_rotate_matrix(axis_start, axis_end, angle):
+    """Get the axis rotate transform (angle in radians)."""
+    return axis_rotate_matrices([axis_start], [axis_end], angle)[0]
+
+
+def scale_match_edge_matrix(src_start, src_end, dest_start, dest_end):
+    """Get the scale match edge transform (see scale_match_edge_matrices)."""
+    return scale_match_edge_matrices(
+        [src_start], [src_end], [dest_start], [dest_end]
+    )[0]
@@ -0,0 +1,104 @@
+"""Bounded caches for data derived from Blender datablocks."""
+
+
+import collections
+
+import bpy
+
+
+# Every DatablockCache, so the app handlers below can invalidate them all
+all_caches = []
+
+
+class DatablockCache(object):
+    """An LRU cache of data derived from Blender datablocks.
+
+    Entries are keyed on a datablock's session_uid plus a "kind" (so
+    one datablock can have several kinds of derived data cached), and
+    are dropped whenever the depsgraph reports that datablock as updated.
+    The cache is bounded by an item count and, optionally, by a total
+    weight (e.g. a vert count), least recently used entries are evicted
+    first. An entry heavier than max_weight on its own isn't cached,
+    unless pin_newest is set: then the most recently set entry is always
+    kept, and all the others are evicted for it.
+    """
+
+    def __init__(self, max_items, max_weight=None, pin_newest=False):
+        self.max_items = max_items
+        self.max_weight = max_weight
+        self.pin_newest = pin_newest
+        self.entries = collections.OrderedDict()
+        self.total_weight = 0
+        all_caches.append(self)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, datablock_uid, kind=None, default=None):
+        key = (datablock_uid, kind)
+        if key not in self.entries:
+            return default
+        self.entries.move_to_end(key)
+        return self.entries[key][0]
+
+    def set(self, datablock_uid, value, kind=None, weight=1):
+        key = (datablock_uid, kind)
+        self.pop(key)
+        if (self.max_weight is not None and weight > self.max_weight
+                and not self.pin_newest):
+            # Too heavy to cache, the caller just uses the value uncached
+            return
+        self.entries[key] = (value, weight)
+        self.total_weight += weight
+        while len(self.entries) > 1 and (
+                len(self.entries) > self.max_items
+                or (self.max_weight is not None
+                    and self.total_weight > self.max_weight)):
+            self.pop(next(iter(self.entries)))
+
+    def pop(self, key):
+        if key in self.entries:
+            value, weight = self.entries.pop(key)
+            self.total_weight -= weight
+
+    def invalidate(self, datablock_uid):
+        for key in [k for k in self.entries if k[0] == datablock_uid]:
+            self.pop(key)
+
+    def clear(self):
+        self.entries.clear()
+        self.total_weight = 0
+
+
+@bpy.app.handlers.persistent
+def invalidate_updated_datablocks(scene, depsgraph):
+    """Drop cached data for every datablock the depsgraph has updated."""
+    if not any(len(cache) for cache in all_caches):
+        return
+    for update in depsgraph.updates:
+        datablock_uid = update.id.original.session_uid
+        for cache in all_caches:
+            cache.invalidate(datablock_uid)
+
+
+@bpy.app.handlers.persistent
+def clear_all_caches(*args):
+    for cache in all_caches:
+        cache.clear()
+
+
+def register_handlers():
+    bpy.app.handlers.depsgraph_update_post.append(
+        invalidate_updated_datablocks
+    )
+    bpy.app.handlers.load_post.append(clear_all_caches)
+
+
+def unregister_handlers():
+    if invalidate_updated_datablocks in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(
+            invalidate_updated_datablocks
+        )
+    if clear_all_caches in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(clear_all_caches)
+    clear_all_caches()
@@ -0,0 +1,385 @@
+"""Least-squares shape fitting for point clouds (vectorized, numpy only).
+
+Nothing in here depends on bpy, points are (n, 3) float arrays and
+results are plain numpy arrays, so the fits can be tested and
+benchmarked outside of Blender.
+"""
+
+
+import collections
+
+import numpy as np
+
+from . import exceptions as maplus_except
+
+
+PlaneFit = collections.namedtuple(
+    'PlaneFit',
+    ['center', 'normal', 'axis_u', 'axis_v', 'extents', 'rms_residual']
+)
+LineFit = collections.namedtuple(
+    'LineFit',
+    ['start', 'end', 'direction', 'rms_residual']
+)
+CylinderFit = collections.namedtuple(
+    'CylinderFit',
+    ['center', 'axis', 'radius', 'start', 'end', 'rms_residual']
+)
+SphereFit = collections.namedtuple(
+    'SphereFit',
+    ['center', 'radius', 'rms_residual']
+)
+
+
+def principal_axes(points):
+    """Get the centroid and principal axes of a point cloud.
+
+    Uses the eigen decomposition of the 3x3 covariance matrix, which is
+    equivalent to an SVD of the centered points but only needs a single
+    pass over them, so it scales to millions of points.
+
+    :returns: A tuple (centroid, axes, variances), axes is a 3x3 array
+        with one unit axis per row, sorted by decreasing variance
+    """
+    centroid = points.mean(axis=0)
+    centered = points - centroid
+    covariance = centered.T @ centered / len(points)
+    variances, axes = np.linalg.eigh(covariance)
+    order = np.argsort(variances)[::-1]
+    return centroid, axes[:, order].T, np.maximum(variances[order], 0.0)
+
+
+def fit_plane(points, orient_to=None):
+    """Fit a plane to some points (total least squares).
+
+    :param points: An (n, 3) array, with n >= 3
+    :param orient_to: An optional vector, the normal is flipped to point
+        the same way (the sign of a fitted normal is arbitrary otherwise)
+    :returns: A PlaneFit, the in-plane axes are the directions of
+        greatest and least spread, with axis_u x axis_v == normal
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) < 3:
+        raise maplus_except.InsufficientSelectionError()
+
+    centroid, axes, variances = principal_axes(points)
+    axis_u, axis_v, normal = axes
+    if orient_to is not None and np.dot(normal, orient_to) < 0:
+        normal = -normal
+    # Keep the in-plane axes right handed with respect to the normal
+    axis_v = np.cross(normal, axis_u)
+
+    centered = points - centroid
+    extents = np.array([
+        np.abs(centered @ axis_u).max(),
+        np.abs(centered @ axis_v).max(),
+    ])
+    return PlaneFit(
+        center=centroid,
+        normal=normal,
+        axis_u=axis_u,
+        axis_v=axis_v,
+        extents=extents,
+        rms_residual=float(np.sqrt(variances[2])),
+    )
+
+
+def plane_fit_points(plane_fit):
+    """Get three points (A, B, C) spanning a fitted plane.
+
+    B is the center of the fit (the corner/pivot point for the align
+    planes tool), A and C lie along the in-plane axes, sized to the
+    extents of the fitted points, so (A - B) x (C - B) has the same
+    direction as the fitted normal.
+    """
+    extents = np.where(plane_fit.extents > 1e-12, plane_fit.extents, 1.0)
+    pt_b = plane_fit.center
+    pt_a = pt_b + plane_fit.axis_u * extents[0]
+    pt_c = pt_b + plane_fit.axis_v * extents[1]
+    return pt_a, pt_b, pt_c
+
+
+def fit_line(points, orient_to=None):
+    """Fit a line to some points (total least squares).
+
+    The line runs along the principal axis of the points, and is clipped
+    to the extents of the points projected onto it.
+
+    :param points: An (n, 3) array, with n >= 2
+    :param orient_to: An optional vector, the line is flipped to run the
+        same way (the sign of a fitted direction is arbitrary otherwise)
+    :returns: A LineFit, rms_residual is the RMS distance of the points
+        from the line
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) < 2:
+        raise maplus_except.InsufficientSelectionError()
+
+    centroid, axes, variances = principal_axes(points)
+    direction = axes[0]
+    if orient_to is not None and np.dot(direction, orient_to) < 0:
+        direction = -direction
+
+    projected = (points - centroid) @ direction
+    return LineFit(
+        start=centroid + direction * projected.min(),
+        end=centroid + direction * projected.max(),
+        direction=direction,
+        rms_residual=float(np.sqrt(variances[1] + variances[2])),
+    )
+
+
+def perpendicular_basis(direction):
+    """Get two unit vectors (u, v) completing direction to an orthonormal basis."""
+    direction = direction / np.linalg.norm(direction)
+    helper = np.eye(3)[np.argmin(np.abs(direction))]
+    u = np.cross(direction, helper)
+    u /= np.linalg.norm(u)
+    return u, np.cross(direction, u)
+
+
+def fit_circle_2d(xy):
+    """Fit a circle to 2D points (algebraic/Kasa fit).
+
+    Solves 2*cx*x + 2*cy*y + k = x^2 + y^2 in the least squares sense,
+    through its 3x3 normal equations, so it's a single pass over xy.
+
+    :returns: A tuple (center, radius), or None if the points are
+        degenerate (collinear, etc.)
+    """
+    offset = xy.mean(axis=0)
+    xy = xy - offset
+    design = np.column_stack((2 * xy, np.ones(len(xy))))
+    target = (xy * xy).sum(axis=1)
+    normal_matrix = design.T @ design
+    if np.linalg.cond(normal_matrix) > 1e12:
+        return None
+    cx, cy, k = np.linalg.solve(normal_matrix, design.T @ target)
+    radius_sq = k + cx * cx + cy * cy
+    if radius_sq <= 0:
+        return None
+    return np.array([cx, cy]) + offset, np.sqrt(radius_sq)
+
+
+def fit_circle_around_axis(points, axis, origin):
+    """Fit a circle to points projected along an axis direction.
+
+    :returns: A tuple (center, radius, radial residuals), center lies in
+        the plane through origin perpendicular to the axis, or None if
+        the projected points are degenerate
+    """
+    u, v = perpendicular_basis(axis)
+    centered = points - origin
+    xy = np.column_stack((centered @ u, centered @ v))
+    circle = fit_circle_2d(xy)
+    if circle is None:
+        return None
+    (cx, cy), radius = circle
+    residuals = np.hypot(xy[:, 0] - cx, xy[:, 1] - cy) - radius
+    return origin + cx * u + cy * v, radius, residuals
+
+
+def get_least_variance_axis(vectors, weights=None):
+    """Get the direction vectors vary least along (e.g. a cylinder's axis).
+
+    For the normals of the faces around a cylinder, this is the axis: the
+    eigenvector of their (weighted) covariance with the least variance.
+
+    :returns: A unit vector, or None if there are fewer than two vectors
+    """
+    vectors = np.asarray(vectors, dtype=np.float64)
+    if len(vectors) < 2:
+        return None
+    if weights is None:
+        weights = np.ones(len(vectors))
+    covariance = (vectors * weights[:, np.newaxis]).T @ vectors
+    variances, axes = np.linalg.eigh(covariance)
+    return axes[:, np.argmin(variances)]
+
+
+def refine_cylinder(points, center, axis, radius, iterations):
+    """Refine a cylinder with Gauss-Newton steps on its radial residuals.
+
+    The parameters are two offsets of the center and two tilts of the axis
+    (along a basis perpendicular to the axis), plus the radius. The
+    Jacobian is analytic, so each step is one pass over the points and a
+    5x5 solve. A step that doesn't lower the cost is halved (a few times)
+    before giving up.
+
+    :returns: A tuple (center, axis, radius)
+    """
+    def get_residuals(center, axis, radius):
+        offsets = points - center
+        heights = offsets @ axis
+        radial = offsets - heights[:, np.newaxis] * axis
+        distances = np.sqrt(np.einsum('ij,ij->i', radial, radial))
+        return heights, radial, distances, distances - radius
+
+    heights, radial, distances, residuals = get_residuals(center, axis, radius)
+    cost = np.mean(residuals ** 2)
+    for iteration in range(iterations):
+        u, v = perpendicular_basis(axis)
+        normals = radial / np.maximum(distances, 1e-300)[:, np.newaxis]
+        normals_u = normals @ u
+        normals_v = normals @ v
+        jacobian = np.column_stack((
+            -normals_u,
+            -normals_v,
+            -heights * normals_u,
+            -heights * normals_v,
+            -np.ones(len(points)),
+        ))
+        delta = np.linalg.lstsq(
+            jacobian.T @ jacobian,
+            -jacobian.T @ residuals,
+            rcond=None
+        )[0]
+
+        for halving in range(4):
+            new_center = center + u * delta[0] + v * delta[1]
+            new_axis = axis + u * delta[2] + v * delta[3]
+            new_axis /= np.linalg.norm(new_axis)
+            new_radius = radius + delta[4]
+            new_values = get_residuals(new_center, new_axis, new_radius)
+            new_cost = np.mean(new_values[3] ** 2)
+            if new_cost < cost:
+                break
+            delta /= 2
+        else:
+            break
+        converged = cost - new_cost < 1e-12 * max(cost, 1e-300)
+        center, axis, radius = new_center, new_axis, new_radius
+        heights, radial, distances, residuals = new_values
+        cost = new_cost
+        if converged:
+            break
+    return center, axis, radius
+
+
+# Cylinder fits iterate on a random subsample of at most this many points
+# (with one final step on all of them), a fit to millions of verts
+# stays interactive
+cylinder_sample_size = 50000
+
+
+def fit_cylinder(points, axis_guess=None, orient_to=None, iterations=20):
+    """Fit a cylinder (or a circle, for a single ring) to some points.
+
+    The axis starts from the best of the points' principal axes (and
+    axis_guess, e.g. from get_least_variance_axis on the selected face
+    normals), with a circle fit around it. The fit is then refined with
+    refine_cylinder, on a subsample of cylinder_sample_size points and
+    then one step on all of them. A planar ring of points ends up with
+    its plane normal as the axis.
+
+    :param points: An (n, 3) array, with n >= 3
+    :param axis_guess: An optional initial axis direction
+    :param orient_to: An optional vector, the axis is flipped to point
+        the same way (the sign of a fitted axis is arbitrary otherwise)
+    :returns: A CylinderFit, start and end bound the points along the
+        axis (for a planar ring, they span one radius from the center)
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) < 3:
+        raise maplus_except.InsufficientSelectionError()
+
+    samples = points
+    if len(points) > cylinder_sample_size:
+        samples = points[np.random.default_rng(0).choice(
+            len(points),
+            cylinder_sample_size,
+            replace=False
+        )]
+
+    centroid, axes, variances = principal_axes(samples)
+    candidates = list(axes)
+    if axis_guess is not None and np.linalg.norm(axis_guess) > 1e-12:
+        candidates.append(np.asarray(axis_guess) / np.linalg.norm(axis_guess))
+
+    best_cost = np.inf
+    for candidate in candidates:
+        circle = fit_circle_around_axis(samples, candidate, centroid)
+        if circle is None:
+            continue
+        cost = np.mean(circle[2] ** 2)
+        if cost < best_cost:
+            best_cost = cost
+            axis = candidate
+            center, radius = circle[:2]
+    if best_cost == np.inf:
+        raise maplus_except.InsufficientSelectionError()
+
+    center, axis, radius = refine_cylinder(
+        samples,
+        center,
+        axis,
+        radius,
+        iterations
+    )
+    if samples is not points:
+        center, axis, radius = refine_cylinder(
+            points,
+            center,
+            axis,
+            radius,
+            1
+        )
+
+    if orient_to is not None and np.dot(axis, orient_to) < 0:
+        axis = -axis
+    # Put the center level with the points' centroid
+    center = center + axis * ((points.mean(axis=0) - center) @ axis)
+    offsets = points - center
+    heights = offsets @ axis
+    distances = np.linalg.norm(offsets - np.outer(heights, axis), axis=1)
+    if heights.max() - heights.min() > 1e-9 * max(radius, 1.0):
+        start = center + axis * heights.min()
+        end = center + axis * heights.max()
+    else:
+        start = center
+        end = center + axis * radius
+    return CylinderFit(
+        center=center,
+        axis=axis,
+        radius=float(radius),
+        start=start,
+        end=end,
+        rms_residual=float(np.sqrt(np.mean((distances - radius) ** 2))),
+    )
+
+
+def fit_sphere(points):
+    """Fit a sphere to some points (algebraic least squares).
+
+    Solves 2 * c . p + k = |p|^2 through its 4x4 normal equations (a
+    single pass over the points), which is unbiased for partial spheres
+    (caps, hemispheres) unlike averaging the points.
+
+    :param points: An (n, 3) array, with n >= 4 non-coplanar points
+    :returns: A SphereFit, rms_residual is the RMS radial error
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) < 4:
+        raise maplus_except.InsufficientSelectionError()
+
+    offset = points.mean(axis=0)
+    centered = points - offset
+    design = np.column_stack((2 * centered, np.ones(len(centered))))
+    target = (centered * centered).sum(axis=1)
+    normal_matrix = design.T @ design
+    if np.linalg.cond(normal_matrix) > 1e12:
+        # Coplanar (or fewer distinct) points, no unique sphere
+        raise maplus_except.InsufficientSelectionError()
+    solution = np.linalg.solve(normal_matrix, design.T @ target)
+    center, k = solution[:3], solution[3]
+    radius_sq = k + center @ center
+    if radius_sq <= 0:
+        raise maplus_except.InsufficientSelectionError()
+
+    radius = np.sqrt(radius_sq)
+    residuals = np.linalg.norm(centered - center, axis=1) - radius
+    return SphereFit(
+        center=center + offset,
+        radius=float(radius),
+        rms_residual=float(np.sqrt(np.mean(residuals ** 2))),
+    )
@@ -7,8 +7,26 @@ import math
 import bmesh
 import bpy
 import mathutils
+import numpy as np
 
+from . import cache as maplus_cache
 from . import exceptions as maplus_except
+from . import fitting as maplus_fitting
+from . import spatial as maplus_spatial
+
+
+# Selection snapshots and active face data, per mesh datablock. Weighted
+# by selected vert count, to bound the memory held by cached coords
+selection_cache = maplus_cache.DatablockCache(
+    max_items=32,
+    max_weight=2000000
+)
+# Selection snapshots from evaluated (modifier applied) meshes, per
+# object, since the evaluated mesh depends on the object's modifiers
+evaluated_selection_cache = maplus_cache.DatablockCache(
+    max_items=16,
+    max_weight=2000000
+)
 
 
 def scalar_project(vec1, other):
@@ -41,6 +59,38 @@ def set_item_coords(item, coords_to_set, coords):
     return True
 
 
+class ItemOverride(object):
+    """A read-only view of a geometry item, with some attributes replaced.
+
+    Compute only operators read the item through it (e.g. with
+    get_modified_global_coords), so values like auto-grabbed coords are
+    used without writing them to the scene data.
+    """
+
+    def __init__(self, item, **overrides):
+        self.item = item
+        self.overrides = overrides
+
+    def __getattr__(self, name):
+        if name in self.overrides:
+            return self.overrides[name]
+        return getattr(self.item, name)
+
+
+def update_item(operator, item, values):
+    """Set attributes on an item, get the item to read them back from.
+
+    :param operator: The operator setting the values, compute only
+        operators leave the item as is and get an ItemOverride instead
+    :param values: A dict of attribute names (strings) to values
+    """
+    if getattr(operator, 'compute_only', False):
+        return ItemOverride(item, **values)
+    for key, val in values.items():
+        setattr(item, key, val)
+    return item
+
+
 def scale_mat_from_vec(vec):
     return (
         mathutils.Matrix.Scale(
@@ -77,6 +127,423 @@ def get_selected_objects_active_first():
     return result
 
 
+def get_selected_vert_data(mesh):
+    """Get the indices and local coords of a mesh's selected verts.
+
+    The vertex select flags and coordinates are read in bulk with
+    foreach_get and masked with numpy, so no bmesh copy is made and no
+    per-vert Python work is done.
+
+    :param mesh: A bpy.types.Mesh, its vertex data must be up to date
+        (synced with any edit mode changes)
+    :returns: A tuple (indices, coords), where indices is a sorted int
+        array of shape (n,) and coords is a float array of shape (n, 3)
+    """
+    vert_count = len(mesh.vertices)
+    select_mask = np.empty(vert_count, dtype=bool)
+    mesh.vertices.foreach_get('select', select_mask)
+    indices = np.flatnonzero(select_mask)
+    if not len(indices):
+        return indices, np.empty((0, 3))
+
+    coords = np.empty(vert_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    coords = coords.reshape((-1, 3))[indices].astype(np.float64)
+    return indices, coords
+
+
+def update_mesh_from_editmode(mesh_object):
+    """Write pending edit mode changes into the object's mesh data.
+
+    Replaces the old editmode_toggle() round trip: the edit-mesh is
+    loaded into the mesh data in place, without being freed, rebuilt
+    and re-tessellated, and the object's mode is never changed.
+    """
+    if mesh_object.data.is_editmode:
+        mesh_object.update_from_editmode()
+
+
+def get_readable_bmesh(mesh):
+    """Get a bmesh for reading a mesh's edit data (selection history etc.).
+
+    The live edit-mesh is returned as-is when the mesh is in edit mode
+    (no copy is made), otherwise a temporary bmesh is built from the mesh.
+
+    :returns: A tuple (bmesh, is_temporary), temporary bmeshes must be
+        freed by the caller
+    """
+    if mesh.is_editmode:
+        src_mesh = bmesh.from_edit_mesh(mesh)
+        src_mesh.verts.index_update()
+        src_mesh.faces.index_update()
+        return src_mesh, False
+
+    src_mesh = bmesh.new()
+    src_mesh.from_mesh(mesh)
+    return src_mesh, True
+
+
+def get_select_history_vert_indices(mesh):
+    """Get the vert indices in a mesh's selection history, oldest first.
+
+    Non-vert history items (edges, faces) contribute all of their verts.
+    The selection history is not exposed on bpy.types.Mesh, so it's read
+    from a bmesh (see get_readable_bmesh).
+    """
+    src_mesh, temporary_bmesh = get_readable_bmesh(mesh)
+
+    history_indices = []
+    seen_indices = set()
+    for element in src_mesh.select_history:
+        # Equivalent to select_history.validate(), without modifying
+        # the live edit-mesh
+        if not element.select:
+            continue
+        if type(element) == bmesh.types.BMVert:
+            history_verts = (element,)
+        else:
+            history_verts = element.verts
+        for vert in history_verts:
+            if vert.index not in seen_indices:
+                seen_indices.add(vert.index)
+                history_indices.append(vert.index)
+
+    if temporary_bmesh:
+        src_mesh.free()
+    return history_indices
+
+
+def transform_coords(coords, matrix):
+    """Multiply an (n, 3) coordinate array by a 4x4 matrix (vectorized)."""
+    matrix = np.array(matrix, dtype=np.float64)
+    return coords @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def transform_coords_batched(coords, matrices, matrix_rows):
+    """Multiply each row of an (n, 3) coordinate array by its own matrix.
+
+    :param matrices: A (k, 4, 4) array of matrices
+    :param matrix_rows: An (n,) int array, the index of the matrix to
+        use for each coord
+    :returns: An (n, 3) float array
+    """
+    matrices = np.asarray(matrices, dtype=np.float64)
+    linear_parts = matrices[:, :3, :3][matrix_rows]
+    translations = matrices[:, :3, 3][matrix_rows]
+    return np.einsum('nij,nj->ni', linear_parts, coords) + translations
+
+
+def get_vector_attribute_layers(mesh):
+    """Get a mesh's float vector point attributes, as foreach layers.
+
+    (The built-in position attribute and internal, "."-prefixed ones
+    are left out)
+
+    :returns: (collection, property name) pairs, for foreach_get/set
+    """
+    return [
+        (attribute.data, 'vector')
+        for attribute in mesh.attributes
+        if attribute.domain == 'POINT'
+        and attribute.data_type == 'FLOAT_VECTOR'
+        and attribute.name != 'position'
+        and not attribute.name.startswith('.')
+    ]
+
+
+def get_point_layers(mesh, vector_attributes=False):
+    """Get the mesh data layers holding per vert positions.
+
+    :param vector_attributes: Include the float vector point attributes
+        (see get_vector_attribute_layers)
+    :returns: (collection, property name) pairs, for foreach_get/set: the
+        vert coords, then every shape key's coords (and the attributes)
+    """
+    layers = [(mesh.vertices, 'co')]
+    if mesh.shape_keys is not None:
+        layers.extend(
+            (key_block.data, 'co')
+            for key_block in mesh.shape_keys.key_blocks
+        )
+    if vector_attributes:
+        layers.extend(get_vector_attribute_layers(mesh))
+    return layers
+
+
+def get_edit_point_layers(edit_mesh, vector_attributes=False):
+    """Get an edit-mesh's vert layers holding positions, besides the coords.
+
+    The shape key layers, and the float vector layers if
+    vector_attributes (see get_point_layers).
+    """
+    layers = list(edit_mesh.verts.layers.shape.values())
+    if vector_attributes:
+        layers.extend(
+            layer for layer in edit_mesh.verts.layers.float_vector.values()
+            if not layer.name.startswith('.')
+        )
+    return layers
+
+
+def read_point_layers(layers, vert_count):
+    """Read point layers (see get_point_layers) into one array.
+
+    :returns: A float32 array, shape (layer count, vert_count, 3)
+    """
+    coords = np.empty((len(layers), vert_count, 3), dtype=np.float32)
+    for layer_coords, (collection, prop) in zip(coords, layers):
+        collection.foreach_get(prop, layer_coords.reshape(-1))
+    return coords
+
+
+def write_point_layers(layers, coords):
+    """Write an array from read_point_layers back to its layers."""
+    for layer_coords, (collection, prop) in zip(coords, layers):
+        collection.foreach_set(prop, layer_coords.reshape(-1))
+
+
+class SelectionSnapshot(object):
+    """The selected verts of a mesh, as extracted at one point in time.
+
+    indices and coords are the (read-only) arrays from
+    get_selected_vert_data, order holds the rows of those arrays in
+    selection order (history first, the first history_count rows), it's
+    filled in on first use by get_selection_snapshot since it needs a
+    bmesh.
+    """
+    __slots__ = ('indices', 'coords', 'order', 'history_count', 'stamp')
+
+    def __init__(self, indices, coords, stamp):
+        indices.flags.writeable = False
+        coords.flags.writeable = False
+        self.indices = indices
+        self.coords = coords
+        self.order = None
+        self.history_count = 0
+        self.stamp = stamp
+
+
+def get_mesh_cache_stamp(mesh):
+    """Cheap sanity check for cached mesh data, on top of depsgraph invalidation."""
+    return (len(mesh.vertices), mesh.is_editmode)
+
+
+def get_selection_order(indices, history):
+    """Get the rows of the sorted selected vert indices in selection order.
+
+    Rows for verts in the selection history come first (in history
+    order), followed by the rest of the rows in index order.
+
+    :returns: A tuple (order, history_count)
+    """
+    history = np.array(history, dtype=indices.dtype)
+    # Map history vert indices to rows in the selected data (the
+    # selected indices are sorted, so a binary search is enough)
+    history_rows = np.searchsorted(indices, history)
+    found = history_rows < len(indices)
+    found[found] = indices[history_rows[found]] == history[found]
+    history_rows = history_rows[found]
+    remaining = np.ones(len(indices), dtype=bool)
+    remaining[history_rows] = False
+    return (
+        np.concatenate((history_rows, np.flatnonzero(remaining))),
+        len(history_rows)
+    )
+
+
+def use_evaluated_geometry():
+    """Whether grabs should read evaluated (modifier applied) geometry."""
+    return bpy.context.scene.maplus_data.grab_from_evaluated
+
+
+def get_evaluated_mesh(mesh_object):
+    """Get the evaluated (modifier applied) mesh of a mesh object.
+
+    The depsgraph is already evaluated for display, so this is a lookup,
+    not a re-evaluation of the modifier stack.
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    return mesh_object.evaluated_get(depsgraph).data
+
+
+def get_evaluated_selection_snapshot(mesh_object):
+    """Get the (cached) selection snapshot for an object's evaluated mesh.
+
+    Cached per object, and dropped when the depsgraph reports the object
+    as updated (its mesh, modifiers or modifier dependencies changed).
+    Evaluated verts have no selection history, so their order is simply
+    index order (modifiers like mirror and array keep the original verts
+    first).
+    """
+    snapshot = evaluated_selection_cache.get(mesh_object.session_uid, 'verts')
+    if snapshot is None:
+        indices, coords = get_selected_vert_data(
+            get_evaluated_mesh(mesh_object)
+        )
+        snapshot = SelectionSnapshot(indices, coords, None)
+        snapshot.order = np.arange(len(indices))
+        evaluated_selection_cache.set(
+            mesh_object.session_uid,
+            snapshot,
+            kind='verts',
+            weight=max(len(indices), 1)
+        )
+    return snapshot
+
+
+def get_selection_snapshot(mesh_object, with_order=False, evaluated=None):
+    """Get the (cached) selection snapshot for a mesh object's mesh.
+
+    Snapshots are shared by every selection reader in this module, and
+    stay valid until the depsgraph reports the mesh as updated (edits,
+    selection changes, undo, mode switches...). On a cache hit nothing
+    is read from the mesh at all, not even pending edit mode changes,
+    since there can't be any.
+
+    :param mesh_object: A mesh object
+    :param with_order: Make sure snapshot.order is available (the
+        selection history is only read when more than one vert is
+        selected, since the order doesn't matter otherwise)
+    :param evaluated: Read the evaluated (modifier applied) mesh instead
+        of the base mesh, defaults to the addon's grab setting
+    :returns: A SelectionSnapshot
+    """
+    if evaluated is None:
+        evaluated = use_evaluated_geometry()
+    if evaluated:
+        return get_evaluated_selection_snapshot(mesh_object)
+
+    mesh = mesh_object.data
+    snapshot = selection_cache.get(mesh.session_uid, 'verts')
+    if snapshot is None or snapshot.stamp != get_mesh_cache_stamp(mesh):
+        # We could already be in edit mode with some stale
+        # updates, load them into the mesh data first
+        update_mesh_from_editmode(mesh_object)
+        indices, coords = get_selected_vert_data(mesh)
+        snapshot = SelectionSnapshot(
+            indices,
+            coords,
+            get_mesh_cache_stamp(mesh)
+        )
+        selection_cache.set(
+            mesh.session_uid,
+            snapshot,
+            kind='verts',
+            weight=max(len(indices), 1)
+        )
+
+    if with_order and snapshot.order is None:
+        if len(snapshot.indices) > 1:
+            snapshot.order, snapshot.history_count = get_selection_order(
+                snapshot.indices,
+                get_select_history_vert_indices(mesh)
+            )
+        else:
+            # A lone selected vert is as good as a history entry
+            snapshot.order = np.arange(len(snapshot.indices))
+            snapshot.history_count = len(snapshot.indices)
+    return snapshot
+
+
+def return_batched_selected_coords(mesh_objects,
+                                   max_verts=None,
+                                   use_world_matrix=False,
+                                   ordered=True):
+    """Get the selected vert coords from several mesh objects in one pass.
+
+    Meant for multi-object edit mode: the (cached) selection snapshots
+    are gathered into one array, and transformed by each object's own
+    world matrix with a single vectorized multiply. In edit mode, only
+    the objects in edit mode are grabbed from.
+
+    When ordered, selection history verts from all objects come first
+    (active object first, each in history order), followed by the rest
+    of the selected verts, so a vert picked on another object still
+    beats box-selected verts on the active one. Snapshots are only read
+    until max_verts coords are gathered: objects after that are skipped,
+    but when the history verts fall short, every object's history is
+    read before any of the other selected verts are taken.
+
+    :param mesh_objects: Objects to grab from, all must be meshes
+    :param max_verts: The maximum number of coords to return, or None
+    :param use_world_matrix: Return global coords instead of local coords
+    :param ordered: Return coords in selection order (reads the
+        selection history), otherwise in index order
+    :returns: An (n, 3) float array
+    """
+    for mesh_object in mesh_objects:
+        if type(mesh_object.data) != bpy.types.Mesh:
+            raise maplus_except.NonMeshGrabError(mesh_object)
+    if bpy.context.mode == 'EDIT_MESH':
+        mesh_objects = [
+            mesh_object
+            for mesh_object in mesh_objects
+            if mesh_object.mode == 'EDIT'
+        ]
+
+    if ordered:
+        # Each snapshot's order is split at its history_count, the
+        # history rows of all objects are taken before any of the rest
+        row_passes = (
+            lambda snapshot: snapshot.order[:snapshot.history_count],
+            lambda snapshot: snapshot.order[snapshot.history_count:],
+        )
+    else:
+        row_passes = (lambda snapshot: slice(None),)
+
+    snapshots = {}
+    coord_arrays = []
+    object_rows = []
+    remaining = max_verts
+    for get_rows in row_passes:
+        for object_index, mesh_object in enumerate(mesh_objects):
+            if remaining is not None and remaining <= 0:
+                break
+            if object_index not in snapshots:
+                snapshots[object_index] = get_selection_snapshot(
+                    mesh_object,
+                    with_order=ordered
+                )
+            snapshot = snapshots[object_index]
+            coords = snapshot.coords[get_rows(snapshot)]
+            if remaining is not None:
+                coords = coords[:remaining]
+                remaining -= len(coords)
+            coord_arrays.append(coords)
+            object_rows.append(np.full(len(coords), object_index))
+
+    if not coord_arrays:
+        return np.empty((0, 3))
+    coords = np.concatenate(coord_arrays)
+    if use_world_matrix:
+        coords = transform_coords_batched(
+            coords,
+            [mesh_object.matrix_world for mesh_object in mesh_objects],
+            np.concatenate(object_rows)
+        )
+    return coords
+
+
+def return_selected_coords_array(mesh_objects, use_world_matrix=True):
+    """Get the selected vert coords from several mesh objects, as one array.
+
+    For fits and other whole-selection grabs, where order doesn't matter
+    and building a mathutils.Vector per vert would dominate the runtime.
+
+    :param mesh_objects: Objects to grab from, all must be meshes
+    :param use_world_matrix: Return global coords (each object's coords
+        multiplied by its own world matrix) instead of local coords
+    :returns: An (n, 3) float array
+    """
+    if not mesh_objects:
+        raise maplus_except.NonMeshGrabError(mesh_objects)
+    return return_batched_selected_coords(
+        mesh_objects,
+        use_world_matrix=use_world_matrix,
+        ordered=False
+    )
+
+
 def return_selected_verts(source_data,
                           verts_to_grab,
                           global_matrix_multiplier=None):
@@ -104,67 +571,15 @@ def return_selected_verts(source_data,
     if len(non_mesh_objects) == len(source_objects):
         raise maplus_except.NonMeshGrabError()
 
-    selected_verts = []
-
-    # Check each mesh for selected verts
-    for mesh_object in mesh_objects:
-
-        # Stop checking if we have enough verts already
-        if len(selected_verts) == verts_to_grab:
-            break
-
-        # Todo, check for a better way to handle/if this is needed
-        # We could already be in edit mode with some stale
-        # updates, exiting and reentering forces an update
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
-
-        # Init source mesh
-        src_mesh = bmesh.new()
-        src_mesh.from_mesh(mesh_object.data)
-        src_mesh.select_history.validate()
-
-        # Get verts from the selection history first, because
-        # we want the most recently selected verts to go first
-        # in the selected_verts result
-        vert_indices = set()
-        for element in src_mesh.select_history:
-            if len(selected_verts) == verts_to_grab:
-                # Stop looking for verts if we already have enough to return results
-                break
-            # Selection history can contain verts, faces, etc
-            if type(element) == bmesh.types.BMVert:
-                if not (element.index in vert_indices):
-                    coords = element.co
-                    if global_matrix_multiplier:
-                        coords = mesh_object.matrix_world @ coords
-
-                    selected_verts.append(coords)
-                    vert_indices.add(element.index)
-            else:
-                # This history item is a non-vert (face, edge, etc)
-                for vert in element.verts:
-                    # Go through this item's verts and save them
-                    if len(selected_verts) == verts_to_grab:
-                        break
-                    if not (vert.index in vert_indices):
-                        coords = vert.co
-                        if global_matrix_multiplier:
-                            coords = mesh_object.matrix_world @ coords
-
-                        selected_verts.append(coords)
-                        vert_indices.add(vert.index)
-
-        # Check non-history selected verts next (could be from box/circle selection, etc)
-        for vert in (v for v in src_mesh.verts if v.select):
-            if len(selected_verts) == verts_to_grab:
-                break
-            coords = vert.co
-            if global_matrix_multiplier:
-                coords = global_matrix_multiplier @ coords
-            if not (vert.index in vert_indices):
-                vert_indices.add(vert.index)
-                selected_verts.append(coords)
+    # Grab from all meshes at once (multi-object edit mode)
+    selected_verts = [
+        mathutils.Vector(co)
+        for co in return_batched_selected_coords(
+            mesh_objects,
+            verts_to_grab,
+            bool(global_matrix_multiplier)
+        )
+    ]
 
     if len(selected_verts) == verts_to_grab:
         return selected_verts
@@ -172,48 +587,100 @@ def return_selected_verts(source_data,
         raise maplus_except.InsufficientSelectionError()
 
 
-def return_normal_coords(mesh_object,
-                         global_matrix_multiplier=None):
-    if type(mesh_object.data) == bpy.types.Mesh:
+def get_active_face_data(mesh):
+    """Get the (cached) local center and normal of a mesh's active face.
 
-        # Todo, check for a better way to handle/if this is needed
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+    The active face is the first face in the selection history, or the
+    first selected face if there's none in the history. Shares the
+    selection cache (and its invalidation) with get_selection_snapshot.
 
-        # Init source mesh
-        src_mesh = bmesh.new()
-        src_mesh.from_mesh(mesh_object.data)
-        src_mesh.select_history.validate()
+    :returns: A tuple (center, normal) of mathutils.Vector (shared with
+        the cache, don't modify them in place), or None if no faces are
+        selected
+    """
+    stamp = get_mesh_cache_stamp(mesh)
+    cached = selection_cache.get(mesh.session_uid, 'active_face')
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    # Read from the live edit-mesh when in edit mode (always current,
+    # no copy), otherwise from a temporary bmesh
+    src_mesh, temporary_bmesh = get_readable_bmesh(mesh)
+
+    active_face = None
+    for element in src_mesh.select_history:
+        if type(element) == bmesh.types.BMFace and element.select:
+            active_face = element
+            break
 
-        face_elems = []
-        face_indices = []
-        normal = []
-        for element in src_mesh.select_history:
-            if type(element) == bmesh.types.BMFace:
-                face_elems.append(element)
-                face_indices.append(element.index)
-                break
+    if active_face is None:
+        active_face = next((f for f in src_mesh.faces if f.select), None)
 
-        for face in (f for f in src_mesh.faces if f.select):
-            if not (face.index in face_indices):
-                face_elems.append(face)
-                break
+    face_data = None
+    if active_face is not None:
+        face_data = (
+            active_face.calc_center_median(),
+            active_face.normal.copy()
+        )
+    if temporary_bmesh:
+        src_mesh.free()
 
-        if not face_elems:
+    selection_cache.set(
+        mesh.session_uid,
+        (stamp, face_data),
+        kind='active_face'
+    )
+    return face_data
+
+
+def get_evaluated_active_face_data(mesh_object):
+    """Get the local center and normal of the evaluated mesh's active face.
+
+    Evaluated faces have no selection history, so the active face is the
+    first selected face in index order (like get_selected_face_order).
+    Read from the (cached) get_selected_face_data arrays.
+
+    :returns: A tuple (center, normal) of mathutils.Vector, or None if no
+        faces are selected
+    """
+    centers, normals, areas = get_selected_face_data(
+        mesh_object,
+        evaluated=True
+    )
+    if not len(areas):
+        return None
+    return mathutils.Vector(centers[0]), mathutils.Vector(normals[0])
+
+
+def return_normal_coords(mesh_object,
+                         global_matrix_multiplier=None,
+                         evaluated=None):
+    if type(mesh_object.data) == bpy.types.Mesh:
+
+        if evaluated is None:
+            evaluated = use_evaluated_geometry()
+        if evaluated:
+            active_face = get_evaluated_active_face_data(mesh_object)
+        else:
+            active_face = get_active_face_data(mesh_object.data)
+        if active_face is None:
             # Todo, make proper exception or modify old
             raise maplus_except.InsufficientSelectionError()
+        face_center, face_normal = active_face
+        normal = []
+
         if global_matrix_multiplier:
             face_normal_origin = (
                 global_matrix_multiplier @
-                face_elems[0].calc_center_median()
+                face_center
             )
             face_normal_endpoint = (
                 global_matrix_multiplier @
-                (face_elems[0].calc_center_median() + face_elems[0].normal)
+                (face_center + face_normal)
             )
         else:
-            face_normal_origin = face_elems[0].calc_center_median()
-            face_normal_endpoint = face_normal_origin + face_elems[0].normal
+            face_normal_origin = face_center.copy()
+            face_normal_endpoint = face_normal_origin + face_normal
 
         normal.extend(
             [face_normal_origin,
@@ -225,41 +692,388 @@ def return_normal_coords(mesh_object,
         raise maplus_except.NonMeshGrabError(mesh_object)
 
 
+def read_selected_face_arrays(mesh):
+    """Read the centers, normals and areas of a mesh's selected faces.
+
+    :returns: A tuple of read-only float arrays, see get_selected_face_data
+    """
+    face_count = len(mesh.polygons)
+    select_mask = np.empty(face_count, dtype=bool)
+    mesh.polygons.foreach_get('select', select_mask)
+    face_data = []
+    for attrib, width in (('center', 3), ('normal', 3), ('area', 1)):
+        values = np.empty(face_count * width, dtype=np.float32)
+        mesh.polygons.foreach_get(attrib, values)
+        if width > 1:
+            values = values.reshape((-1, width))
+        values = values[select_mask].astype(np.float64)
+        values.flags.writeable = False
+        face_data.append(values)
+    return tuple(face_data)
+
+
+def get_selected_face_data(mesh_object, evaluated=None):
+    """Get the (cached) centers, normals and areas of the selected faces.
+
+    Read in bulk with foreach_get from Mesh.polygons, and shares the
+    selection caches (and their invalidation) with get_selection_snapshot.
+
+    :param evaluated: Read the evaluated (modifier applied) mesh instead
+        of the base mesh, defaults to the addon's grab setting
+    :returns: A tuple (centers, normals, areas) of read-only arrays with
+        shapes (n, 3), (n, 3) and (n,), in local space
+    """
+    if evaluated is None:
+        evaluated = use_evaluated_geometry()
+    if evaluated:
+        face_data = evaluated_selection_cache.get(
+            mesh_object.session_uid,
+            'faces'
+        )
+        if face_data is None:
+            face_data = read_selected_face_arrays(
+                get_evaluated_mesh(mesh_object)
+            )
+            evaluated_selection_cache.set(
+                mesh_object.session_uid,
+                face_data,
+                kind='faces',
+                weight=max(len(face_data[2]), 1)
+            )
+        return face_data
+
+    mesh = mesh_object.data
+    cached = selection_cache.get(mesh.session_uid, 'faces')
+    if cached is not None and cached[0] == get_mesh_cache_stamp(mesh):
+        return cached[1]
+
+    update_mesh_from_editmode(mesh_object)
+    face_data = read_selected_face_arrays(mesh)
+    selection_cache.set(
+        mesh.session_uid,
+        (get_mesh_cache_stamp(mesh), face_data),
+        kind='faces',
+        weight=max(len(face_data[2]), 1)
+    )
+    return face_data
+
+
+def read_selected_edge_arrays(mesh):
+    """Read the end points of a mesh's selected edges.
+
+    :returns: A tuple (starts, ends) of read-only (n, 3) float arrays,
+        in local space
+    """
+    edge_count = len(mesh.edges)
+    select_mask = np.empty(edge_count, dtype=bool)
+    mesh.edges.foreach_get('select', select_mask)
+    edge_verts = np.empty(edge_count * 2, dtype=np.int32)
+    mesh.edges.foreach_get('vertices', edge_verts)
+    edge_verts = edge_verts.reshape((-1, 2))[select_mask]
+
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    coords = coords.reshape((-1, 3))
+    edge_data = []
+    for column in (0, 1):
+        values = coords[edge_verts[:, column]].astype(np.float64)
+        values.flags.writeable = False
+        edge_data.append(values)
+    return tuple(edge_data)
+
+
+def get_selected_edge_data(mesh_object, evaluated=None):
+    """Get the (cached) end points of the selected edges.
+
+    Read in bulk with foreach_get from Mesh.edges, and shares the
+    selection caches (and their invalidation) with get_selection_snapshot.
+
+    :param evaluated: Read the evaluated (modifier applied) mesh instead
+        of the base mesh, defaults to the addon's grab setting
+    :returns: A tuple (starts, ends) of read-only (n, 3) float arrays,
+        in local space
+    """
+    if evaluated is None:
+        evaluated = use_evaluated_geometry()
+    if evaluated:
+        edge_data = evaluated_selection_cache.get(
+            mesh_object.session_uid,
+            'edges'
+        )
+        if edge_data is None:
+            edge_data = read_selected_edge_arrays(
+                get_evaluated_mesh(mesh_object)
+            )
+            evaluated_selection_cache.set(
+                mesh_object.session_uid,
+                edge_data,
+                kind='edges',
+                weight=max(len(edge_data[0]), 1)
+            )
+        return edge_data
+
+    mesh = mesh_object.data
+    cached = selection_cache.get(mesh.session_uid, 'edges')
+    if cached is not None and cached[0] == get_mesh_cache_stamp(mesh):
+        return cached[1]
+
+    update_mesh_from_editmode(mesh_object)
+    edge_data = read_selected_edge_arrays(mesh)
+    selection_cache.set(
+        mesh.session_uid,
+        (get_mesh_cache_stamp(mesh), edge_data),
+        kind='edges',
+        weight=max(len(edge_data[0]), 1)
+    )
+    return edge_data
+
+
+def get_selected_face_order(mesh_object):
+    """Get the rows of the selected face data in selection order.
+
+    Faces from the selection history come first (oldest first), followed
+    by the other selected faces in index order. Evaluated meshes have no
+    selection history, so their faces are in index order.
+    """
+    face_count = len(get_selected_face_data(mesh_object)[2])
+    if face_count < 2 or use_evaluated_geometry():
+        return np.arange(face_count)
+
+    mesh = mesh_object.data
+    select_mask = np.empty(len(mesh.polygons), dtype=bool)
+    mesh.polygons.foreach_get('select', select_mask)
+    src_mesh, temporary_bmesh = get_readable_bmesh(mesh)
+    history = [
+        element.index for element in src_mesh.select_history
+        if type(element) == bmesh.types.BMFace and element.select
+    ]
+    if temporary_bmesh:
+        src_mesh.free()
+    return get_selection_order(np.flatnonzero(select_mask), history)[0]
+
+
+def get_cofactor_matrix(matrix):
+    """Get the cofactor matrix of a transform's 3x3 part, as an array.
+
+    The cofactor matrix maps local face normals times areas (vector
+    areas) to transformed ones, so it gives both the transformed
+    normals and how the transform scales each face's area.
+
+    :returns: A 3x3 float array, or None for degenerate transforms
+    """
+    linear_part = np.array(matrix.to_3x3(), dtype=np.float64)
+    determinant = np.linalg.det(linear_part)
+    if abs(determinant) < 1e-12:
+        return None
+    return determinant * np.linalg.inv(linear_part).T
+
+
+def get_area_weighted_center(centers,
+                             normals,
+                             areas,
+                             global_matrix_multiplier=None):
+    """Get the area weighted centroid of some faces, as a mathutils.Vector.
+
+    For global coords, faces are weighted by their transformed areas.
+    """
+    if global_matrix_multiplier:
+        cofactor = get_cofactor_matrix(global_matrix_multiplier)
+        if cofactor is not None:
+            areas = areas * np.linalg.norm(normals @ cofactor.T, axis=1)
+    total_area = areas.sum()
+    if total_area > 0:
+        center = (centers * areas[:, None]).sum(axis=0) / total_area
+    else:
+        # Degenerate (zero area) faces only
+        center = centers.mean(axis=0)
+    center = mathutils.Vector(center)
+    if global_matrix_multiplier:
+        center = global_matrix_multiplier @ center
+    return center
+
+
+def return_avg_normal_coords(mesh_object,
+                             global_matrix_multiplier=None):
+    """Get an area weighted average normal for all selected faces.
+
+    Meant for noisy surfaces (scans etc.) where a single face normal is
+    unreliable. The normal is the normalized sum of the face normals
+    times their areas, starting from the area weighted centroid.
+
+    :returns: A list of two mathutils.Vector, the start and end of a
+        unit length normal line
+    """
+    if type(mesh_object.data) == bpy.types.Mesh:
+        centers, normals, areas = get_selected_face_data(mesh_object)
+        if not len(areas):
+            raise maplus_except.InsufficientSelectionError()
+
+        normal = (normals * areas[:, None]).sum(axis=0)
+        if global_matrix_multiplier:
+            cofactor = get_cofactor_matrix(global_matrix_multiplier)
+            if cofactor is None:
+                raise maplus_except.InsufficientSelectionError()
+            normal = cofactor @ normal
+        normal_length = np.linalg.norm(normal)
+        if normal_length < 1e-12:
+            # Opposing faces cancel out, there's no meaningful normal
+            raise maplus_except.InsufficientSelectionError()
+        normal = mathutils.Vector(normal / normal_length)
+
+        face_normal_origin = get_area_weighted_center(
+            centers,
+            normals,
+            areas,
+            global_matrix_multiplier
+        )
+        return [face_normal_origin, face_normal_origin + normal]
+
+    else:
+        raise maplus_except.NonMeshGrabError(mesh_object)
+
+
 def return_avg_vert_pos(mesh_object,
-                        global_matrix_multiplier=None):
+                        global_matrix_multiplier=None,
+                        center_mode='AVERAGE'):
+    """Get the center of the selected geometry on a mesh object.
+
+    :param center_mode: One of 'AVERAGE' (mean of the selected verts),
+        'MEDIAN' (per-axis median of the selected verts), 'BOUNDS'
+        (bounding box center of the selected verts) or 'AREA_WEIGHTED'
+        (face area weighted centroid of the selected faces)
+    :returns: A list holding the center, as a mathutils.Vector
+    """
     if type(mesh_object.data) == bpy.types.Mesh:
 
-        # Todo, check for a better way to handle/if this is needed
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        if center_mode == 'AREA_WEIGHTED':
+            centers, normals, areas = get_selected_face_data(mesh_object)
+            if not len(areas):
+                raise maplus_except.InsufficientSelectionError()
+            return [
+                get_area_weighted_center(
+                    centers,
+                    normals,
+                    areas,
+                    global_matrix_multiplier
+                )
+            ]
 
-        # Init source mesh
-        src_mesh = bmesh.new()
-        src_mesh.from_mesh(mesh_object.data)
+        snapshot = get_selection_snapshot(mesh_object)
+        if not len(snapshot.indices):
+            raise maplus_except.InsufficientSelectionError()
 
-        selection = []
-        vert_indices = []
-        # for vert in (v for v in src_mesh.verts if v.select):
-        for vert in (v for v in src_mesh.verts if v.select):
-            coords = vert.co
+        if center_mode == 'AVERAGE':
+            # The mean is affine invariant, transform the result only
+            average_position = mathutils.Vector(snapshot.coords.mean(axis=0))
             if global_matrix_multiplier:
-                coords = global_matrix_multiplier @ coords
-            if not (vert.index in vert_indices):
-                vert_indices.append(vert.index)
-                selection.append(coords)
-
-        if len(selection) > 0:
-            average_position = mathutils.Vector((0, 0, 0))
-            for item in selection:
-                average_position += item
-            average_position /= len(selection)
+                average_position = global_matrix_multiplier @ average_position
             return [average_position]
+
+        # The median and bounds depend on the axes, so they're taken
+        # in the output space
+        coords = snapshot.coords
+        if global_matrix_multiplier:
+            coords = transform_coords(coords, global_matrix_multiplier)
+        if center_mode == 'MEDIAN':
+            center = np.median(coords, axis=0)
         else:
-            raise maplus_except.InsufficientSelectionError()
+            center = (coords.min(axis=0) + coords.max(axis=0)) / 2
+        return [mathutils.Vector(center)]
+
     else:
         raise maplus_except.NonMeshGrabError(mesh_object)
 
 
+def return_element_coords(mesh_objects, element_mode):
+    """Get global coords derived from selected edges or faces.
+
+    Computed in bulk from the selected edges/faces of all of the given
+    mesh objects (active object first).
+
+    :param element_mode: One of 'EDGE_MIDPOINT' (the average midpoint of
+        the selected edges), 'FACE_CENTER' (the average center of the
+        selected faces), 'EDGE_DIRECTION' (a line along the selected
+        edges, through their average midpoint, with their average
+        length) or 'FACE_CENTERS' (a line from the first selected face
+        center to the last one, in selection order)
+    :returns: A list of mathutils.Vector, one for point modes and two
+        for line modes
+    """
+    for mesh_object in mesh_objects:
+        if type(mesh_object.data) != bpy.types.Mesh:
+            raise maplus_except.NonMeshGrabError(mesh_object)
+    if not mesh_objects:
+        raise maplus_except.NonMeshGrabError(mesh_objects)
+    matrices = [mesh_object.matrix_world for mesh_object in mesh_objects]
+
+    if element_mode in {'EDGE_MIDPOINT', 'EDGE_DIRECTION'}:
+        edge_data = [
+            get_selected_edge_data(mesh_object)
+            for mesh_object in mesh_objects
+        ]
+        object_rows = np.concatenate([
+            np.full(len(starts), object_index)
+            for object_index, (starts, ends) in enumerate(edge_data)
+        ])
+        if not len(object_rows):
+            raise maplus_except.InsufficientSelectionError()
+        starts = transform_coords_batched(
+            np.concatenate([starts for starts, ends in edge_data]),
+            matrices,
+            object_rows
+        )
+        ends = transform_coords_batched(
+            np.concatenate([ends for starts, ends in edge_data]),
+            matrices,
+            object_rows
+        )
+        midpoint = ((starts + ends) / 2).mean(axis=0)
+        if element_mode == 'EDGE_MIDPOINT':
+            return [mathutils.Vector(midpoint)]
+
+        # Flip edges to run the same way as the first one before
+        # averaging their directions
+        directions = ends - starts
+        flip = np.where(directions @ directions[0] < 0, -1.0, 1.0)
+        directions *= flip[:, None]
+        direction = directions.sum(axis=0)
+        if np.linalg.norm(direction) < 1e-12:
+            raise maplus_except.InsufficientSelectionError()
+        direction /= np.linalg.norm(direction)
+        half_length = np.linalg.norm(directions, axis=1).mean() / 2
+        return [
+            mathutils.Vector(midpoint - direction * half_length),
+            mathutils.Vector(midpoint + direction * half_length),
+        ]
+
+    face_centers = []
+    for mesh_object in mesh_objects:
+        centers = get_selected_face_data(mesh_object)[0]
+        if element_mode == 'FACE_CENTERS':
+            centers = centers[get_selected_face_order(mesh_object)]
+        face_centers.append(centers)
+    object_rows = np.concatenate([
+        np.full(len(centers), object_index)
+        for object_index, centers in enumerate(face_centers)
+    ])
+    if not len(object_rows):
+        raise maplus_except.InsufficientSelectionError()
+    face_centers = transform_coords_batched(
+        np.concatenate(face_centers),
+        matrices,
+        object_rows
+    )
+    if element_mode == 'FACE_CENTER':
+        return [mathutils.Vector(face_centers.mean(axis=0))]
+
+    if len(face_centers) < 2:
+        raise maplus_except.InsufficientSelectionError()
+    return [
+        mathutils.Vector(face_centers[0]),
+        mathutils.Vector(face_centers[-1]),
+    ]
+
+
 # For the ambiguous "internal storage slots", which can be any geom type in
 # [POINT, LINE, PLANE]. Must return at least 1 selected vert (for a point).
 def return_at_least_one_selected_vert(source_data,
@@ -279,67 +1093,15 @@ def return_at_least_one_selected_vert(source_data,
     if len(non_mesh_objects) == len(source_objects):
         raise maplus_except.NonMeshGrabError()
 
-    selected_verts = []
-
-    # Check each mesh for selected verts
-    for mesh_object in mesh_objects:
-
-        # Stop checking if we have enough verts already
-        if len(selected_verts) == 3:
-            break
-
-        # Todo, check for a better way to handle/if this is needed
-        # We could already be in edit mode with some stale
-        # updates, exiting and reentering forces an update
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
-
-        # Init source mesh
-        src_mesh = bmesh.new()
-        src_mesh.from_mesh(mesh_object.data)
-        src_mesh.select_history.validate()
-
-        # Get verts from the selection history first, because
-        # we want the most recently selected verts to go first
-        # in the selected_verts result
-        vert_indices = set()
-        for element in src_mesh.select_history:
-            if len(selected_verts) == 3:
-                # Stop looking for verts if we already have enough to return results
-                break
-            # Selection history can contain verts, faces, etc
-            if type(element) == bmesh.types.BMVert:
-                if not (element.index in vert_indices):
-                    coords = element.co
-                    if global_matrix_multiplier:
-                        coords = mesh_object.matrix_world @ coords
-
-                    selected_verts.append(coords)
-                    vert_indices.add(element.index)
-            else:
-                # This history item is a non-vert (face, edge, etc)
-                for vert in element.verts:
-                    # Go through this item's verts and save them
-                    if len(selected_verts) == 3:
-                        break
-                    if not (vert.index in vert_indices):
-                        coords = vert.co
-                        if global_matrix_multiplier:
-                            coords = mesh_object.matrix_world @ coords
-
-                        selected_verts.append(coords)
-                        vert_indices.add(vert.index)
-
-        # Check non-history selected verts next (could be from box/circle selection, etc)
-        for vert in (v for v in src_mesh.verts if v.select):
-            if len(selected_verts) == 3:
-                break
-            coords = vert.co
-            if global_matrix_multiplier:
-                coords = global_matrix_multiplier @ coords
-            if not (vert.index in vert_indices):
-                vert_indices.add(vert.index)
-                selected_verts.append(coords)
+    # Grab from all meshes at once (multi-object edit mode)
+    selected_verts = [
+        mathutils.Vector(co)
+        for co in return_batched_selected_coords(
+            mesh_objects,
+            3,
+            bool(global_matrix_multiplier)
+        )
+    ]
 
     if len(selected_verts) > 0:
         return selected_verts
@@ -557,6 +1319,17 @@ class MAPLUS_OT_GrabAverageLocationBase(bpy.types.Operator):
     # primitive (point, line or plane item). The length of this tuple
     # determines how many verts will be grabbed.
     vert_attribs_to_set = None
+    center_mode: bpy.props.EnumProperty(
+        items=[
+            ('AVERAGE', 'Average', 'The average position of the selected verts'),
+            ('MEDIAN', 'Median', 'The median position (per axis) of the selected verts'),
+            ('BOUNDS', 'Bounds Center', 'The center of the bounding box of the selected verts'),
+            ('AREA_WEIGHTED', 'Area Weighted', 'The area weighted centroid of the selected faces'),
+        ],
+        name="Center",
+        default='AVERAGE',
+        description="How to find the center of the selected geometry"
+    )
 
     def execute(self, context):
         addon_data = bpy.context.scene.maplus_data
@@ -608,10 +1381,14 @@ class MAPLUS_OT_GrabAverageLocationBase(bpy.types.Operator):
         try:
             vert_data = return_avg_vert_pos(
                 get_active_object(),
-                matrix_multiplier
+                matrix_multiplier,
+                self.center_mode
             )
         except maplus_except.InsufficientSelectionError:
-            self.report({'ERROR'}, 'Not enough vertices selected.')
+            if self.center_mode == 'AREA_WEIGHTED':
+                self.report({'ERROR'}, 'No faces selected.')
+            else:
+                self.report({'ERROR'}, 'Not enough vertices selected.')
             return {'CANCELLED'}
         except maplus_except.NonMeshGrabError:
             self.report(
@@ -638,6 +1415,15 @@ class MAPLUS_OT_GrabNormalBase(bpy.types.Operator):
     # primitive (point, line or plane item). The length of this tuple
     # determines how many verts will be grabbed.
     vert_attribs_to_set = None
+    normal_mode: bpy.props.EnumProperty(
+        items=[
+            ('ACTIVE', 'Active Face', 'The normal of the active (or first selected) face'),
+            ('AREA_WEIGHTED', 'Area Weighted', 'The area weighted average normal of all selected faces'),
+        ],
+        name="Normal",
+        default='ACTIVE',
+        description="Which face(s) to take the normal from"
+    )
 
     def execute(self, context):
         addon_data = bpy.context.scene.maplus_data
@@ -672,15 +1458,28 @@ class MAPLUS_OT_GrabNormalBase(bpy.types.Operator):
         if self.multiply_by_world_matrix:
             matrix_multiplier = get_active_object().matrix_world
         try:
-            vert_data = return_normal_coords(
-                get_active_object(),
-                matrix_multiplier
-            )
+            if self.normal_mode == 'AREA_WEIGHTED':
+                vert_data = return_avg_normal_coords(
+                    get_active_object(),
+                    matrix_multiplier
+                )
+            else:
+                vert_data = return_normal_coords(
+                    get_active_object(),
+                    matrix_multiplier
+                )
         except maplus_except.InsufficientSelectionError:
-            self.report(
-                {'ERROR'},
-                'Select at least one face to grab a face normal.'
-            )
+            if self.normal_mode == 'AREA_WEIGHTED':
+                self.report(
+                    {'ERROR'},
+                    'Select at least one face to grab a face normal'
+                    ' (selected normals must not cancel out).'
+                )
+            else:
+                self.report(
+                    {'ERROR'},
+                    'Select at least one face to grab a face normal.'
+                )
             return {'CANCELLED'}
         except maplus_except.NonMeshGrabError:
             self.report(
@@ -748,10 +1547,19 @@ class MAPLUS_OT_GrabFromCursorBase(bpy.types.Operator):
         else:
             active_item = prims[addon_data.active_list_item]
 
+        grabbed_location = bpy.context.scene.cursor.location
+        if addon_data.snap_to_verts:
+            nearest = maplus_spatial.find_nearest_vert(
+                grabbed_location,
+                addon_data.snap_tolerance
+            )
+            if nearest is not None:
+                grabbed_location = nearest.co
+
         setattr(
             active_item,
             self.vert_attrib_to_set,
-            bpy.context.scene.cursor.location
+            grabbed_location
         )
         return {'FINISHED'}
 
@@ -817,21 +1625,532 @@ class MAPLUS_OT_SendCoordToCursorBase(bpy.types.Operator):
         return {'FINISHED'}
 
 
-class MAPLUS_OT_GrabAllSlot1(MAPLUS_OT_GrabAndSetItemKindBase):
-    bl_idname = "maplus.graballslot1"
-    bl_label = "Grab Global Coordinates From Selected Vertices"
-    bl_description = (
-        "Special grab-all: Select 1 vert for a Point, 2 for a Line,\n"
-        "3 for a Plane. Grabs global coordinates from selected vertices"
-        "\nin edit mode and sets slot type"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    multiply_by_world_matrix = True
-    target = 'SLOT1'
+def get_selection_direction_hint(mesh_object, use_faces=True):
+    """Get a global direction suggested by a mesh object's selection.
 
+    Used to orient fitted directions (whose sign is arbitrary): the sum
+    of the selected faces' normals times their areas if it isn't ~zero
+    (and use_faces is set), otherwise the direction from the first
+    selected vert to the last one.
 
-class MAPLUS_OT_GrabAllSlot1Loc(MAPLUS_OT_GrabAndSetItemKindBase):
-    bl_idname = "maplus.graballslot1loc"
+    :returns: A 3-element float array, or None if there's no hint
+    """
+    if not mesh_object or type(mesh_object.data) != bpy.types.Mesh:
+        return None
+
+    if use_faces:
+        centers, normals, areas = get_selected_face_data(mesh_object)
+        cofactor = get_cofactor_matrix(mesh_object.matrix_world)
+        if len(areas) and cofactor is not None:
+            face_vector_areas = (normals * areas[:, None]) @ cofactor.T
+            vector_area = face_vector_areas.sum(axis=0)
+            total_area = np.linalg.norm(face_vector_areas, axis=1).sum()
+            # Faces around a tube (etc.) cancel out, that's no hint
+            if np.linalg.norm(vector_area) > 1e-3 * total_area:
+                return vector_area
+
+    snapshot = get_selection_snapshot(mesh_object, with_order=True)
+    if len(snapshot.order) > 1:
+        first, last = snapshot.coords[snapshot.order[[0, -1]]]
+        return np.array(mesh_object.matrix_world.to_3x3()) @ (last - first)
+    return None
+
+
+def get_selection_axis_hint(mesh_object):
+    """Get a global axis suggested by a mesh object's selected faces.
+
+    The normals of the faces around a cylinder vary least along its
+    axis, which makes a good starting axis for fitting.fit_cylinder.
+
+    :returns: A 3-element float array, or None if there's no hint
+    """
+    if not mesh_object or type(mesh_object.data) != bpy.types.Mesh:
+        return None
+
+    centers, normals, areas = get_selected_face_data(mesh_object)
+    cofactor = get_cofactor_matrix(mesh_object.matrix_world)
+    if len(areas) < 2 or cofactor is None:
+        return None
+    normals = normals @ cofactor.T
+    lengths = np.linalg.norm(normals, axis=1)
+    valid = lengths > 1e-12
+    return maplus_fitting.get_least_variance_axis(
+        normals[valid] / lengths[valid, np.newaxis],
+        areas[valid]
+    )
+
+
+# Attribute names (on the addon data) of the items targeted by
+# quick_op_target strings
+quick_op_target_attribs = {
+    "APTSRC": "quick_align_pts_src",
+    "APTDEST": "quick_align_pts_dest",
+    "DSSRC": "quick_directional_slide_src",
+    "SMESRC": "quick_scale_match_edge_src",
+    "SMEDEST": "quick_scale_match_edge_dest",
+    "ALNSRC": "quick_align_lines_src",
+    "ALNDEST": "quick_align_lines_dest",
+    "AXRSRC": "quick_axis_rotate_src",
+    "DISTRIB_OBJ_ALONG_LINE_SRC": "quick_dist_obj_along_line_src",
+    "APLSRC": "quick_align_planes_src",
+    "APLDEST": "quick_align_planes_dest",
+    "APL_SET_ORIGIN_MODE_DEST": "quick_align_planes_set_origin_mode_dest",
+    "SLOT1": "internal_storage_slot_1",
+    "SLOT2": "internal_storage_slot_2",
+    "CALCRESULT": "quick_calc_result_item",
+}
+
+
+def get_grab_target_item(operator):
+    """Get the item a grab operator writes to (by its quick_op_target)."""
+    addon_data = bpy.context.scene.maplus_data
+    if not hasattr(operator, "quick_op_target"):
+        return addon_data.prim_list[addon_data.active_list_item]
+    return getattr(
+        addon_data,
+        quick_op_target_attribs[operator.quick_op_target]
+    )
+
+
+def return_fitted_coords(coords, fit_mode):
+    """Fit a shape to global vert coords.
+
+    The sign of a fitted direction is arbitrary, so it's oriented by the
+    active object's selection (see get_selection_direction_hint).
+
+    :param coords: An (n, 3) float array
+    :param fit_mode: One of 'PLANE' (three points on the best fit plane),
+        'LINE' (the best fit line's start and end), 'AXIS' (the start and
+        end of a fitted circle/cylinder axis) or 'SPHERE' (the center of
+        a fitted sphere, its radius is kept as the numeric calc result)
+    :returns: A tuple (list of coords, info message)
+    """
+    if fit_mode == 'PLANE':
+        # Point the normal the same way as any selected faces
+        orient_to = None
+        active_object = get_active_object()
+        if active_object and type(active_object.data) == bpy.types.Mesh:
+            centers, normals, areas = get_selected_face_data(active_object)
+            cofactor = get_cofactor_matrix(active_object.matrix_world)
+            if len(areas) and cofactor is not None:
+                orient_to = cofactor @ (normals * areas[:, None]).sum(axis=0)
+
+        plane_fit = maplus_fitting.fit_plane(coords, orient_to)
+        message = 'Best fit plane RMS residual: {0:.6g}'.format(
+            plane_fit.rms_residual
+        )
+        return maplus_fitting.plane_fit_points(plane_fit), message
+
+    elif fit_mode == 'LINE':
+        # Run the line from the first selected vert towards the last
+        # (on the active object)
+        orient_to = get_selection_direction_hint(
+            get_active_object(),
+            use_faces=False
+        )
+
+        line_fit = maplus_fitting.fit_line(coords, orient_to)
+        message = 'Best fit line RMS residual: {0:.6g}'.format(
+            line_fit.rms_residual
+        )
+        return (line_fit.start, line_fit.end), message
+
+    elif fit_mode == 'AXIS':
+        cylinder_fit = maplus_fitting.fit_cylinder(
+            coords,
+            axis_guess=get_selection_axis_hint(get_active_object()),
+            orient_to=get_selection_direction_hint(get_active_object())
+        )
+        message = 'Fitted axis radius: {0:.6g}, RMS residual: {1:.6g}'.format(
+            cylinder_fit.radius,
+            cylinder_fit.rms_residual
+        )
+        return (cylinder_fit.start, cylinder_fit.end), message
+
+    sphere_fit = maplus_fitting.fit_sphere(coords)
+    # Keep the radius around as a numeric result, for use with
+    # the calculate/compose tools
+    addon_data = bpy.context.scene.maplus_data
+    addon_data.quick_calc_result_numeric = sphere_fit.radius
+    message = 'Fitted sphere radius: {0:.6g}, RMS residual: {1:.6g}'.format(
+        sphere_fit.radius,
+        sphere_fit.rms_residual
+    )
+    return (sphere_fit.center,), message
+
+
+# Base class for grabs that fit a shape to all selected verts (on all
+# selected objects), in global coordinates
+class MAPLUS_OT_GrabFitBase(bpy.types.Operator):
+    bl_idname = "maplus.grabfitbase"
+    bl_label = "Grab Fit Base Class"
+    bl_description = (
+        "The base class for fitting geometry to selected mesh verts."
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    # A tuple of attribute names (strings) that should be set on the maplus
+    # primitive (point, line or plane item) from the fit result
+    vert_attribs_to_set = None
+    # The shape to fit, a fit_mode string (see return_fitted_coords)
+    fit_mode = None
+
+    def execute(self, context):
+        active_item = get_grab_target_item(self)
+
+        try:
+            coords = return_selected_coords_array(
+                get_selected_objects_active_first()
+            )
+            vert_data, message = return_fitted_coords(coords, self.fit_mode)
+        except maplus_except.InsufficientSelectionError:
+            self.report({'ERROR'}, 'Not enough vertices selected.')
+            return {'CANCELLED'}
+        except maplus_except.NonMeshGrabError:
+            self.report(
+                {'ERROR'},
+                'Cannot grab coords: non-mesh or no active object.'
+            )
+            return {'CANCELLED'}
+
+        set_item_coords(
+            active_item,
+            self.vert_attribs_to_set,
+            [mathutils.Vector(co) for co in vert_data]
+        )
+        if message:
+            self.report({'INFO'}, message)
+
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_GrabPlaneFitBase(MAPLUS_OT_GrabFitBase):
+    bl_idname = "maplus.grabplanefitbase"
+    bl_label = "Grab Best Fit Plane Base Class"
+    bl_description = (
+        "The base class for grabbing a best fit plane from selected verts."
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    vert_attribs_to_set = ('plane_pt_a', 'plane_pt_b', 'plane_pt_c')
+    fit_mode = 'PLANE'
+
+
+class MAPLUS_OT_GrabLineFitBase(MAPLUS_OT_GrabFitBase):
+    bl_idname = "maplus.grablinefitbase"
+    bl_label = "Grab Best Fit Line Base Class"
+    bl_description = (
+        "The base class for grabbing a best fit line from selected verts."
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    vert_attribs_to_set = ('line_start', 'line_end')
+    fit_mode = 'LINE'
+
+
+class MAPLUS_OT_GrabAxisFitBase(MAPLUS_OT_GrabFitBase):
+    bl_idname = "maplus.grabaxisfitbase"
+    bl_label = "Grab Fitted Axis Base Class"
+    bl_description = (
+        "The base class for grabbing a circle/cylinder axis from selected"
+        " verts."
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    vert_attribs_to_set = ('line_start', 'line_end')
+    fit_mode = 'AXIS'
+
+
+class MAPLUS_OT_GrabSphereFitBase(MAPLUS_OT_GrabFitBase):
+    bl_idname = "maplus.grabspherefitbase"
+    bl_label = "Grab Sphere Center Base Class"
+    bl_description = (
+        "The base class for grabbing a fitted sphere center from selected"
+        " verts."
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    vert_attribs_to_set = ('point',)
+    fit_mode = 'SPHERE'
+
+
+# Base class for grabs that derive coords from selected edges/faces
+class MAPLUS_OT_GrabElementBase(bpy.types.Operator):
+    bl_idname = "maplus.grabelementbase"
+    bl_label = "Grab From Elements Base Class"
+    bl_description = (
+        "The base class for grabbing coords from selected edges or faces."
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    # A tuple of attribute names (strings) that should be set on the maplus
+    # primitive (point or line item)
+    vert_attribs_to_set = None
+
+    def execute(self, context):
+        active_item = get_grab_target_item(self)
+
+        try:
+            vert_data = return_element_coords(
+                get_selected_objects_active_first(),
+                self.element_mode
+            )
+        except maplus_except.InsufficientSelectionError:
+            if self.element_mode in {'EDGE_MIDPOINT', 'EDGE_DIRECTION'}:
+                self.report({'ERROR'}, 'Not enough edges selected.')
+            else:
+                self.report({'ERROR'}, 'Not enough faces selected.')
+            return {'CANCELLED'}
+        except maplus_except.NonMeshGrabError:
+            self.report(
+                {'ERROR'},
+                'Cannot grab coords: non-mesh or no active object.'
+            )
+            return {'CANCELLED'}
+
+        set_item_coords(active_item, self.vert_attribs_to_set, vert_data)
+
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_GrabElementPointBase(MAPLUS_OT_GrabElementBase):
+    bl_idname = "maplus.grabelementpointbase"
+    bl_label = "Grab Point From Elements Base Class"
+    bl_description = (
+        "The base class for grabbing points from selected edges or faces."
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    vert_attribs_to_set = ('point',)
+    element_mode: bpy.props.EnumProperty(
+        items=[
+            ('EDGE_MIDPOINT', 'Edge Midpoint', 'The (average) midpoint of the selected edges'),
+            ('FACE_CENTER', 'Face Center', 'The (average) center of the selected faces'),
+        ],
+        name="Element",
+        default='EDGE_MIDPOINT',
+        description="What to grab from the selected elements"
+    )
+
+
+class MAPLUS_OT_GrabElementLineBase(MAPLUS_OT_GrabElementBase):
+    bl_idname = "maplus.grabelementlinebase"
+    bl_label = "Grab Line From Elements Base Class"
+    bl_description = (
+        "The base class for grabbing lines from selected edges or faces."
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    vert_attribs_to_set = ('line_start', 'line_end')
+    element_mode: bpy.props.EnumProperty(
+        items=[
+            ('EDGE_DIRECTION', 'Edge Direction', 'A line along the (average) direction of the selected edges'),
+            ('FACE_CENTERS', 'Face Centers', 'A line from the first selected face center to the last'),
+        ],
+        name="Element",
+        default='EDGE_DIRECTION',
+        description="What to grab from the selected elements"
+    )
+
+
+# Global directions for surface pick rays, by cast_direction
+pick_axis_directions = {
+    'NEG_Z': (0.0, 0.0, -1.0),
+    'POS_Z': (0.0, 0.0, 1.0),
+    'NEG_X': (-1.0, 0.0, 0.0),
+    'POS_X': (1.0, 0.0, 0.0),
+    'NEG_Y': (0.0, -1.0, 0.0),
+    'POS_Y': (0.0, 1.0, 0.0),
+}
+
+
+# Base class for grabs that cast a ray from the 3D cursor onto the
+# surfaces of visible meshes (BVH trees are cached, see utils/spatial.py)
+class MAPLUS_OT_GrabSurfacePickBase(bpy.types.Operator):
+    bl_idname = "maplus.grabsurfacepickbase"
+    bl_label = "Grab Surface Pick Base Class"
+    bl_description = (
+        "The base class for grabbing coords from mesh surfaces hit by"
+        " a ray from the 3D cursor."
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    # A tuple of attribute names (strings) that should be set on the maplus
+    # primitive (point or line item)
+    vert_attribs_to_set = None
+    # What to grab from the hit: 'POINT' (the hit location) or 'NORMAL'
+    # (a unit line from the hit location along the surface normal)
+    pick_mode = None
+    cast_direction: bpy.props.EnumProperty(
+        items=[
+            ('VIEW', 'View', 'Along the view direction (through the cursor)'),
+            ('CURSOR', 'Cursor -Z', "Along the 3D cursor's -Z axis"),
+            ('NEG_Z', '-Z', 'Along the global -Z axis'),
+            ('POS_Z', '+Z', 'Along the global +Z axis'),
+            ('NEG_X', '-X', 'Along the global -X axis'),
+            ('POS_X', '+X', 'Along the global +X axis'),
+            ('NEG_Y', '-Y', 'Along the global -Y axis'),
+            ('POS_Y', '+Y', 'Along the global +Y axis'),
+        ],
+        name="Cast Direction",
+        default='VIEW',
+        description="The direction to cast from the 3D cursor"
+    )
+
+    def get_cast_direction(self, context):
+        """Get the (global) ray direction, or None if there's no 3D view."""
+        cursor = bpy.context.scene.cursor
+        if self.cast_direction == 'VIEW':
+            region_3d = getattr(context.space_data, 'region_3d', None)
+            if region_3d is None:
+                return None
+            if region_3d.is_perspective:
+                eye = region_3d.view_matrix.inverted().translation
+                if (cursor.location - eye).length > 1e-9:
+                    return cursor.location - eye
+            return region_3d.view_rotation @ mathutils.Vector((0, 0, -1))
+        if self.cast_direction == 'CURSOR':
+            return cursor.matrix.to_3x3() @ mathutils.Vector((0, 0, -1))
+        return mathutils.Vector(pick_axis_directions[self.cast_direction])
+
+    def execute(self, context):
+        active_item = get_grab_target_item(self)
+
+        cast_direction = self.get_cast_direction(context)
+        if cast_direction is None:
+            self.report(
+                {'ERROR'},
+                'Cannot cast along the view: no 3D view available.'
+            )
+            return {'CANCELLED'}
+        hit = maplus_spatial.cast_ray(
+            bpy.context.scene.cursor.location,
+            cast_direction,
+            evaluated=use_evaluated_geometry()
+        )
+        if hit is None:
+            self.report({'ERROR'}, 'No mesh surface hit from the 3D cursor.')
+            return {'CANCELLED'}
+
+        if self.pick_mode == 'NORMAL':
+            hit_coords = (hit.co, hit.co + hit.normal)
+        else:
+            hit_coords = (hit.co,)
+        set_item_coords(active_item, self.vert_attribs_to_set, hit_coords)
+        self.report(
+            {'INFO'},
+            'Hit "{0}" at distance {1:.6g}'.format(
+                hit.mesh_object.name,
+                hit.distance
+            )
+        )
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_GrabSurfacePointBase(MAPLUS_OT_GrabSurfacePickBase):
+    bl_idname = "maplus.grabsurfacepointbase"
+    bl_label = "Grab Surface Point Base Class"
+    bl_description = (
+        "The base class for grabbing surface points hit from the 3D cursor."
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    vert_attribs_to_set = ('point',)
+    pick_mode = 'POINT'
+
+
+class MAPLUS_OT_GrabSurfaceNormalBase(MAPLUS_OT_GrabSurfacePickBase):
+    bl_idname = "maplus.grabsurfacenormalbase"
+    bl_label = "Grab Surface Normal Base Class"
+    bl_description = (
+        "The base class for grabbing surface normals hit from the 3D cursor."
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    vert_attribs_to_set = ('line_start', 'line_end')
+    pick_mode = 'NORMAL'
+
+
+# Coordinate attribs of each kind of geometry primitive
+item_coord_attribs = {
+    'POINT': ('point',),
+    'LINE': ('line_start', 'line_end'),
+    'PLANE': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+}
+
+
+# Snaps typed (or otherwise set) coords on an item to nearby mesh verts
+class MAPLUS_OT_SnapCoordsToVerts(bpy.types.Operator):
+    bl_idname = "maplus.snapcoordstoverts"
+    bl_label = "Snap Coordinates to Verts"
+    bl_description = (
+        "Snaps each coordinate of this item to the nearest mesh vert"
+        " (on visible mesh objects) within the snap tolerance"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    target: bpy.props.EnumProperty(
+        items=[('ACTIVE', 'Active Item', 'The active list item')] + [
+            (key, key, 'Quick tool/slot item') for key in quick_op_target_attribs
+        ],
+        name="Target",
+        default='ACTIVE',
+        description="The item to snap"
+    )
+    item_kind: bpy.props.EnumProperty(
+        items=[
+            ('AUTO', 'Auto', "Use the target item's own kind"),
+            ('POINT', 'Point', 'Snap a point'),
+            ('LINE', 'Line', 'Snap a line'),
+            ('PLANE', 'Plane', 'Snap a plane'),
+        ],
+        name="Item Kind",
+        default='AUTO',
+        description="Which coordinates of the item to snap"
+    )
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        if self.target == 'ACTIVE':
+            if not addon_data.prim_list:
+                self.report({'ERROR'}, 'No item to snap.')
+                return {'CANCELLED'}
+            active_item = addon_data.prim_list[addon_data.active_list_item]
+        else:
+            active_item = getattr(
+                addon_data,
+                quick_op_target_attribs[self.target]
+            )
+        item_kind = (
+            active_item.kind if self.item_kind == 'AUTO' else self.item_kind
+        )
+        if item_kind not in item_coord_attribs:
+            self.report({'ERROR'}, 'Only points, lines and planes can be snapped.')
+            return {'CANCELLED'}
+
+        snapped_count = 0
+        for attrib in item_coord_attribs[item_kind]:
+            nearest = maplus_spatial.find_nearest_vert(
+                getattr(active_item, attrib),
+                addon_data.snap_tolerance
+            )
+            if nearest is not None:
+                setattr(active_item, attrib, nearest.co)
+                snapped_count += 1
+
+        self.report(
+            {'INFO'},
+            'Snapped {0} of {1} coordinates to verts.'.format(
+                snapped_count,
+                len(item_coord_attribs[item_kind])
+            )
+        )
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_GrabAllSlot1(MAPLUS_OT_GrabAndSetItemKindBase):
+    bl_idname = "maplus.graballslot1"
+    bl_label = "Grab Global Coordinates From Selected Vertices"
+    bl_description = (
+        "Special grab-all: Select 1 vert for a Point, 2 for a Line,\n"
+        "3 for a Plane. Grabs global coordinates from selected vertices"
+        "\nin edit mode and sets slot type"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    multiply_by_world_matrix = True
+    target = 'SLOT1'
+
+
+class MAPLUS_OT_GrabAllSlot1Loc(MAPLUS_OT_GrabAndSetItemKindBase):
+    bl_idname = "maplus.graballslot1loc"
     bl_label = "Grab Global Coordinates From Selected Vertices"
     bl_description = (
         "Grabs global coordinates from selected vertices in edit mode"
@@ -5213,3 +6532,677 @@ class MAPLUS_OT_ShowHideQuickSmeDestGeom(MAPLUS_OT_ShowHideQuickGeomBaseClass):
     bl_description = "Show/hide quick scale match edge source geometry"
     bl_options = {'REGISTER', 'UNDO'}
     quick_op_target = 'SMEDEST'
+
+
+class MAPLUS_OT_GrabPlaneFit(MAPLUS_OT_GrabPlaneFitBase):
+    bl_idname = "maplus.grabplanefit"
+    bl_label = "Grab Best Fit Plane from Selected Verts"
+    bl_description = (
+        "Fits a plane to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+
+class MAPLUS_OT_GrabPlaneFitSlot1(MAPLUS_OT_GrabPlaneFitBase):
+    bl_idname = "maplus.grabplanefitslot1"
+    bl_label = "Grab Best Fit Plane from Selected Verts"
+    bl_description = (
+        "Fits a plane to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SLOT1"
+
+
+class MAPLUS_OT_GrabPlaneFitSlot2(MAPLUS_OT_GrabPlaneFitBase):
+    bl_idname = "maplus.grabplanefitslot2"
+    bl_label = "Grab Best Fit Plane from Selected Verts"
+    bl_description = (
+        "Fits a plane to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SLOT2"
+
+
+class MAPLUS_OT_GrabPlaneFitCalcResult(MAPLUS_OT_GrabPlaneFitBase):
+    bl_idname = "maplus.grabplanefitcalcresult"
+    bl_label = "Grab Best Fit Plane from Selected Verts"
+    bl_description = (
+        "Fits a plane to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "CALCRESULT"
+
+
+class MAPLUS_OT_QuickAlignPlanesGrabFitSrc(MAPLUS_OT_GrabPlaneFitBase):
+    bl_idname = "maplus.quickalignplanesgrabfitsrc"
+    bl_label = "Grab Best Fit Plane from Selected Verts"
+    bl_description = (
+        "Fits a plane to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "APLSRC"
+
+
+class MAPLUS_OT_QuickAlignPlanesGrabFitDest(MAPLUS_OT_GrabPlaneFitBase):
+    bl_idname = "maplus.quickalignplanesgrabfitdest"
+    bl_label = "Grab Best Fit Plane from Selected Verts"
+    bl_description = (
+        "Fits a plane to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "APLDEST"
+
+
+class MAPLUS_OT_QuickAlignPlanesSetOriginModeGrabFitDest(MAPLUS_OT_GrabPlaneFitBase):
+    bl_idname = "maplus.quickalignplanessetoriginmodegrabfitdest"
+    bl_label = "Grab Best Fit Plane from Selected Verts"
+    bl_description = (
+        "Fits a plane to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "APL_SET_ORIGIN_MODE_DEST"
+
+
+class MAPLUS_OT_GrabLineFit(MAPLUS_OT_GrabLineFitBase):
+    bl_idname = "maplus.grablinefit"
+    bl_label = "Grab Best Fit Line from Selected Verts"
+    bl_description = (
+        "Fits a line to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+
+class MAPLUS_OT_GrabLineFitSlot1(MAPLUS_OT_GrabLineFitBase):
+    bl_idname = "maplus.grablinefitslot1"
+    bl_label = "Grab Best Fit Line from Selected Verts"
+    bl_description = (
+        "Fits a line to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SLOT1"
+
+
+class MAPLUS_OT_GrabLineFitSlot2(MAPLUS_OT_GrabLineFitBase):
+    bl_idname = "maplus.grablinefitslot2"
+    bl_label = "Grab Best Fit Line from Selected Verts"
+    bl_description = (
+        "Fits a line to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SLOT2"
+
+
+class MAPLUS_OT_GrabLineFitCalcResult(MAPLUS_OT_GrabLineFitBase):
+    bl_idname = "maplus.grablinefitcalcresult"
+    bl_label = "Grab Best Fit Line from Selected Verts"
+    bl_description = (
+        "Fits a line to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "CALCRESULT"
+
+
+class MAPLUS_OT_QuickAlignLinesGrabFitSrc(MAPLUS_OT_GrabLineFitBase):
+    bl_idname = "maplus.quickalignlinesgrabfitsrc"
+    bl_label = "Grab Best Fit Line from Selected Verts"
+    bl_description = (
+        "Fits a line to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "ALNSRC"
+
+
+class MAPLUS_OT_QuickAlignLinesGrabFitDest(MAPLUS_OT_GrabLineFitBase):
+    bl_idname = "maplus.quickalignlinesgrabfitdest"
+    bl_label = "Grab Best Fit Line from Selected Verts"
+    bl_description = (
+        "Fits a line to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "ALNDEST"
+
+
+class MAPLUS_OT_QuickAxisRotateGrabFitSrc(MAPLUS_OT_GrabLineFitBase):
+    bl_idname = "maplus.quickaxisrotategrabfitsrc"
+    bl_label = "Grab Best Fit Line from Selected Verts"
+    bl_description = (
+        "Fits a line to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "AXRSRC"
+
+
+class MAPLUS_OT_QuickDirectionalSlideGrabFitSrc(MAPLUS_OT_GrabLineFitBase):
+    bl_idname = "maplus.quickdirectionalslidegrabfitsrc"
+    bl_label = "Grab Best Fit Line from Selected Verts"
+    bl_description = (
+        "Fits a line to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "DSSRC"
+
+
+class MAPLUS_OT_QuickScaleMatchEdgeGrabFitSrc(MAPLUS_OT_GrabLineFitBase):
+    bl_idname = "maplus.quickscalematchedgegrabfitsrc"
+    bl_label = "Grab Best Fit Line from Selected Verts"
+    bl_description = (
+        "Fits a line to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SMESRC"
+
+
+class MAPLUS_OT_QuickScaleMatchEdgeGrabFitDest(MAPLUS_OT_GrabLineFitBase):
+    bl_idname = "maplus.quickscalematchedgegrabfitdest"
+    bl_label = "Grab Best Fit Line from Selected Verts"
+    bl_description = (
+        "Fits a line to all selected vertices (least squares) and grabs"
+        " it in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SMEDEST"
+
+
+class MAPLUS_OT_GrabAxisFit(MAPLUS_OT_GrabAxisFitBase):
+    bl_idname = "maplus.grabaxisfit"
+    bl_label = "Grab Circle/Cylinder Axis from Selected Verts"
+    bl_description = (
+        "Fits a circle or cylinder to all selected vertices and grabs its"
+        " axis (through the center) in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+
+class MAPLUS_OT_GrabAxisFitSlot1(MAPLUS_OT_GrabAxisFitBase):
+    bl_idname = "maplus.grabaxisfitslot1"
+    bl_label = "Grab Circle/Cylinder Axis from Selected Verts"
+    bl_description = (
+        "Fits a circle or cylinder to all selected vertices and grabs its"
+        " axis (through the center) in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SLOT1"
+
+
+class MAPLUS_OT_GrabAxisFitSlot2(MAPLUS_OT_GrabAxisFitBase):
+    bl_idname = "maplus.grabaxisfitslot2"
+    bl_label = "Grab Circle/Cylinder Axis from Selected Verts"
+    bl_description = (
+        "Fits a circle or cylinder to all selected vertices and grabs its"
+        " axis (through the center) in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SLOT2"
+
+
+class MAPLUS_OT_GrabAxisFitCalcResult(MAPLUS_OT_GrabAxisFitBase):
+    bl_idname = "maplus.grabaxisfitcalcresult"
+    bl_label = "Grab Circle/Cylinder Axis from Selected Verts"
+    bl_description = (
+        "Fits a circle or cylinder to all selected vertices and grabs its"
+        " axis (through the center) in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "CALCRESULT"
+
+
+class MAPLUS_OT_QuickAlignLinesGrabAxisFitSrc(MAPLUS_OT_GrabAxisFitBase):
+    bl_idname = "maplus.quickalignlinesgrabaxisfitsrc"
+    bl_label = "Grab Circle/Cylinder Axis from Selected Verts"
+    bl_description = (
+        "Fits a circle or cylinder to all selected vertices and grabs its"
+        " axis (through the center) in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "ALNSRC"
+
+
+class MAPLUS_OT_QuickAlignLinesGrabAxisFitDest(MAPLUS_OT_GrabAxisFitBase):
+    bl_idname = "maplus.quickalignlinesgrabaxisfitdest"
+    bl_label = "Grab Circle/Cylinder Axis from Selected Verts"
+    bl_description = (
+        "Fits a circle or cylinder to all selected vertices and grabs its"
+        " axis (through the center) in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "ALNDEST"
+
+
+class MAPLUS_OT_QuickAxisRotateGrabAxisFitSrc(MAPLUS_OT_GrabAxisFitBase):
+    bl_idname = "maplus.quickaxisrotategrabaxisfitsrc"
+    bl_label = "Grab Circle/Cylinder Axis from Selected Verts"
+    bl_description = (
+        "Fits a circle or cylinder to all selected vertices and grabs its"
+        " axis (through the center) in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "AXRSRC"
+
+
+class MAPLUS_OT_GrabSphereFit(MAPLUS_OT_GrabSphereFitBase):
+    bl_idname = "maplus.grabspherefit"
+    bl_label = "Grab Sphere Center from Selected Verts"
+    bl_description = (
+        "Fits a sphere to all selected vertices and grabs its center in"
+        " global coordinates (the radius goes to the numeric calc result)"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+
+class MAPLUS_OT_GrabSphereFitSlot1(MAPLUS_OT_GrabSphereFitBase):
+    bl_idname = "maplus.grabspherefitslot1"
+    bl_label = "Grab Sphere Center from Selected Verts"
+    bl_description = (
+        "Fits a sphere to all selected vertices and grabs its center in"
+        " global coordinates (the radius goes to the numeric calc result)"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SLOT1"
+
+
+class MAPLUS_OT_GrabSphereFitSlot2(MAPLUS_OT_GrabSphereFitBase):
+    bl_idname = "maplus.grabspherefitslot2"
+    bl_label = "Grab Sphere Center from Selected Verts"
+    bl_description = (
+        "Fits a sphere to all selected vertices and grabs its center in"
+        " global coordinates (the radius goes to the numeric calc result)"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SLOT2"
+
+
+class MAPLUS_OT_GrabSphereFitCalcResult(MAPLUS_OT_GrabSphereFitBase):
+    bl_idname = "maplus.grabspherefitcalcresult"
+    bl_label = "Grab Sphere Center from Selected Verts"
+    bl_description = (
+        "Fits a sphere to all selected vertices and grabs its center in"
+        " global coordinates (the radius goes to the numeric calc result)"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "CALCRESULT"
+
+
+class MAPLUS_OT_QuickAlignPointsGrabSphereFitSrc(MAPLUS_OT_GrabSphereFitBase):
+    bl_idname = "maplus.quickalignpointsgrabspherefitsrc"
+    bl_label = "Grab Sphere Center from Selected Verts"
+    bl_description = (
+        "Fits a sphere to all selected vertices and grabs its center in"
+        " global coordinates (the radius goes to the numeric calc result)"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "APTSRC"
+
+
+class MAPLUS_OT_QuickAlignPointsGrabSphereFitDest(MAPLUS_OT_GrabSphereFitBase):
+    bl_idname = "maplus.quickalignpointsgrabspherefitdest"
+    bl_label = "Grab Sphere Center from Selected Verts"
+    bl_description = (
+        "Fits a sphere to all selected vertices and grabs its center in"
+        " global coordinates (the radius goes to the numeric calc result)"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "APTDEST"
+
+
+class MAPLUS_OT_GrabElementPoint(MAPLUS_OT_GrabElementPointBase):
+    bl_idname = "maplus.grabelementpoint"
+    bl_label = "Grab Point from Selected Edges/Faces"
+    bl_description = (
+        "Grabs an edge midpoint or face center"
+        " from the selected edges/faces, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+
+class MAPLUS_OT_GrabElementPointSlot1(MAPLUS_OT_GrabElementPointBase):
+    bl_idname = "maplus.grabelementpointslot1"
+    bl_label = "Grab Point from Selected Edges/Faces"
+    bl_description = (
+        "Grabs an edge midpoint or face center"
+        " from the selected edges/faces, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SLOT1"
+
+
+class MAPLUS_OT_GrabElementPointSlot2(MAPLUS_OT_GrabElementPointBase):
+    bl_idname = "maplus.grabelementpointslot2"
+    bl_label = "Grab Point from Selected Edges/Faces"
+    bl_description = (
+        "Grabs an edge midpoint or face center"
+        " from the selected edges/faces, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SLOT2"
+
+
+class MAPLUS_OT_GrabElementPointCalcResult(MAPLUS_OT_GrabElementPointBase):
+    bl_idname = "maplus.grabelementpointcalcresult"
+    bl_label = "Grab Point from Selected Edges/Faces"
+    bl_description = (
+        "Grabs an edge midpoint or face center"
+        " from the selected edges/faces, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "CALCRESULT"
+
+
+class MAPLUS_OT_QuickAlignPointsGrabElementSrc(MAPLUS_OT_GrabElementPointBase):
+    bl_idname = "maplus.quickalignpointsgrabelementsrc"
+    bl_label = "Grab Point from Selected Edges/Faces"
+    bl_description = (
+        "Grabs an edge midpoint or face center"
+        " from the selected edges/faces, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "APTSRC"
+
+
+class MAPLUS_OT_QuickAlignPointsGrabElementDest(MAPLUS_OT_GrabElementPointBase):
+    bl_idname = "maplus.quickalignpointsgrabelementdest"
+    bl_label = "Grab Point from Selected Edges/Faces"
+    bl_description = (
+        "Grabs an edge midpoint or face center"
+        " from the selected edges/faces, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "APTDEST"
+
+
+class MAPLUS_OT_GrabElementLine(MAPLUS_OT_GrabElementLineBase):
+    bl_idname = "maplus.grabelementline"
+    bl_label = "Grab Line from Selected Edges/Faces"
+    bl_description = (
+        "Grabs an edge direction or a line between face centers"
+        " from the selected edges/faces, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+
+class MAPLUS_OT_GrabElementLineSlot1(MAPLUS_OT_GrabElementLineBase):
+    bl_idname = "maplus.grabelementlineslot1"
+    bl_label = "Grab Line from Selected Edges/Faces"
+    bl_description = (
+        "Grabs an edge direction or a line between face centers"
+        " from the selected edges/faces, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SLOT1"
+
+
+class MAPLUS_OT_GrabElementLineSlot2(MAPLUS_OT_GrabElementLineBase):
+    bl_idname = "maplus.grabelementlineslot2"
+    bl_label = "Grab Line from Selected Edges/Faces"
+    bl_description = (
+        "Grabs an edge direction or a line between face centers"
+        " from the selected edges/faces, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SLOT2"
+
+
+class MAPLUS_OT_GrabElementLineCalcResult(MAPLUS_OT_GrabElementLineBase):
+    bl_idname = "maplus.grabelementlinecalcresult"
+    bl_label = "Grab Line from Selected Edges/Faces"
+    bl_description = (
+        "Grabs an edge direction or a line between face centers"
+        " from the selected edges/faces, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "CALCRESULT"
+
+
+class MAPLUS_OT_QuickAlignLinesGrabElementSrc(MAPLUS_OT_GrabElementLineBase):
+    bl_idname = "maplus.quickalignlinesgrabelementsrc"
+    bl_label = "Grab Line from Selected Edges/Faces"
+    bl_description = (
+        "Grabs an edge direction or a line between face centers"
+        " from the selected edges/faces, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "ALNSRC"
+
+
+class MAPLUS_OT_QuickAlignLinesGrabElementDest(MAPLUS_OT_GrabElementLineBase):
+    bl_idname = "maplus.quickalignlinesgrabelementdest"
+    bl_label = "Grab Line from Selected Edges/Faces"
+    bl_description = (
+        "Grabs an edge direction or a line between face centers"
+        " from the selected edges/faces, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "ALNDEST"
+
+
+class MAPLUS_OT_QuickAxisRotateGrabElementSrc(MAPLUS_OT_GrabElementLineBase):
+    bl_idname = "maplus.quickaxisrotategrabelementsrc"
+    bl_label = "Grab Line from Selected Edges/Faces"
+    bl_description = (
+        "Grabs an edge direction or a line between face centers"
+        " from the selected edges/faces, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "AXRSRC"
+
+
+class MAPLUS_OT_QuickDirectionalSlideGrabElementSrc(MAPLUS_OT_GrabElementLineBase):
+    bl_idname = "maplus.quickdirectionalslidegrabelementsrc"
+    bl_label = "Grab Line from Selected Edges/Faces"
+    bl_description = (
+        "Grabs an edge direction or a line between face centers"
+        " from the selected edges/faces, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "DSSRC"
+
+
+class MAPLUS_OT_QuickScaleMatchEdgeGrabElementSrc(MAPLUS_OT_GrabElementLineBase):
+    bl_idname = "maplus.quickscalematchedgegrabelementsrc"
+    bl_label = "Grab Line from Selected Edges/Faces"
+    bl_description = (
+        "Grabs an edge direction or a line between face centers"
+        " from the selected edges/faces, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SMESRC"
+
+
+class MAPLUS_OT_QuickScaleMatchEdgeGrabElementDest(MAPLUS_OT_GrabElementLineBase):
+    bl_idname = "maplus.quickscalematchedgegrabelementdest"
+    bl_label = "Grab Line from Selected Edges/Faces"
+    bl_description = (
+        "Grabs an edge direction or a line between face centers"
+        " from the selected edges/faces, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SMEDEST"
+
+
+class MAPLUS_OT_GrabSurfacePoint(MAPLUS_OT_GrabSurfacePointBase):
+    bl_idname = "maplus.grabsurfacepoint"
+    bl_label = "Grab Point from Surface (Cursor Ray)"
+    bl_description = (
+        "Grabs the point where a ray cast from the 3D cursor hits"
+        " a visible mesh surface, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+
+class MAPLUS_OT_GrabSurfacePointSlot1(MAPLUS_OT_GrabSurfacePointBase):
+    bl_idname = "maplus.grabsurfacepointslot1"
+    bl_label = "Grab Point from Surface (Cursor Ray)"
+    bl_description = (
+        "Grabs the point where a ray cast from the 3D cursor hits"
+        " a visible mesh surface, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SLOT1"
+
+
+class MAPLUS_OT_GrabSurfacePointSlot2(MAPLUS_OT_GrabSurfacePointBase):
+    bl_idname = "maplus.grabsurfacepointslot2"
+    bl_label = "Grab Point from Surface (Cursor Ray)"
+    bl_description = (
+        "Grabs the point where a ray cast from the 3D cursor hits"
+        " a visible mesh surface, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SLOT2"
+
+
+class MAPLUS_OT_GrabSurfacePointCalcResult(MAPLUS_OT_GrabSurfacePointBase):
+    bl_idname = "maplus.grabsurfacepointcalcresult"
+    bl_label = "Grab Point from Surface (Cursor Ray)"
+    bl_description = (
+        "Grabs the point where a ray cast from the 3D cursor hits"
+        " a visible mesh surface, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "CALCRESULT"
+
+
+class MAPLUS_OT_QuickAlignPointsGrabSurfaceSrc(MAPLUS_OT_GrabSurfacePointBase):
+    bl_idname = "maplus.quickalignpointsgrabsurfacesrc"
+    bl_label = "Grab Point from Surface (Cursor Ray)"
+    bl_description = (
+        "Grabs the point where a ray cast from the 3D cursor hits"
+        " a visible mesh surface, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "APTSRC"
+
+
+class MAPLUS_OT_QuickAlignPointsGrabSurfaceDest(MAPLUS_OT_GrabSurfacePointBase):
+    bl_idname = "maplus.quickalignpointsgrabsurfacedest"
+    bl_label = "Grab Point from Surface (Cursor Ray)"
+    bl_description = (
+        "Grabs the point where a ray cast from the 3D cursor hits"
+        " a visible mesh surface, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "APTDEST"
+
+
+class MAPLUS_OT_GrabSurfaceNormal(MAPLUS_OT_GrabSurfaceNormalBase):
+    bl_idname = "maplus.grabsurfacenormal"
+    bl_label = "Grab Surface Normal (Cursor Ray)"
+    bl_description = (
+        "Grabs the (interpolated) surface normal where a ray cast from"
+        " the 3D cursor hits a visible mesh surface, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+
+class MAPLUS_OT_GrabSurfaceNormalSlot1(MAPLUS_OT_GrabSurfaceNormalBase):
+    bl_idname = "maplus.grabsurfacenormalslot1"
+    bl_label = "Grab Surface Normal (Cursor Ray)"
+    bl_description = (
+        "Grabs the (interpolated) surface normal where a ray cast from"
+        " the 3D cursor hits a visible mesh surface, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SLOT1"
+
+
+class MAPLUS_OT_GrabSurfaceNormalSlot2(MAPLUS_OT_GrabSurfaceNormalBase):
+    bl_idname = "maplus.grabsurfacenormalslot2"
+    bl_label = "Grab Surface Normal (Cursor Ray)"
+    bl_description = (
+        "Grabs the (interpolated) surface normal where a ray cast from"
+        " the 3D cursor hits a visible mesh surface, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SLOT2"
+
+
+class MAPLUS_OT_GrabSurfaceNormalCalcResult(MAPLUS_OT_GrabSurfaceNormalBase):
+    bl_idname = "maplus.grabsurfacenormalcalcresult"
+    bl_label = "Grab Surface Normal (Cursor Ray)"
+    bl_description = (
+        "Grabs the (interpolated) surface normal where a ray cast from"
+        " the 3D cursor hits a visible mesh surface, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "CALCRESULT"
+
+
+class MAPLUS_OT_QuickAlignLinesGrabSurfaceSrc(MAPLUS_OT_GrabSurfaceNormalBase):
+    bl_idname = "maplus.quickalignlinesgrabsurfacesrc"
+    bl_label = "Grab Surface Normal (Cursor Ray)"
+    bl_description = (
+        "Grabs the (interpolated) surface normal where a ray cast from"
+        " the 3D cursor hits a visible mesh surface, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "ALNSRC"
+
+
+class MAPLUS_OT_QuickAlignLinesGrabSurfaceDest(MAPLUS_OT_GrabSurfaceNormalBase):
+    bl_idname = "maplus.quickalignlinesgrabsurfacedest"
+    bl_label = "Grab Surface Normal (Cursor Ray)"
+    bl_description = (
+        "Grabs the (interpolated) surface normal where a ray cast from"
+        " the 3D cursor hits a visible mesh surface, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "ALNDEST"
+
+
+class MAPLUS_OT_QuickAxisRotateGrabSurfaceSrc(MAPLUS_OT_GrabSurfaceNormalBase):
+    bl_idname = "maplus.quickaxisrotategrabsurfacesrc"
+    bl_label = "Grab Surface Normal (Cursor Ray)"
+    bl_description = (
+        "Grabs the (interpolated) surface normal where a ray cast from"
+        " the 3D cursor hits a visible mesh surface, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "AXRSRC"
+
+
+class MAPLUS_OT_QuickDirectionalSlideGrabSurfaceSrc(MAPLUS_OT_GrabSurfaceNormalBase):
+    bl_idname = "maplus.quickdirectionalslidegrabsurfacesrc"
+    bl_label = "Grab Surface Normal (Cursor Ray)"
+    bl_description = (
+        "Grabs the (interpolated) surface normal where a ray cast from"
+        " the 3D cursor hits a visible mesh surface, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "DSSRC"
+
+
+class MAPLUS_OT_QuickScaleMatchEdgeGrabSurfaceSrc(MAPLUS_OT_GrabSurfaceNormalBase):
+    bl_idname = "maplus.quickscalematchedgegrabsurfacesrc"
+    bl_label = "Grab Surface Normal (Cursor Ray)"
+    bl_description = (
+        "Grabs the (interpolated) surface normal where a ray cast from"
+        " the 3D cursor hits a visible mesh surface, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SMESRC"
+
+
+class MAPLUS_OT_QuickScaleMatchEdgeGrabSurfaceDest(MAPLUS_OT_GrabSurfaceNormalBase):
+    bl_idname = "maplus.quickscalematchedgegrabsurfacedest"
+    bl_label = "Grab Surface Normal (Cursor Ray)"
+    bl_description = (
+        "Grabs the (interpolated) surface normal where a ray cast from"
+        " the 3D cursor hits a visible mesh surface, in global coordinates"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    quick_op_target = "SMEDEST"
@@ -3,6 +3,8 @@
 
 import bpy
 
+from . import journal as maplus_journal
+
 
 def layout_coordvec(parent_layout,
                     coordvec_label,
@@ -82,3 +84,10 @@ def specials_menu_items(self, context):
     self.layout.operator('maplus.specialsaddpointfromactiveglobal')
     self.layout.operator('maplus.specialsaddlinefromactiveglobal')
     self.layout.operator('maplus.specialsaddplanefromactiveglobal')
+    self.layout.prop(
+        context.scene.maplus_data,
+        'grab_from_evaluated',
+        text='Grab from Evaluated Mesh'
+    )
+    if maplus_journal.entries:
+        self.layout.operator('maplus.revertlasttransform')
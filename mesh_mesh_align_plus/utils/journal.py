@@ -0,0 +1,206 @@
+"""An undo journal of the transforms applied by the transformation tools.
+
+Instead of relying on Blender's undo steps (a full copy of every changed
+mesh), the journal records the 4x4 matrix each object and mesh datablock
+was transformed by, and a transform is reverted by applying the inverse
+(see the undo_journal module). Only transforms that can't be inverted
+(a singular matrix, e.g. a scale to 0) keep a snapshot of the previous
+state instead.
+
+Recording is optional (the addon's "Transform Undo Journal" preference)
+and only happens inside a recording() block. Entries refer to objects
+and meshes by session_uid (so renaming them doesn't matter), they only
+live for the session and are dropped when Blender's own undo/redo or a
+file load changes the scene under them.
+"""
+
+
+import collections
+import contextlib
+
+import bmesh
+import bpy
+import numpy as np
+
+from . import geom as maplus_geom
+from . import storage as maplus_storage
+
+
+# One object or mesh changed by a transform.
+#     kind: 'OBJECT' (matrix was applied in global space, before the
+#         object's matrix_world), 'OBJECT_LOCAL' (matrix was applied after
+#         the object's matrix_world) or 'MESH' (matrix was applied to the
+#         mesh's verts, in local space)
+#     session_uid: The object's or mesh's session_uid
+#     name: The object's or mesh's name when recorded (for reports)
+#     matrix: The applied 4x4 matrix (a numpy float64 array)
+#     select_mask: For 'MESH', the transformed verts as packed bits (see
+#         np.packbits), or None if all verts were transformed
+#     vector_attributes: For 'MESH', whether the float vector point
+#         attributes were transformed too (see geom.get_point_layers)
+#     snapshot: The previous matrix_world or point layers (see
+#         get_point_coords), only kept if matrix can't be inverted
+#         (otherwise None)
+JournalStep = collections.namedtuple(
+    'JournalStep',
+    [
+        'kind',
+        'session_uid',
+        'name',
+        'matrix',
+        'select_mask',
+        'vector_attributes',
+        'snapshot',
+    ]
+)
+# One transform operator run
+JournalEntry = collections.namedtuple('JournalEntry', ['label', 'steps'])
+
+# The most transforms that can be reverted (the oldest are dropped)
+max_journal_entries = 64
+
+entries = collections.deque(maxlen=max_journal_entries)
+recording_steps = None
+
+
+def is_enabled():
+    """Check whether the journal preference is on."""
+    preferences = maplus_storage.get_preferences()
+    return bool(preferences and preferences.use_undo_journal)
+
+
+def is_invertible(matrix):
+    """Check whether a 4x4 (affine) matrix can be inverted accurately."""
+    linear_part = np.asarray(matrix, dtype=np.float64)[:3, :3]
+    return abs(np.linalg.det(linear_part)) > 1e-12
+
+
+@contextlib.contextmanager
+def recording(label):
+    """Record the transforms made in the block as one journal entry.
+
+    Does nothing if the journal is off, or when nested in another
+    recording() block (the outer one gets the steps).
+    """
+    global recording_steps
+    if recording_steps is not None or not is_enabled():
+        yield
+        return
+    recording_steps = []
+    try:
+        yield
+    finally:
+        steps, recording_steps = recording_steps, None
+    if steps:
+        entries.append(JournalEntry(label, steps))
+
+
+def record_object(item, matrix, local=False):
+    """Record an object transform, call before it's applied.
+
+    :param item: The object
+    :param matrix: The 4x4 matrix (mathutils or numpy)
+    :param local: If the matrix is applied after the object's matrix_world
+        (matrix_world @ matrix), rather than before it
+    """
+    if recording_steps is None:
+        return
+    matrix = np.array(matrix, dtype=np.float64)
+    snapshot = None
+    if not is_invertible(matrix):
+        snapshot = item.matrix_world.copy()
+    recording_steps.append(JournalStep(
+        'OBJECT_LOCAL' if local else 'OBJECT',
+        item.session_uid,
+        item.name,
+        matrix,
+        None,
+        False,
+        snapshot
+    ))
+
+
+def get_select_mask(mesh):
+    """Get the select flags of a mesh's verts (edit mode aware)."""
+    if mesh.is_editmode:
+        edit_mesh = bmesh.from_edit_mesh(mesh)
+        return np.fromiter(
+            (vert.select for vert in edit_mesh.verts),
+            dtype=bool,
+            count=len(edit_mesh.verts)
+        )
+    select_mask = np.empty(len(mesh.vertices), dtype=bool)
+    mesh.vertices.foreach_get('select', select_mask)
+    return select_mask
+
+
+def get_point_coords(mesh, vector_attributes=False):
+    """Get a copy of a mesh's point layers (edit mode aware).
+
+    :returns: A float32 array, shape (layer count, n, 3), the vert coords
+        then the other layers, as in geom.get_point_layers (or
+        geom.get_edit_point_layers in edit mode)
+    """
+    if mesh.is_editmode:
+        edit_mesh = bmesh.from_edit_mesh(mesh)
+        layers = maplus_geom.get_edit_point_layers(
+            edit_mesh,
+            vector_attributes
+        )
+        return np.array(
+            [[vert.co for vert in edit_mesh.verts]] +
+            [[vert[layer] for vert in edit_mesh.verts] for layer in layers],
+            dtype=np.float32
+        ).reshape((len(layers) + 1, -1, 3))
+    return maplus_geom.read_point_layers(
+        maplus_geom.get_point_layers(mesh, vector_attributes),
+        len(mesh.vertices)
+    )
+
+
+def record_mesh(mesh, matrix, selected_only=False, vector_attributes=False):
+    """Record a mesh data transform, call before it's applied.
+
+    :param mesh: The mesh datablock
+    :param matrix: The (local) 4x4 matrix (mathutils or numpy)
+    :param selected_only: If only the selected verts are transformed
+    :param vector_attributes: If the float vector point attributes are
+        transformed too
+    """
+    if recording_steps is None:
+        return
+    matrix = np.array(matrix, dtype=np.float64)
+    snapshot = None
+    if not is_invertible(matrix):
+        snapshot = get_point_coords(mesh, vector_attributes)
+    recording_steps.append(JournalStep(
+        'MESH',
+        mesh.session_uid,
+        mesh.name,
+        matrix,
+        np.packbits(get_select_mask(mesh)) if selected_only else None,
+        vector_attributes,
+        snapshot
+    ))
+
+
+def clear_journal(*args):
+    entries.clear()
+
+
+def register_handlers():
+    # Blender's undo/redo and file loads change the scene under the
+    # journal, its inverse transforms no longer apply
+    for handlers in (bpy.app.handlers.undo_post,
+                     bpy.app.handlers.redo_post,
+                     bpy.app.handlers.load_post):
+        handlers.append(clear_journal)
+
+
+def unregister_handlers():
+    for handlers in (bpy.app.handlers.undo_post,
+                     bpy.app.handlers.redo_post,
+                     bpy.app.handlers.load_post):
+        if clear_journal in handlers:
+            handlers.remove(clear_journal)
+    clear_journal()
@@ -0,0 +1,383 @@
+"""Spatial indices over scene meshes (nearest vert lookups, ray casts)."""
+
+
+import collections
+
+import bpy
+import mathutils
+import mathutils.bvhtree
+import mathutils.kdtree
+import numpy as np
+
+from . import cache as maplus_cache
+
+
+# Vert KD-trees (in local coords) and local bounds, per mesh datablock.
+# Trees are only built for meshes whose bounds are close enough to a
+# query to matter, and are weighted by vert count, so scenes with
+# hundreds of meshes don't keep hundreds of trees around. The newest tree
+# is kept even past max_weight, a mesh that big is the one a tree is most
+# expensive to rebuild for (on every snap)
+vert_index_cache = maplus_cache.DatablockCache(
+    max_items=256,
+    max_weight=2000000,
+    pin_newest=True
+)
+# BVH trees over mesh triangles (in local coords), per mesh datablock (or
+# per object, for evaluated meshes). Weighted by triangle count, big
+# trees are slow to build but cheap to keep around and query
+surface_index_cache = maplus_cache.DatablockCache(
+    max_items=16,
+    max_weight=8000000
+)
+
+
+NearestVert = collections.namedtuple(
+    'NearestVert',
+    ['co', 'distance', 'mesh_object', 'index']
+)
+SurfaceHit = collections.namedtuple(
+    'SurfaceHit',
+    ['co', 'normal', 'distance', 'mesh_object', 'polygon_index']
+)
+
+
+def get_local_vert_coords(mesh_object):
+    """Get the local coords of all of a mesh object's verts, as (n, 3)."""
+    mesh = mesh_object.data
+    if mesh.is_editmode:
+        mesh_object.update_from_editmode()
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    return coords.reshape((-1, 3))
+
+
+def get_vert_index_stamp(mesh):
+    """Cheap sanity check for cached indices, on top of depsgraph updates."""
+    return (len(mesh.vertices), mesh.is_editmode)
+
+
+def get_local_bounds(mesh_object):
+    """Get the (cached) local bounds (min, max) of a mesh object's verts.
+
+    Read from the vert coords rather than from the object's bound_box,
+    which covers the evaluated mesh and is stale during edit mode.
+    """
+    mesh = mesh_object.data
+    stamp = get_vert_index_stamp(mesh)
+    bounds = vert_index_cache.get(mesh.session_uid, 'bounds')
+    if bounds is None or bounds[2] != stamp:
+        coords = get_local_vert_coords(mesh_object)
+        bounds = (coords.min(axis=0), coords.max(axis=0), stamp)
+        vert_index_cache.set(mesh.session_uid, bounds, kind='bounds')
+    return bounds[0], bounds[1]
+
+
+def get_vert_kdtree(mesh_object):
+    """Get the (cached) KD-tree of a mesh object's verts, in local coords.
+
+    The tree is built lazily on first use, and rebuilt only after the
+    depsgraph reports the mesh as updated.
+    """
+    mesh = mesh_object.data
+    stamp = get_vert_index_stamp(mesh)
+    entry = vert_index_cache.get(mesh.session_uid, 'kdtree')
+    if entry is None or entry[1] != stamp:
+        coords = get_local_vert_coords(mesh_object)
+        kd_tree = mathutils.kdtree.KDTree(len(coords))
+        for index, co in enumerate(coords.tolist()):
+            kd_tree.insert(co, index)
+        kd_tree.balance()
+        entry = (kd_tree, stamp)
+        vert_index_cache.set(
+            mesh.session_uid,
+            entry,
+            kind='kdtree',
+            weight=max(len(coords), 1)
+        )
+    return entry[0]
+
+
+def find_nearest_vert(global_co, max_distance, mesh_objects=None):
+    """Find the nearest mesh vert to a global location, within a distance.
+
+    Queries are made in each object's local space, meshes whose bounds
+    are out of range are skipped without building a tree for them.
+
+    :param global_co: The global location to search from
+    :param max_distance: The max (global) distance to a vert
+    :param mesh_objects: The mesh objects to search, defaults to all
+        visible mesh objects
+    :returns: A NearestVert (with a global co), or None if there's no
+        vert within max_distance
+    """
+    if mesh_objects is None:
+        mesh_objects = [
+            item for item in bpy.context.visible_objects
+            if item.type == 'MESH'
+        ]
+    global_co = mathutils.Vector(global_co)
+
+    nearest = None
+    search_distance = max_distance
+    for mesh_object in mesh_objects:
+        if not len(mesh_object.data.vertices):
+            continue
+        matrix = mesh_object.matrix_world
+        # Local distances are at least global ones / the smallest
+        # scaling of the object's transform (and at most / the largest)
+        singular_values = np.linalg.svd(
+            np.array(matrix.to_3x3()),
+            compute_uv=False
+        )
+        min_scale = singular_values[-1]
+        if min_scale < 1e-12:
+            continue
+        local_co = matrix.inverted() @ global_co
+
+        bounds_min, bounds_max = get_local_bounds(mesh_object)
+        outside = np.maximum(
+            np.maximum(bounds_min - local_co, local_co - bounds_max),
+            0.0
+        )
+        if np.linalg.norm(outside) * min_scale > search_distance:
+            continue
+
+        kd_tree = get_vert_kdtree(mesh_object)
+        if singular_values[0] - min_scale < 1e-6 * min_scale:
+            # Uniform scaling, the nearest local vert is the nearest global one
+            candidates = [kd_tree.find(local_co)]
+        else:
+            candidates = kd_tree.find_range(
+                local_co,
+                search_distance / min_scale
+            )
+        for co, index, local_distance in candidates:
+            if index is None:
+                continue
+            global_vert_co = matrix @ co
+            distance = (global_vert_co - global_co).length
+            if distance <= search_distance:
+                search_distance = distance
+                nearest = NearestVert(
+                    global_vert_co,
+                    distance,
+                    mesh_object,
+                    index
+                )
+    return nearest
+
+
+class SurfaceIndex(object):
+    """A BVH tree over a mesh's triangles, plus what's needed to shade hits."""
+
+    __slots__ = (
+        'tree',
+        'coords',
+        'triangles',
+        'triangle_polygons',
+        'smooth',
+        'vert_normals',
+        'stamp',
+    )
+
+    def __init__(self, mesh, stamp):
+        mesh.calc_loop_triangles()
+        vert_count = len(mesh.vertices)
+        triangle_count = len(mesh.loop_triangles)
+        self.coords = np.empty(vert_count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', self.coords)
+        self.coords = self.coords.reshape((-1, 3))
+        self.vert_normals = np.empty(vert_count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('normal', self.vert_normals)
+        self.vert_normals = self.vert_normals.reshape((-1, 3))
+        self.triangles = np.empty(triangle_count * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get('vertices', self.triangles)
+        self.triangles = self.triangles.reshape((-1, 3))
+        self.triangle_polygons = np.empty(triangle_count, dtype=np.int32)
+        mesh.loop_triangles.foreach_get(
+            'polygon_index',
+            self.triangle_polygons
+        )
+        self.smooth = np.empty(len(mesh.polygons), dtype=bool)
+        mesh.polygons.foreach_get('use_smooth', self.smooth)
+        # Triangle indices in the tree are rows in self.triangles
+        self.tree = mathutils.bvhtree.BVHTree.FromPolygons(
+            self.coords.tolist(),
+            self.triangles.tolist(),
+            all_triangles=True
+        )
+        self.stamp = stamp
+
+    def get_hit_normal(self, triangle_index, local_co, face_normal):
+        """Get the (local) shading normal at a hit on a triangle.
+
+        Smooth shaded faces get their vert normals interpolated with the
+        barycentric coords of the hit, flat ones get the face normal.
+        """
+        if not self.smooth[self.triangle_polygons[triangle_index]]:
+            return face_normal
+        tri_verts = self.triangles[triangle_index]
+        corner_a, corner_b, corner_c = self.coords[tri_verts]
+        edge_1 = corner_b - corner_a
+        edge_2 = corner_c - corner_a
+        to_hit = np.array(local_co) - corner_a
+        dot_11 = edge_1 @ edge_1
+        dot_12 = edge_1 @ edge_2
+        dot_22 = edge_2 @ edge_2
+        denominator = dot_11 * dot_22 - dot_12 * dot_12
+        if abs(denominator) < 1e-30:
+            return face_normal
+        dot_h1 = to_hit @ edge_1
+        dot_h2 = to_hit @ edge_2
+        weight_b = (dot_22 * dot_h1 - dot_12 * dot_h2) / denominator
+        weight_c = (dot_11 * dot_h2 - dot_12 * dot_h1) / denominator
+        weights = np.array([1.0 - weight_b - weight_c, weight_b, weight_c])
+        normal = mathutils.Vector(weights @ self.vert_normals[tri_verts])
+        if normal.length < 1e-12:
+            return face_normal
+        return normal.normalized()
+
+
+def get_surface_index_stamp(mesh):
+    """Cheap sanity check for cached surface indices (like vert indices).
+
+    In edit mode the mesh data's counts are the ones of the last sync
+    from the edit-mesh, edits since then are caught by the depsgraph
+    handler (see cache.invalidate_updated_datablocks).
+    """
+    return (len(mesh.vertices), len(mesh.polygons), mesh.is_editmode)
+
+
+def get_surface_index(mesh_object, evaluated=False):
+    """Get the (cached) surface index (BVH tree) of a mesh object.
+
+    Built lazily on first use, and rebuilt only after the depsgraph
+    reports the mesh (or, for evaluated meshes, the object) as updated.
+    A mesh in edit mode is only synced from its edit-mesh when the index
+    is (re)built, cache hits don't touch the mesh data.
+
+    :param evaluated: Index the evaluated (modifier applied) mesh, which
+        is cached per object rather than per mesh datablock
+    """
+    if evaluated:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        mesh = mesh_object.evaluated_get(depsgraph).data
+        cache_uid = mesh_object.session_uid
+        kind = 'evaluated_surface'
+    else:
+        mesh = mesh_object.data
+        cache_uid = mesh.session_uid
+        kind = 'surface'
+
+    surface_index = surface_index_cache.get(cache_uid, kind)
+    if (surface_index is None
+            or surface_index.stamp != get_surface_index_stamp(mesh)):
+        if not evaluated and mesh.is_editmode:
+            mesh_object.update_from_editmode()
+        surface_index = SurfaceIndex(mesh, get_surface_index_stamp(mesh))
+        surface_index_cache.set(
+            cache_uid,
+            surface_index,
+            kind=kind,
+            weight=max(len(surface_index.triangles), 1)
+        )
+    return surface_index
+
+
+def ray_hits_bounds(origin, direction, bounds_min, bounds_max):
+    """Whether a ray (origin, direction) passes through an axis aligned box."""
+    origin = np.array(origin)
+    direction = np.array(direction)
+    # Pad the box a little, so hits on its faces aren't lost to rounding
+    padding = 1e-6 * max(np.abs(bounds_max - bounds_min).max(), 1.0)
+    bounds_min = bounds_min - padding
+    bounds_max = bounds_max + padding
+
+    parallel = np.abs(direction) < 1e-30
+    if np.any(parallel & ((origin < bounds_min) | (origin > bounds_max))):
+        return False
+    if np.all(parallel):
+        return True
+    t_1 = (bounds_min[~parallel] - origin[~parallel]) / direction[~parallel]
+    t_2 = (bounds_max[~parallel] - origin[~parallel]) / direction[~parallel]
+    t_near = np.minimum(t_1, t_2).max()
+    t_far = np.maximum(t_1, t_2).min()
+    return t_far >= max(t_near, 0.0)
+
+
+def cast_ray(global_origin,
+             global_direction,
+             mesh_objects=None,
+             evaluated=False):
+    """Cast a ray against mesh surfaces, and get the nearest hit.
+
+    Rays are cast in each object's local space, objects whose bounds
+    the ray misses are skipped without building a tree for them.
+
+    :param global_origin: The global start of the ray
+    :param global_direction: The global direction of the ray
+    :param mesh_objects: The mesh objects to cast against, defaults to
+        all visible mesh objects
+    :param evaluated: Cast against evaluated (modifier applied) meshes
+    :returns: A SurfaceHit (with a global co and unit normal), or None
+        if nothing was hit
+    """
+    if mesh_objects is None:
+        mesh_objects = [
+            item for item in bpy.context.visible_objects
+            if item.type == 'MESH'
+        ]
+    global_origin = mathutils.Vector(global_origin)
+    global_direction = mathutils.Vector(global_direction).normalized()
+
+    nearest = None
+    for mesh_object in mesh_objects:
+        if not len(mesh_object.data.polygons) and not evaluated:
+            continue
+        matrix = mesh_object.matrix_world
+        try:
+            inverse_matrix = matrix.inverted()
+        except ValueError:
+            # Degenerate (zero scale) transform, nothing to hit
+            continue
+        local_origin = inverse_matrix @ global_origin
+        local_direction = inverse_matrix.to_3x3() @ global_direction
+
+        if evaluated:
+            corners = np.array([tuple(co) for co in mesh_object.bound_box])
+            bounds_min, bounds_max = corners.min(axis=0), corners.max(axis=0)
+        else:
+            bounds_min, bounds_max = get_local_bounds(mesh_object)
+        if not ray_hits_bounds(local_origin,
+                               local_direction,
+                               bounds_min,
+                               bounds_max):
+            continue
+
+        surface_index = get_surface_index(mesh_object, evaluated=evaluated)
+        local_co, face_normal, triangle_index, local_distance = (
+            surface_index.tree.ray_cast(local_origin, local_direction)
+        )
+        if local_co is None:
+            continue
+        global_co = matrix @ local_co
+        distance = (global_co - global_origin).length
+        if nearest is not None and distance >= nearest.distance:
+            continue
+
+        local_normal = surface_index.get_hit_normal(
+            triangle_index,
+            local_co,
+            face_normal
+        )
+        # Normals transform by the inverse transpose
+        global_normal = inverse_matrix.to_3x3().transposed() @ local_normal
+        nearest = SurfaceHit(
+            global_co,
+            global_normal.normalized(),
+            distance,
+            mesh_object,
+            int(surface_index.triangle_polygons[triangle_index])
+        )
+    return nearest
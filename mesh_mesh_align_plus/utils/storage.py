@@ -1,9 +1,16 @@
 """Data structures & tools for storing, modifying, and moving addon data."""
 
 
+import os
+
 import bpy
 
 
+# The addon's root package (this module is in its utils subpackage), which
+# is the key of its preferences
+addon_package = __package__.rpartition('.')[0]
+
+
 # CollectionProperty is a list-like data structure that can hold instances of
 # PropertyGroup subclasses. This lightweight container allows us to store and
 # serialize basic lists of data in the blend file. In other words, an instance
@@ -15,6 +22,68 @@ class BasicVariant(bpy.types.PropertyGroup):
     )
 
 
+# One row of a batch alignment: a transformation (its type & settings) applied
+# to a set of objects, optionally with its source/dest items overridden
+class MAPlusBatchAlignRow(bpy.types.PropertyGroup):
+    """Holds one row of a batch alignment"""
+    targets: bpy.props.CollectionProperty(
+        type=BasicVariant,
+        description="Names of the objects to transform (in val_str)"
+    )
+    transformation: bpy.props.IntProperty(
+        description=(
+            "Pointer to an item in the list, the transformation"
+            " (its type and settings are used for this row)"
+        ),
+        default=0
+    )
+    src: bpy.props.IntProperty(
+        description=(
+            "Pointer to an item in the list, the source item"
+            " (-1 to use the transformation's own)"
+        ),
+        default=-1
+    )
+    dest: bpy.props.IntProperty(
+        description=(
+            "Pointer to an item in the list, the destination item"
+            " (-1 to use the transformation's own)"
+        ),
+        default=-1
+    )
+
+
+# One target object of a "compute only" transformation run, holds what the
+# transformation would do to it (the scene itself is left untouched)
+class MAPlusComputedTransform(bpy.types.PropertyGroup):
+    """Holds the computed result of a transformation for one object"""
+    target: bpy.props.PointerProperty(
+        type=bpy.types.Object,
+        description="The object this result is for"
+    )
+    transform: bpy.props.FloatVectorProperty(
+        description="The global transform applied to the target",
+        size=(4, 4),
+        subtype='MATRIX'
+    )
+    matrix_world: bpy.props.FloatVectorProperty(
+        description="The target's world matrix after the transformation",
+        size=(4, 4),
+        subtype='MATRIX'
+    )
+    transforms_mesh: bpy.props.BoolProperty(
+        description="Whether the target's mesh data is transformed"
+    )
+    mesh_matrix: bpy.props.FloatVectorProperty(
+        description=(
+            "The (local) matrix the target's mesh data is transformed by,"
+            " if transforms_mesh is set"
+        ),
+        size=(4, 4),
+        subtype='MATRIX'
+    )
+
+
 # This is the basic data structure for the addon. The item can be a point,
 # line, plane, calc, or transf (only one at a time), chosen by the user
 # (defaults to point). A MAPlusPrimitive always has data slots for each of
@@ -318,6 +387,61 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
         default=0
     )
 
+    # Results of the last "compute only" run of a transformation
+    computed_transforms: bpy.props.CollectionProperty(
+        type=MAPlusComputedTransform
+    )
+
+
+# Addon wide settings, shown in the addon's preferences
+class MAPlusPreferences(bpy.types.AddonPreferences):
+    bl_idname = addon_package
+
+    transform_workers: bpy.props.IntProperty(
+        name="Transform Worker Threads",
+        description=(
+            "How many threads mesh level transforms on several (or very"
+            " large) meshes use to transform vert coords, 1 transforms"
+            " the meshes one after another"
+        ),
+        default=min(os.cpu_count() or 1, 8),
+        min=1,
+        max=64
+    )
+
+    use_undo_journal: bpy.props.BoolProperty(
+        name="Transform Undo Journal",
+        description=(
+            "Record the matrices the transformation tools apply, to revert"
+            " them with Revert Last Transform (by applying the inverse)"
+            " instead of Blender's undo, which keeps a full copy of every"
+            " transformed mesh. Applies after restarting Blender"
+        ),
+        default=False
+    )
+
+    transform_vector_attributes: bpy.props.BoolProperty(
+        name="Transform Vector Attributes",
+        description=(
+            "Mesh level transforms also transform the meshes' float vector"
+            " point attributes, as positions (vert coords, shape keys and"
+            " custom normals are always transformed)"
+        ),
+        default=False
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, 'transform_workers')
+        layout.prop(self, 'transform_vector_attributes')
+        layout.prop(self, 'use_undo_journal')
+
+
+def get_preferences():
+    """Get the addon's preferences (None if the addon isn't enabled)."""
+    addon = bpy.context.preferences.addons.get(addon_package)
+    return addon.preferences if addon else None
+
 
 # Defines one instance of the addon data (one per scene)
 class MAPlusData(bpy.types.PropertyGroup):
@@ -838,6 +962,34 @@ class MAPlusData(bpy.types.PropertyGroup):
         default=False
     )
 
+    # Grab global settings
+    grab_from_evaluated: bpy.props.BoolProperty(
+        description=(
+            "Grab from the evaluated mesh (with modifiers applied, e.g."
+            " verts generated by mirror/array/subdivision modifiers)"
+            " instead of the base mesh"
+        ),
+        default=False
+    )
+    snap_to_verts: bpy.props.BoolProperty(
+        description=(
+            "Snap coordinates grabbed from the 3D cursor to the nearest"
+            " mesh vert (on visible mesh objects), when there's one"
+            " within the snap tolerance"
+        ),
+        default=False
+    )
+    snap_tolerance: bpy.props.FloatProperty(
+        description=(
+            "The max distance coordinates are moved by when snapping"
+            " them to mesh verts"
+        ),
+        default=0.01,
+        min=0.0,
+        precision=6,
+        subtype='DISTANCE'
+    )
+
     # Calculation global settings
     calc_result_to_clipboard: bpy.props.BoolProperty(
         description=(
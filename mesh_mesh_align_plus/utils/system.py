@@ -10,15 +10,21 @@ from .. import align_objects as maplus_aobjects
 from .. import distribute_objects as maplus_dobjects
 from .. import align_planes as maplus_apl
 from .. import axis_rotate as maplus_axr
+from .. import batch_align as maplus_batch
 from .. import calculate_compose as maplus_calc_compose
 from .. import directional_slide as maplus_ds
 from .. import scale_match_edge as maplus_sme
+from .. import undo_journal as maplus_undo_journal
+from . import cache as maplus_cache
 from . import geom as maplus_geom
 from . import gui_tools as maplus_guitools
+from . import journal as maplus_journal
 from . import storage as maplus_storage
 
 
 classes = (
+    # Registered first, register() reads them for the operators below
+    maplus_storage.MAPlusPreferences,
 
     maplus_apt.MAPLUS_OT_AlignPointsBase,
     maplus_apt.MAPLUS_OT_AlignPointsObject,
@@ -28,6 +34,8 @@ classes = (
     maplus_apt.MAPLUS_OT_QuickAlignPointsMeshSelected,
     maplus_apt.MAPLUS_OT_AlignPointsWholeMesh,
     maplus_apt.MAPLUS_OT_QuickAlignPointsWholeMesh,
+    maplus_apt.MAPLUS_OT_ComputeAlignPoints,
+    maplus_apt.MAPLUS_OT_QuickComputeAlignPoints,
     maplus_apt.MAPLUS_OT_EasyAlignPoints,
     maplus_apt.MAPLUS_OT_ClearEasyAlignPoints,
     maplus_apt.MAPLUS_OT_ShowHideEasyApt,
@@ -41,6 +49,8 @@ classes = (
     maplus_aln.MAPLUS_OT_AlignLinesWholeMesh,
     maplus_aln.MAPLUS_OT_QuickAlignLinesMeshSelected,
     maplus_aln.MAPLUS_OT_QuickAlignLinesWholeMesh,
+    maplus_aln.MAPLUS_OT_ComputeAlignLines,
+    maplus_aln.MAPLUS_OT_QuickComputeAlignLines,
     maplus_aln.MAPLUS_OT_EasyAlignLines,
     maplus_aln.MAPLUS_OT_ClearEasyAlignLines,
     maplus_aln.MAPLUS_OT_ShowHideEasyAln,
@@ -54,6 +64,9 @@ classes = (
     maplus_apl.MAPLUS_OT_AlignPlanesWholeMesh,
     maplus_apl.MAPLUS_OT_QuickAlignPlanesMeshSelected,
     maplus_apl.MAPLUS_OT_QuickAlignPlanesWholeMesh,
+    maplus_apl.MAPLUS_OT_ComputeAlignPlanes,
+    maplus_apl.MAPLUS_OT_QuickComputeAlignPlanes,
+    maplus_apl.MAPLUS_OT_QuickComputeAlignPlanesSetOrigin,
     maplus_apl.MAPLUS_OT_EasyAlignPlanes,
     maplus_apl.MAPLUS_OT_ClearEasyAlignPlanes,
     maplus_apl.MAPLUS_OT_ShowHideEasyApl,
@@ -67,6 +80,8 @@ classes = (
     maplus_ds.MAPLUS_OT_DirectionalSlideWholeMesh,
     maplus_ds.MAPLUS_OT_QuickDirectionalSlideMeshSelected,
     maplus_ds.MAPLUS_OT_QuickDirectionalSlideWholeMesh,
+    maplus_ds.MAPLUS_OT_ComputeDirectionalSlide,
+    maplus_ds.MAPLUS_OT_QuickComputeDirectionalSlide,
     maplus_ds.MAPLUS_OT_EasyDirectionalSlide,
     maplus_ds.MAPLUS_OT_ShowHideEasyDs,
     maplus_ds.MAPLUS_OT_ShowHideQuickDs,
@@ -79,6 +94,8 @@ classes = (
     maplus_sme.MAPLUS_OT_QuickScaleMatchEdgeMeshSelected,
     maplus_sme.MAPLUS_OT_ScaleMatchEdgeWholeMesh,
     maplus_sme.MAPLUS_OT_QuickScaleMatchEdgeWholeMesh,
+    maplus_sme.MAPLUS_OT_ComputeScaleMatchEdge,
+    maplus_sme.MAPLUS_OT_QuickComputeScaleMatchEdge,
     maplus_sme.MAPLUS_OT_EasyScaleMatchEdge,
     maplus_sme.MAPLUS_OT_ClearEasyScaleMatchEdge,
     maplus_sme.MAPLUS_OT_ShowHideEasySme,
@@ -92,6 +109,8 @@ classes = (
     maplus_axr.MAPLUS_OT_AxisRotateWholeMesh,
     maplus_axr.MAPLUS_OT_QuickAxisRotateMeshSelected,
     maplus_axr.MAPLUS_OT_QuickAxisRotateWholeMesh,
+    maplus_axr.MAPLUS_OT_ComputeAxisRotate,
+    maplus_axr.MAPLUS_OT_QuickComputeAxisRotate,
     maplus_axr.MAPLUS_OT_EasyAxisRotate,
     maplus_axr.MAPLUS_OT_ClearEasyAxisRotate,
     maplus_axr.MAPLUS_OT_ShowHideEasyAxr,
@@ -149,6 +168,17 @@ classes = (
     maplus_geom.MAPLUS_OT_GrabNormalBase,
     maplus_geom.MAPLUS_OT_GrabFromCursorBase,
     maplus_geom.MAPLUS_OT_SendCoordToCursorBase,
+    maplus_geom.MAPLUS_OT_GrabFitBase,
+    maplus_geom.MAPLUS_OT_GrabPlaneFitBase,
+    maplus_geom.MAPLUS_OT_GrabLineFitBase,
+    maplus_geom.MAPLUS_OT_GrabAxisFitBase,
+    maplus_geom.MAPLUS_OT_GrabSphereFitBase,
+    maplus_geom.MAPLUS_OT_GrabElementBase,
+    maplus_geom.MAPLUS_OT_GrabElementPointBase,
+    maplus_geom.MAPLUS_OT_GrabElementLineBase,
+    maplus_geom.MAPLUS_OT_GrabSurfacePickBase,
+    maplus_geom.MAPLUS_OT_GrabSurfacePointBase,
+    maplus_geom.MAPLUS_OT_GrabSurfaceNormalBase,
     maplus_geom.MAPLUS_OT_GrabAllSlot1,
     maplus_geom.MAPLUS_OT_GrabAllSlot1Loc,
     maplus_geom.MAPLUS_OT_GrabAllSlot2,
@@ -453,6 +483,69 @@ classes = (
     maplus_geom.MAPLUS_OT_QuickAlignPlanesGrabSrcLoc,
     maplus_geom.MAPLUS_OT_QuickAlignPlanesGrabDestLoc,
     maplus_geom.MAPLUS_OT_QuickAlignPlanesSetOriginModeGrabDestLoc,
+    maplus_geom.MAPLUS_OT_GrabPlaneFit,
+    maplus_geom.MAPLUS_OT_GrabPlaneFitSlot1,
+    maplus_geom.MAPLUS_OT_GrabPlaneFitSlot2,
+    maplus_geom.MAPLUS_OT_GrabPlaneFitCalcResult,
+    maplus_geom.MAPLUS_OT_QuickAlignPlanesGrabFitSrc,
+    maplus_geom.MAPLUS_OT_QuickAlignPlanesGrabFitDest,
+    maplus_geom.MAPLUS_OT_QuickAlignPlanesSetOriginModeGrabFitDest,
+    maplus_geom.MAPLUS_OT_GrabLineFit,
+    maplus_geom.MAPLUS_OT_GrabLineFitSlot1,
+    maplus_geom.MAPLUS_OT_GrabLineFitSlot2,
+    maplus_geom.MAPLUS_OT_GrabLineFitCalcResult,
+    maplus_geom.MAPLUS_OT_QuickAlignLinesGrabFitSrc,
+    maplus_geom.MAPLUS_OT_QuickAlignLinesGrabFitDest,
+    maplus_geom.MAPLUS_OT_QuickAxisRotateGrabFitSrc,
+    maplus_geom.MAPLUS_OT_QuickDirectionalSlideGrabFitSrc,
+    maplus_geom.MAPLUS_OT_QuickScaleMatchEdgeGrabFitSrc,
+    maplus_geom.MAPLUS_OT_QuickScaleMatchEdgeGrabFitDest,
+    maplus_geom.MAPLUS_OT_GrabAxisFit,
+    maplus_geom.MAPLUS_OT_GrabAxisFitSlot1,
+    maplus_geom.MAPLUS_OT_GrabAxisFitSlot2,
+    maplus_geom.MAPLUS_OT_GrabAxisFitCalcResult,
+    maplus_geom.MAPLUS_OT_QuickAlignLinesGrabAxisFitSrc,
+    maplus_geom.MAPLUS_OT_QuickAlignLinesGrabAxisFitDest,
+    maplus_geom.MAPLUS_OT_QuickAxisRotateGrabAxisFitSrc,
+    maplus_geom.MAPLUS_OT_GrabSphereFit,
+    maplus_geom.MAPLUS_OT_GrabSphereFitSlot1,
+    maplus_geom.MAPLUS_OT_GrabSphereFitSlot2,
+    maplus_geom.MAPLUS_OT_GrabSphereFitCalcResult,
+    maplus_geom.MAPLUS_OT_QuickAlignPointsGrabSphereFitSrc,
+    maplus_geom.MAPLUS_OT_QuickAlignPointsGrabSphereFitDest,
+    maplus_geom.MAPLUS_OT_GrabElementPoint,
+    maplus_geom.MAPLUS_OT_GrabElementPointSlot1,
+    maplus_geom.MAPLUS_OT_GrabElementPointSlot2,
+    maplus_geom.MAPLUS_OT_GrabElementPointCalcResult,
+    maplus_geom.MAPLUS_OT_QuickAlignPointsGrabElementSrc,
+    maplus_geom.MAPLUS_OT_QuickAlignPointsGrabElementDest,
+    maplus_geom.MAPLUS_OT_GrabElementLine,
+    maplus_geom.MAPLUS_OT_GrabElementLineSlot1,
+    maplus_geom.MAPLUS_OT_GrabElementLineSlot2,
+    maplus_geom.MAPLUS_OT_GrabElementLineCalcResult,
+    maplus_geom.MAPLUS_OT_QuickAlignLinesGrabElementSrc,
+    maplus_geom.MAPLUS_OT_QuickAlignLinesGrabElementDest,
+    maplus_geom.MAPLUS_OT_QuickAxisRotateGrabElementSrc,
+    maplus_geom.MAPLUS_OT_QuickDirectionalSlideGrabElementSrc,
+    maplus_geom.MAPLUS_OT_QuickScaleMatchEdgeGrabElementSrc,
+    maplus_geom.MAPLUS_OT_QuickScaleMatchEdgeGrabElementDest,
+    maplus_geom.MAPLUS_OT_GrabSurfacePoint,
+    maplus_geom.MAPLUS_OT_GrabSurfacePointSlot1,
+    maplus_geom.MAPLUS_OT_GrabSurfacePointSlot2,
+    maplus_geom.MAPLUS_OT_GrabSurfacePointCalcResult,
+    maplus_geom.MAPLUS_OT_QuickAlignPointsGrabSurfaceSrc,
+    maplus_geom.MAPLUS_OT_QuickAlignPointsGrabSurfaceDest,
+    maplus_geom.MAPLUS_OT_GrabSurfaceNormal,
+    maplus_geom.MAPLUS_OT_GrabSurfaceNormalSlot1,
+    maplus_geom.MAPLUS_OT_GrabSurfaceNormalSlot2,
+    maplus_geom.MAPLUS_OT_GrabSurfaceNormalCalcResult,
+    maplus_geom.MAPLUS_OT_QuickAlignLinesGrabSurfaceSrc,
+    maplus_geom.MAPLUS_OT_QuickAlignLinesGrabSurfaceDest,
+    maplus_geom.MAPLUS_OT_QuickAxisRotateGrabSurfaceSrc,
+    maplus_geom.MAPLUS_OT_QuickDirectionalSlideGrabSurfaceSrc,
+    maplus_geom.MAPLUS_OT_QuickScaleMatchEdgeGrabSurfaceSrc,
+    maplus_geom.MAPLUS_OT_QuickScaleMatchEdgeGrabSurfaceDest,
+    maplus_geom.MAPLUS_OT_SnapCoordsToVerts,
     maplus_geom.MAPLUS_OT_SwapPointsBase,
     maplus_geom.MAPLUS_OT_SwapLinePoints,
     maplus_geom.MAPLUS_OT_Slot1SwapLinePoints,
@@ -542,8 +635,12 @@ classes = (
     maplus_geom.MAPLUS_OT_ShowHideDistAlongLineGeom,
 
     maplus_storage.BasicVariant,
+    maplus_storage.MAPlusBatchAlignRow,
+    maplus_storage.MAPlusComputedTransform,
     maplus_storage.MAPlusPrimitive,
     maplus_storage.MAPlusData,
+    maplus_batch.MAPLUS_OT_BatchAlign,
+    maplus_undo_journal.MAPLUS_OT_RevertLastTransform,
     maplus_storage.MAPLUS_OT_CopyToOtherBase,
 
     maplus_storage.MAPLUS_OT_PasteIntoAdvToolsActive,
@@ -630,10 +727,43 @@ classes = (
     # maplus_except.InsufficientSelectionError,
 )
 
+# The transformation operators, whose transforms the undo journal records
+# (they don't push Blender undo steps while it's on, see register)
+journaled_operators = (
+    maplus_apt.MAPLUS_OT_AlignPointsBase,
+    maplus_apt.MAPLUS_OT_EasyAlignPoints,
+    maplus_aln.MAPLUS_OT_AlignLinesBase,
+    maplus_aln.MAPLUS_OT_EasyAlignLines,
+    maplus_apl.MAPLUS_OT_AlignPlanesBase,
+    maplus_apl.MAPLUS_OT_EasyAlignPlanes,
+    maplus_ds.MAPLUS_OT_DirectionalSlideBase,
+    maplus_ds.MAPLUS_OT_EasyDirectionalSlide,
+    maplus_sme.MAPLUS_OT_ScaleMatchEdgeBase,
+    maplus_sme.MAPLUS_OT_EasyScaleMatchEdge,
+    maplus_axr.MAPLUS_OT_AxisRotateBase,
+    maplus_axr.MAPLUS_OT_EasyAxisRotate,
+    maplus_batch.MAPLUS_OT_BatchAlign,
+)
+
 
 def register():
     # Make custom classes available inside blender via bpy.types
     for cls in classes:
+        # With the undo journal on, transformation operators skip the
+        # (full mesh copy) Blender undo step, they're reverted through
+        # the journal instead. MAPlusPreferences is the first class in
+        # classes, so the stored preference can be read here (when the
+        # addon is loaded at startup), changes to it apply when Blender
+        # is restarted.
+        # (The compute operators never push one, they change nothing.)
+        if (issubclass(cls, journaled_operators)
+                and not getattr(cls, 'compute_only', False)):
+            bl_options = set(cls.__dict__.get('bl_options', cls.bl_options))
+            if maplus_journal.is_enabled():
+                bl_options.discard('UNDO')
+            else:
+                bl_options.add('UNDO')
+            cls.bl_options = bl_options
         bpy.utils.register_class(cls)
 
     # Extend the scene class here to include the addon data
@@ -644,8 +774,13 @@ def register():
     bpy.types.VIEW3D_MT_object_context_menu.append(maplus_guitools.specials_menu_items)
     bpy.types.VIEW3D_MT_edit_mesh_context_menu.append(maplus_guitools.specials_menu_items)
 
+    maplus_cache.register_handlers()
+    maplus_journal.register_handlers()
+
 
 def unregister():
+    maplus_journal.unregister_handlers()
+    maplus_cache.unregister_handlers()
     del bpy.types.Scene.maplus_data
     bpy.types.VIEW3D_MT_object_context_menu.remove(maplus_guitools.specials_menu_items)
     bpy.types.VIEW3D_MT_edit_mesh_context_menu.remove(maplus_guitools.specials_menu_items)
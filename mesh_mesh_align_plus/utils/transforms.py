@@ -0,0 +1,733 @@
+"""Applying computed transformations to objects and mesh data."""
+
+
+import collections
+import concurrent.futures
+
+import bmesh
+import bpy
+import mathutils
+import numpy as np
+
+from . import align_kernels as maplus_kernels
+from . import geom as maplus_geom
+from . import journal as maplus_journal
+from . import storage as maplus_storage
+
+
+# What a transform would do to one object (see get_transform_results)
+TransformResult = collections.namedtuple(
+    'TransformResult',
+    ['target', 'transform', 'matrix_world', 'mesh_matrix']
+)
+
+# The transform targets of apply_transform, as enum items (for the
+# compute operators' target property)
+transform_target_items = [
+    ('OBJECT', 'Object', 'Transform the objects'),
+    ('OBJECT_ORIGIN', 'Object Origin', 'Move the object origins only'),
+    ('MESH_SELECTED', 'Mesh Selected', 'Transform the selected verts'),
+    ('WHOLE_MESH', 'Whole Mesh', 'Transform the mesh data'),
+]
+
+# Meshes with fewer verts are transformed on the main thread by
+# apply_mesh_transforms (the thread pool costs more than it saves on them)
+threaded_min_vert_count = 20000
+# How many vert coords one thread pool job transforms
+threaded_chunk_size = 1 << 18
+
+
+def to_matrix(matrix):
+    """Get a 4x4 matrix (e.g. from utils.align_kernels) as a mathutils.Matrix."""
+    if isinstance(matrix, mathutils.Matrix):
+        return matrix
+    return mathutils.Matrix(np.asarray(matrix).tolist())
+
+
+def get_local_transform(mesh_object, matrix):
+    """Convert a global 4x4 transform to a mesh object's local space."""
+    return to_matrix(
+        maplus_kernels.get_local_matrix(matrix, mesh_object.matrix_world)
+    )
+
+
+def get_parent_depth(item):
+    """Get the number of parents above an object in its hierarchy."""
+    depth = 0
+    while item.parent is not None:
+        item = item.parent
+        depth += 1
+    return depth
+
+
+def transform_objects(objects, transforms):
+    """Apply global 4x4 transforms to objects, in one batch.
+
+    Each object's final matrix_world is computed from its unaltered one
+    up front, the results are assigned (parents before their children,
+    so children are placed relative to their parent's final transform)
+    and the view layer is updated once at the end, instead of once or
+    twice per object.
+
+    :param objects: A list of objects
+    :param transforms: A global 4x4 matrix for all objects, or a list
+        with one per object
+    """
+    if np.ndim(transforms) == 2:
+        transforms = [transforms] * len(objects)
+    transforms = [to_matrix(transform) for transform in transforms]
+    for item, transform in zip(objects, transforms):
+        maplus_journal.record_object(item, transform)
+    set_matrices_world(
+        objects,
+        [
+            transform @ item.matrix_world
+            for item, transform in zip(objects, transforms)
+        ]
+    )
+
+
+def set_matrices_world(objects, matrices):
+    """Assign objects their final matrix_world, in one batch.
+
+    Parents are assigned before their children (so children are placed
+    relative to their parent's final transform), the view layer is
+    updated once at the end.
+    """
+    order = sorted(
+        range(len(objects)),
+        key=lambda index: get_parent_depth(objects[index])
+    )
+    for index in order:
+        objects[index].matrix_world = matrices[index]
+    bpy.context.view_layer.update()
+
+
+def get_unique_mesh_targets(mesh_objects):
+    """Get one object per mesh datablock from a list of mesh objects.
+
+    Linked duplicates share their mesh data, which must only be
+    transformed once (transforming it for each user compounds the
+    transform). The active object represents its mesh if it's a user,
+    otherwise the first user in the list does.
+    """
+    active_object = bpy.context.view_layer.objects.active
+    unique_targets = {}
+    for item in sorted(mesh_objects, key=lambda item: item != active_object):
+        unique_targets.setdefault(item.data.session_uid, item)
+    return list(unique_targets.values())
+
+
+def get_object_targets(objects, target):
+    """Get the objects an operator's object level transform applies to.
+
+    For 'OBJECT_ORIGIN', only one user per mesh datablock is moved, the
+    other users are kept in place by move_other_mesh_users instead.
+    """
+    if target == 'OBJECT_ORIGIN':
+        return get_unique_mesh_targets(objects)
+    return objects
+
+
+def report_mesh_targets(operator, mesh_targets, mesh_objects):
+    """Report how many mesh datablocks a mesh level transform touched."""
+    operator.report(
+        {'INFO'},
+        'Transformed {0} mesh datablock(s), on {1} object(s)'.format(
+            len(mesh_targets),
+            len(mesh_objects)
+        )
+    )
+
+
+def transform_editmesh(mesh, matrix, selected_only=False,
+                       vector_attributes=False, select_mask=None):
+    """Apply a (local) 4x4 matrix to the verts of a mesh in edit mode.
+
+    The live edit-mesh is transformed in place, so there's no need to
+    leave edit mode (which would write the whole edit-mesh back to the
+    mesh data, only for it to be rebuilt when edit mode is re-entered).
+    The shape key layers (and the float vector layers, if
+    vector_attributes) of the transformed verts are transformed along.
+
+    :param select_mask: An (n,) bool array of the verts to transform,
+        instead of the selected ones (see undo_journal)
+    """
+    edit_mesh = bmesh.from_edit_mesh(mesh)
+    if select_mask is not None:
+        verts = [
+            vert for vert, selected in zip(edit_mesh.verts, select_mask)
+            if selected
+        ]
+        bmesh.ops.transform(edit_mesh, matrix=matrix, verts=verts)
+    elif selected_only:
+        edit_mesh.transform(matrix, filter={'SELECT'})
+        verts = [vert for vert in edit_mesh.verts if vert.select]
+    else:
+        edit_mesh.transform(matrix)
+        verts = edit_mesh.verts
+
+    # (bmesh's transforms only move the vert coords)
+    for layer in maplus_geom.get_edit_point_layers(
+            edit_mesh,
+            vector_attributes):
+        for vert in verts:
+            vert[layer] = matrix @ vert[layer]
+    bmesh.update_edit_mesh(mesh, destructive=False)
+
+
+def get_custom_normals(mesh):
+    """Get a mesh's custom normals, shape (corners, 3) (or None)."""
+    if not mesh.has_custom_normals:
+        return None
+    normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+    mesh.corner_normals.foreach_get('vector', normals)
+    return normals.reshape((-1, 3))
+
+
+def set_custom_normals(mesh, normals, matrix, select_mask=None):
+    """Set a mesh's custom normals, transformed by a (local) 4x4 matrix.
+
+    :param normals: The custom normals from before the verts were
+        transformed (see get_custom_normals)
+    :param select_mask: An (n,) bool array of the transformed verts, only
+        their corners' normals are transformed (None for all corners)
+    """
+    cofactor = maplus_geom.get_cofactor_matrix(matrix)
+    if cofactor is None:
+        return
+    if select_mask is None:
+        corners = slice(None)
+    else:
+        corner_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get('vertex_index', corner_verts)
+        corners = select_mask[corner_verts]
+    transformed = normals[corners] @ cofactor.T
+    lengths = np.linalg.norm(transformed, axis=1)[:, np.newaxis]
+    normals[corners] = np.divide(
+        transformed,
+        lengths,
+        out=np.zeros_like(transformed),
+        where=lengths > 0
+    )
+    mesh.normals_split_custom_set(normals)
+
+
+def transform_mesh_points(mesh, matrix, select_mask=None,
+                          vector_attributes=False):
+    """Apply a (local, affine) 4x4 matrix to a mesh's point layers at once.
+
+    The vert coords, every shape key's coords and (if vector_attributes)
+    the float vector point attributes are read with foreach_get into one
+    array, transformed with a single numpy matrix multiply (only the
+    select_mask rows, if given) and written back with foreach_set, no
+    bmesh is built. Custom normals are transformed along.
+    """
+    layers = maplus_geom.get_point_layers(mesh, vector_attributes)
+    custom_normals = get_custom_normals(mesh)
+    coords = maplus_geom.read_point_layers(layers, len(mesh.vertices))
+    if select_mask is None:
+        coords[:] = maplus_geom.transform_coords(
+            coords.astype(np.float64),
+            matrix
+        )
+    else:
+        coords[:, select_mask] = maplus_geom.transform_coords(
+            coords[:, select_mask].astype(np.float64),
+            matrix
+        )
+    maplus_geom.write_point_layers(layers, coords)
+    if custom_normals is not None:
+        set_custom_normals(mesh, custom_normals, matrix, select_mask)
+    mesh.update()
+
+
+def transform_mesh(mesh, matrix, select_mask=None, vector_attributes=False):
+    """Apply a (local) 4x4 matrix to a mesh's verts and point layers.
+
+    Whole meshes are transformed in place by Mesh.transform (with their
+    shape keys, custom normals are transformed rather than recalculated),
+    otherwise see transform_mesh_points. Meshes in edit mode are
+    transformed through their edit-mesh.
+
+    :param select_mask: An (n,) bool array of the verts to transform, or
+        None to transform all verts
+    :param vector_attributes: Also transform the mesh's float vector point
+        attributes (as positions)
+    """
+    if mesh.is_editmode:
+        transform_editmesh(
+            mesh,
+            matrix,
+            vector_attributes=vector_attributes,
+            select_mask=select_mask
+        )
+        return
+    if select_mask is not None:
+        transform_mesh_points(mesh, matrix, select_mask, vector_attributes)
+        return
+
+    mesh.transform(matrix, shape_keys=True)
+    if vector_attributes:
+        attribute_layers = maplus_geom.get_vector_attribute_layers(mesh)
+        coords = maplus_geom.read_point_layers(
+            attribute_layers,
+            len(mesh.vertices)
+        )
+        maplus_geom.write_point_layers(
+            attribute_layers,
+            maplus_geom.transform_coords(coords.astype(np.float64), matrix)
+        )
+    mesh.update()
+
+
+def transform_whole_mesh(mesh_object, matrix, vector_attributes=False):
+    """Apply a (local) 4x4 matrix to all of a mesh object's verts.
+
+    The verts are transformed in place by Mesh.transform, without a
+    bmesh round trip: no full copy of the mesh is made, and custom data
+    and cached (derived) mesh data are kept, normals are transformed
+    rather than recalculated. Shape keys are transformed along (see
+    transform_mesh).
+    """
+    transform_mesh(
+        mesh_object.data,
+        matrix,
+        vector_attributes=vector_attributes
+    )
+
+
+def transform_selected_verts(mesh_object, matrix, vector_attributes=False):
+    """Apply a (local, affine) 4x4 matrix to a mesh object's selected verts.
+
+    The select flags are read once with foreach_get and the selected
+    verts' coords, shape key coords (and attributes) are transformed in
+    one pass by transform_mesh_points, no bmesh is built.
+    """
+    mesh = mesh_object.data
+    if mesh.is_editmode:
+        transform_editmesh(
+            mesh,
+            matrix,
+            selected_only=True,
+            vector_attributes=vector_attributes
+        )
+        return
+
+    select_mask = np.empty(len(mesh.vertices), dtype=bool)
+    mesh.vertices.foreach_get('select', select_mask)
+    if not select_mask.any():
+        return
+    transform_mesh_points(mesh, matrix, select_mask, vector_attributes)
+
+
+def apply_mesh_transform(mesh_object, matrix, target, mesh_objects=(),
+                         vector_attributes=False):
+    """Apply a (local) 4x4 matrix to a mesh object's mesh data.
+
+    Meshes in edit mode are transformed through their edit-mesh, others
+    directly through their mesh data.
+
+    :param mesh_object: The mesh object whose data is transformed
+    :param matrix: A 4x4 mathutils.Matrix, in the object's local space
+    :param target: The operator transform target, one of 'MESH_SELECTED',
+        'WHOLE_MESH' or 'OBJECT_ORIGIN'
+    :param mesh_objects: All of the operator's target objects, for
+        'OBJECT_ORIGIN' the ones sharing mesh_object's mesh get their
+        origin moved along with it (so they don't move visually)
+    :param vector_attributes: Also transform the mesh's float vector point
+        attributes (shape keys are always transformed)
+    """
+    if target == 'MESH_SELECTED':
+        maplus_journal.record_mesh(
+            mesh_object.data,
+            matrix,
+            True,
+            vector_attributes
+        )
+        transform_selected_verts(mesh_object, matrix, vector_attributes)
+    elif target == 'WHOLE_MESH':
+        maplus_journal.record_mesh(
+            mesh_object.data,
+            matrix,
+            False,
+            vector_attributes
+        )
+        transform_whole_mesh(mesh_object, matrix, vector_attributes)
+    elif target == 'OBJECT_ORIGIN':
+        # Note: a target of 'OBJECT_ORIGIN' is equivalent
+        # to performing an object transf. + an inverse
+        # whole mesh level transf. To the user,
+        # the object appears to stay in the same place,
+        # while only the object's origin moves.
+        maplus_journal.record_mesh(
+            mesh_object.data,
+            matrix.inverted(),
+            False,
+            vector_attributes
+        )
+        transform_whole_mesh(
+            mesh_object,
+            matrix.inverted(),
+            vector_attributes
+        )
+        move_other_mesh_users(mesh_object, matrix, mesh_objects)
+
+
+def move_other_mesh_users(mesh_object, matrix, mesh_objects):
+    """Keep the other users of an origin-moved mesh in place.
+
+    :param mesh_object: The mesh object whose origin was moved
+    :param matrix: The (local) 4x4 mathutils.Matrix the origin moved by
+        (its inverse was applied to the mesh data)
+    :param mesh_objects: The objects to check for other users of the mesh
+    """
+    for item in mesh_objects:
+        if item != mesh_object and item.data == mesh_object.data:
+            maplus_journal.record_object(item, matrix, local=True)
+            item.matrix_world = item.matrix_world @ matrix
+
+
+def get_mesh_transform_options():
+    """Get the mesh level transform options from the addon preferences.
+
+    :returns: The workers and vector_attributes arguments of
+        apply_mesh_transforms, as a dict
+    """
+    preferences = maplus_storage.get_preferences()
+    if preferences is None:
+        return {'workers': 1, 'vector_attributes': False}
+    return {
+        'workers': preferences.transform_workers,
+        'vector_attributes': preferences.transform_vector_attributes,
+    }
+
+
+def transform_coords_chunk(coords, matrix, select_mask=None):
+    """Apply a 4x4 matrix to a chunk of a float32 coord array, in place.
+
+    Run in apply_mesh_transforms' thread pool: numpy releases the GIL for
+    the matrix multiply, so chunks are transformed in parallel. Only the
+    given chunk (a view of an (n, 3) array) is written to.
+
+    :param coords: An (n, 3) float32 array (view)
+    :param matrix: A 4x4 numpy float64 array
+    :param select_mask: An (n,) bool array of the rows to transform, or
+        None to transform all rows
+    """
+    if select_mask is None:
+        coords[:] = maplus_geom.transform_coords(
+            coords.astype(np.float64),
+            matrix
+        )
+    elif select_mask.any():
+        coords[select_mask] = maplus_geom.transform_coords(
+            coords[select_mask].astype(np.float64),
+            matrix
+        )
+
+
+def apply_mesh_transforms(mesh_targets, matrices, target, mesh_objects=(),
+                          workers=1, vector_attributes=False):
+    """Apply (local) 4x4 matrices to several mesh objects' mesh data.
+
+    With more than one worker, the point layers (vert coords, shape keys
+    and optionally vector attributes, see geom.get_point_layers) of large
+    meshes are read with foreach_get on the main thread, transformed in
+    chunks in a thread pool (several meshes, and parts of one large mesh,
+    at the same time) and written back with foreach_set on the main
+    thread, as each mesh's chunks complete. Meshes are only ever accessed
+    from the main thread.
+
+    Small meshes, meshes in edit mode and meshes with custom normals are
+    handled by apply_mesh_transform, as are all meshes with a single
+    worker.
+
+    :param mesh_targets: The mesh objects whose data is transformed, one
+        per mesh datablock (see get_unique_mesh_targets)
+    :param matrices: One 4x4 mathutils.Matrix per mesh target, in its
+        object's local space
+    :param target: The operator transform target, one of 'MESH_SELECTED',
+        'WHOLE_MESH' or 'OBJECT_ORIGIN'
+    :param mesh_objects: All of the operator's target objects (see
+        apply_mesh_transform)
+    :param workers: The thread pool size
+    :param vector_attributes: Also transform the meshes' float vector
+        point attributes
+    """
+    threaded_targets = []
+    for item, matrix in zip(mesh_targets, matrices):
+        mesh = item.data
+        if (workers <= 1
+                or mesh.is_editmode
+                or len(mesh.vertices) < threaded_min_vert_count
+                or mesh.has_custom_normals):
+            apply_mesh_transform(
+                item,
+                matrix,
+                target,
+                mesh_objects,
+                vector_attributes
+            )
+        else:
+            threaded_targets.append((item, matrix))
+    if not threaded_targets:
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = []
+        for item, matrix in threaded_targets:
+            mesh = item.data
+            if target == 'OBJECT_ORIGIN':
+                move_other_mesh_users(item, matrix, mesh_objects)
+                matrix = matrix.inverted()
+            maplus_journal.record_mesh(
+                mesh,
+                matrix,
+                target == 'MESH_SELECTED',
+                vector_attributes
+            )
+            matrix = np.array(matrix, dtype=np.float64)
+
+            vert_count = len(mesh.vertices)
+            layers = maplus_geom.get_point_layers(mesh, vector_attributes)
+            select_mask = None
+            if target == 'MESH_SELECTED':
+                select_mask = np.empty(vert_count, dtype=bool)
+                mesh.vertices.foreach_get('select', select_mask)
+                if not select_mask.any():
+                    continue
+                select_mask = np.tile(select_mask, len(layers))
+            coords = maplus_geom.read_point_layers(layers, vert_count)
+            rows = coords.reshape((-1, 3))
+
+            jobs = [
+                pool.submit(
+                    transform_coords_chunk,
+                    rows[start:start + threaded_chunk_size],
+                    matrix,
+                    None if select_mask is None
+                    else select_mask[start:start + threaded_chunk_size]
+                )
+                for start in range(0, len(rows), threaded_chunk_size)
+            ]
+            pending.append((mesh, layers, coords, jobs))
+
+        for mesh, layers, coords, jobs in pending:
+            for job in jobs:
+                job.result()
+            maplus_geom.write_point_layers(layers, coords)
+            mesh.update()
+
+
+def relocate_origins(objects, transforms, workers=1, vector_attributes=False):
+    """Move mesh objects' origins by global 4x4 transforms, in one batch.
+
+    The 'OBJECT_ORIGIN' target: each object moves by its transform while
+    its mesh data gets the inverse (local) transform, so only the origin
+    appears to move. Each mesh datablock is transformed once, its other
+    users among objects get their origin moved along.
+
+    All matrices are computed up front with numpy, from the objects'
+    current matrix_world (the local transform inv(M) @ T @ M is the same
+    before and after an object moves by T), so the objects are assigned
+    in one batch with a single view layer update. The users of each mesh
+    are grouped once, and the mesh data is transformed in place (see
+    apply_mesh_transforms), no bmesh is built and no mode is switched.
+
+    :param objects: The target mesh objects
+    :param transforms: A global 4x4 matrix for all objects, or a list
+        with one per object
+    :param workers: See apply_mesh_transforms
+    :param vector_attributes: See apply_mesh_transforms
+    :returns: The mesh targets (one object per mesh datablock)
+    """
+    if np.ndim(transforms) == 2:
+        transforms = [transforms] * len(objects)
+    transforms = dict(zip(objects, transforms))
+    mesh_targets = get_unique_mesh_targets(objects)
+    if not mesh_targets:
+        return mesh_targets
+    mesh_users = collections.defaultdict(list)
+    for item in objects:
+        mesh_users[item.data.session_uid].append(item)
+
+    object_matrices = np.array(
+        [item.matrix_world for item in mesh_targets],
+        dtype=np.float64
+    )
+    origin_transforms = np.array(
+        [np.asarray(transforms[item], dtype=np.float64)
+         for item in mesh_targets]
+    )
+    local_transforms = (
+        np.linalg.inv(object_matrices) @ origin_transforms @ object_matrices
+    )
+
+    moved_objects = []
+    final_matrices = []
+    for item, transform, object_matrix, local_transform in zip(
+            mesh_targets,
+            origin_transforms,
+            object_matrices,
+            local_transforms):
+        maplus_journal.record_object(item, transform)
+        moved_objects.append(item)
+        final_matrices.append(to_matrix(transform @ object_matrix))
+        for other in mesh_users[item.data.session_uid]:
+            if other != item:
+                maplus_journal.record_object(
+                    other,
+                    local_transform,
+                    local=True
+                )
+                moved_objects.append(other)
+                final_matrices.append(
+                    other.matrix_world @ to_matrix(local_transform)
+                )
+    set_matrices_world(moved_objects, final_matrices)
+
+    apply_mesh_transforms(
+        mesh_targets,
+        [to_matrix(matrix) for matrix in np.linalg.inv(local_transforms)],
+        'WHOLE_MESH',
+        workers=workers,
+        vector_attributes=vector_attributes
+    )
+    return mesh_targets
+
+
+def apply_transform(operator, objects, transforms, target):
+    """Apply global 4x4 transforms to an operator's target objects.
+
+    :param operator: The operator (for reports)
+    :param objects: The target objects
+    :param transforms: A global 4x4 matrix (e.g. from utils.align_kernels)
+        for all objects, or a list with one per object
+    :param target: The transform target, one of 'OBJECT', 'OBJECT_ORIGIN',
+        'MESH_SELECTED' or 'WHOLE_MESH'
+    """
+    if np.ndim(transforms) == 2:
+        transforms = [transforms] * len(objects)
+
+    with maplus_journal.recording(operator.bl_label):
+        if target == 'OBJECT':
+            transform_objects(objects, transforms)
+
+        elif target == 'OBJECT_ORIGIN':
+            mesh_targets = relocate_origins(
+                objects,
+                transforms,
+                **get_mesh_transform_options()
+            )
+            report_mesh_targets(operator, mesh_targets, objects)
+
+        else:
+            transforms = dict(zip(objects, transforms))
+            mesh_targets = get_unique_mesh_targets(objects)
+            apply_mesh_transforms(
+                mesh_targets,
+                [
+                    get_local_transform(item, transforms[item])
+                    for item in mesh_targets
+                ],
+                target,
+                objects,
+                **get_mesh_transform_options()
+            )
+            report_mesh_targets(operator, mesh_targets, objects)
+
+
+def get_transform_results(objects, transforms, target):
+    """Compute what applying transforms would do, without applying them.
+
+    Mirrors apply_transform (and the object/mesh level helpers it uses),
+    nothing in the scene is modified.
+
+    :param objects: The target objects
+    :param transforms: A global 4x4 matrix for all objects, or a list
+        with one per object
+    :param target: The transform target, one of 'OBJECT', 'OBJECT_ORIGIN',
+        'MESH_SELECTED' or 'WHOLE_MESH'
+    :returns: A list of TransformResult, one per object that would change:
+        the global transform, the object's final matrix_world, and the
+        (local) matrix its mesh data would be transformed by (or None)
+    """
+    if np.ndim(transforms) == 2:
+        transforms = [transforms] * len(objects)
+    transforms = {
+        item: to_matrix(transform)
+        for item, transform in zip(objects, transforms)
+    }
+    results = {}
+
+    if target in {'OBJECT', 'OBJECT_ORIGIN'}:
+        for item in get_object_targets(objects, target):
+            results[item] = TransformResult(
+                item,
+                transforms[item],
+                transforms[item] @ item.matrix_world,
+                None
+            )
+
+    if target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}:
+        mesh_users = collections.defaultdict(list)
+        for item in objects:
+            mesh_users[item.data.session_uid].append(item)
+        for item in get_unique_mesh_targets(objects):
+            transform = transforms[item]
+            matrix_world = (
+                results[item].matrix_world if item in results
+                else item.matrix_world.copy()
+            )
+            local_transform = to_matrix(
+                maplus_kernels.get_local_matrix(transform, matrix_world)
+            )
+            if target != 'OBJECT_ORIGIN':
+                results[item] = TransformResult(
+                    item,
+                    transform,
+                    matrix_world,
+                    local_transform
+                )
+                continue
+            results[item] = TransformResult(
+                item,
+                transform,
+                matrix_world,
+                local_transform.inverted()
+            )
+            for other in mesh_users[item.data.session_uid]:
+                if other != item:
+                    results[other] = TransformResult(
+                        other,
+                        transform,
+                        other.matrix_world @ local_transform,
+                        local_transform.inverted()
+                    )
+
+    return [results[item] for item in objects if item in results]
+
+
+def store_transform_results(operator, transf_item, results):
+    """Store transform results on a transformation item (and report them).
+
+    The results replace the item's computed_transforms, for scripts to
+    read after running a compute operator (e.g. maplus.computealignpoints,
+    which doesn't push an undo step).
+    """
+    transf_item.computed_transforms.clear()
+    for result in results:
+        stored_result = transf_item.computed_transforms.add()
+        stored_result.target = result.target
+        stored_result.transform = result.transform
+        stored_result.matrix_world = result.matrix_world
+        stored_result.transforms_mesh = result.mesh_matrix is not None
+        if result.mesh_matrix is not None:
+            stored_result.mesh_matrix = result.mesh_matrix
+    operator.report(
+        {'INFO'},
+        'Computed transforms for {0} object(s), nothing was changed'.format(
+            len(results)
+        )
+    )
@@ -0,0 +1,48 @@
+import importlib
+import importlib.util
+import os
+import sys
+
+import pytest
+
+
+UTILS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'mesh_mesh_align_plus',
+    'utils'
+)
+KERNELS_PATH = os.path.join(UTILS_PATH, 'align_kernels.py')
+
+
+@pytest.fixture(scope='session')
+def kernels():
+    # Load the module by path, importing the add-on package needs bpy
+    spec = importlib.util.spec_from_file_location('align_kernels', KERNELS_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='session')
+def utils():
+    # Load utils as a standalone package (for its relative imports), the
+    # bpy free modules can then be imported from it
+    spec = importlib.util.spec_from_file_location(
+        'maplus_utils',
+        os.path.join(UTILS_PATH, '__init__.py'),
+        submodule_search_locations=[UTILS_PATH]
+    )
+    package = importlib.util.module_from_spec(spec)
+    sys.modules['maplus_utils'] = package
+    spec.loader.exec_module(package)
+    return package
+
+
+@pytest.fixture(scope='session')
+def fitting(utils):
+    return importlib.import_module('maplus_utils.fitting')
+
+
+@pytest.fixture(scope='session')
+def exceptions(utils):
+    return importlib.import_module('maplus_utils.exceptions')
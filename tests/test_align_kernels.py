@@ -0,0 +1,293 @@
+"""Tests for utils/align_kernels.py, against hand-computed matrices.
+
+Runs without Blender (the kernels only need numpy). The mathutils
+comparison is skipped unless mathutils is importable.
+"""
+
+
+import math
+
+import numpy as np
+import pytest
+
+
+# Quarter turn around +Z (X to Y)
+ROT_Z_90 = np.array((
+    (0.0, -1.0, 0.0),
+    (1.0, 0.0, 0.0),
+    (0.0, 0.0, 1.0),
+))
+
+
+def affine(linear, translation):
+    matrix = np.identity(4)
+    matrix[:3, :3] = linear
+    matrix[:3, 3] = translation
+    return matrix
+
+
+def test_align_points_matrices(kernels):
+    src_pts = [(1.0, 2.0, 3.0)] * 4
+    dest_pts = [(4.0, 6.0, 3.0)] * 4
+    matrices = kernels.align_points_matrices(
+        src_pts,
+        dest_pts,
+        make_unit=[False, True, False, False],
+        flip=[False, False, True, False],
+        multiplier=[1.0, 1.0, 1.0, 2.0]
+    )
+    assert matrices.shape == (4, 4, 4)
+    expected_offsets = (
+        (3.0, 4.0, 0.0),
+        (0.6, 0.8, 0.0),
+        (-3.0, -4.0, 0.0),
+        (6.0, 8.0, 0.0),
+    )
+    for matrix, offset in zip(matrices, expected_offsets):
+        np.testing.assert_allclose(matrix, affine(np.identity(3), offset))
+    np.testing.assert_allclose(
+        kernels.align_points_matrix(src_pts[0], dest_pts[0], make_unit=True),
+        matrices[1]
+    )
+
+
+def test_directional_slide_matrices(kernels):
+    matrices = kernels.directional_slide_matrices(
+        [(0.0, 0.0, 1.0), (0.0, 0.0, 1.0)],
+        [(0.0, 0.0, 5.0), (0.0, 0.0, 5.0)],
+        make_unit=True,
+        flip=[False, True],
+        multiplier=3.0
+    )
+    np.testing.assert_allclose(
+        matrices[0],
+        affine(np.identity(3), (0.0, 0.0, 3.0))
+    )
+    np.testing.assert_allclose(
+        matrices[1],
+        affine(np.identity(3), (0.0, 0.0, -3.0))
+    )
+
+
+def test_get_rotation_differences(kernels):
+    rotations = kernels.get_rotation_differences(
+        [(1.0, 0.0, 0.0), (1.0, 0.0, 0.0), (2.0, 0.0, 0.0), (1.0, 0.0, 0.0)],
+        [(0.0, 3.0, 0.0), (1.0, 1.0, 0.0), (5.0, 0.0, 0.0), (-1.0, 0.0, 0.0)]
+    )
+    half = math.sqrt(0.5)
+    expected = (
+        ROT_Z_90,
+        # 45 degrees around +Z
+        ((half, -half, 0.0), (half, half, 0.0), (0.0, 0.0, 1.0)),
+        # Parallel: no rotation
+        np.identity(3),
+        # Opposite: a half turn around (0, 1, 1) / sqrt(2), the axis
+        # mathutils (ortho_v3_v3) picks for +X
+        ((-1.0, 0.0, 0.0), (0.0, 0.0, 1.0), (0.0, 1.0, 0.0)),
+    )
+    for rotation, expected_rotation in zip(rotations, expected):
+        np.testing.assert_allclose(rotation, expected_rotation, atol=1e-12)
+
+
+def test_get_rotation_differences_opposite_z(kernels):
+    # Half turn around (1, 1, 0) / sqrt(2), the axis picked for +Z
+    rotation = kernels.get_rotation_differences(
+        [(0.0, 0.0, 1.0)],
+        [(0.0, 0.0, -4.0)]
+    )[0]
+    np.testing.assert_allclose(
+        rotation,
+        ((0.0, 1.0, 0.0), (1.0, 0.0, 0.0), (0.0, 0.0, -1.0)),
+        atol=1e-12
+    )
+
+
+def test_get_rotation_differences_matches_mathutils(kernels):
+    mathutils = pytest.importorskip('mathutils')
+    rng = np.random.default_rng(7)
+    src_vecs = np.concatenate((
+        rng.normal(size=(20, 3)),
+        np.identity(3),
+        [(1.0, 2.0, 3.0)],
+    ))
+    dest_vecs = np.concatenate((
+        rng.normal(size=(20, 3)),
+        -np.identity(3),
+        [(-2.0, -4.0, -6.0)],
+    ))
+    rotations = kernels.get_rotation_differences(src_vecs, dest_vecs)
+    for src_vec, dest_vec, rotation in zip(src_vecs, dest_vecs, rotations):
+        expected = mathutils.Vector(src_vec).rotation_difference(
+            mathutils.Vector(dest_vec)
+        ).to_matrix()
+        np.testing.assert_allclose(rotation, expected, atol=1e-5)
+
+
+def test_align_lines_matrices(kernels):
+    src_start, src_end = (1.0, 0.0, 0.0), (2.0, 0.0, 0.0)
+    dest_start, dest_end = (5.0, 5.0, 5.0), (5.0, 7.0, 5.0)
+    matrices = kernels.align_lines_matrices(
+        [src_start] * 2,
+        [src_end] * 2,
+        [dest_start] * 2,
+        [dest_end] * 2,
+        flip=[False, True]
+    )
+    np.testing.assert_allclose(
+        matrices[0],
+        affine(ROT_Z_90, (5.0, 4.0, 5.0)),
+        atol=1e-12
+    )
+    # Flipped, -X is turned to +Y (a quarter turn around -Z)
+    np.testing.assert_allclose(
+        matrices[1],
+        affine(ROT_Z_90.T, (5.0, 6.0, 5.0)),
+        atol=1e-12
+    )
+
+
+def test_align_lines_matrix_opposite(kernels):
+    matrix = kernels.align_lines_matrix(
+        (1.0, 0.0, 0.0),
+        (2.0, 0.0, 0.0),
+        (0.0, 0.0, 0.0),
+        (-3.0, 0.0, 0.0)
+    )
+    half_turn = np.array((
+        (-1.0, 0.0, 0.0),
+        (0.0, 0.0, 1.0),
+        (0.0, 1.0, 0.0),
+    ))
+    np.testing.assert_allclose(
+        matrix,
+        affine(half_turn, (1.0, 0.0, 0.0)),
+        atol=1e-12
+    )
+
+
+# Source plane: B at (1, 2, 3), B to A along +X, B to C along +Y (normal
+# +Z). Dest plane: B at (10, 10, 10), B to A along +Y (twice as long),
+# B to C along +Z (normal +X).
+SRC_PLANE = ((2.0, 2.0, 3.0), (1.0, 2.0, 3.0), (1.0, 3.0, 3.0))
+DEST_PLANE = ((10.0, 12.0, 10.0), (10.0, 10.0, 10.0), (10.0, 10.0, 13.0))
+# X to Y, Y to Z, Z to X
+PLANE_ROTATION = np.array((
+    (0.0, 0.0, 1.0),
+    (1.0, 0.0, 0.0),
+    (0.0, 1.0, 0.0),
+))
+# X to Y, Y to -Z, -Z to X (the flipped source normal)
+FLIPPED_PLANE_ROTATION = np.array((
+    (0.0, 0.0, -1.0),
+    (1.0, 0.0, 0.0),
+    (0.0, -1.0, 0.0),
+))
+
+
+@pytest.mark.parametrize('pivot_index, flip_normal, linear, translation', [
+    (1, False, PLANE_ROTATION, (7.0, 9.0, 8.0)),
+    (0, False, PLANE_ROTATION, (7.0, 10.0, 8.0)),
+    (1, True, FLIPPED_PLANE_ROTATION, (13.0, 9.0, 12.0)),
+    (0, True, FLIPPED_PLANE_ROTATION, (13.0, 10.0, 12.0)),
+])
+def test_align_planes_matrices(kernels, pivot_index, flip_normal, linear,
+                               translation):
+    matrix = kernels.align_planes_matrices(
+        [SRC_PLANE],
+        [DEST_PLANE],
+        flip_normal=flip_normal,
+        pivot_index=pivot_index
+    )[0]
+    np.testing.assert_allclose(
+        matrix,
+        affine(linear, translation),
+        atol=1e-12
+    )
+    # The pivot lands on the dest pivot
+    np.testing.assert_allclose(
+        matrix @ np.append(SRC_PLANE[pivot_index], 1.0),
+        np.append(DEST_PLANE[pivot_index], 1.0),
+        atol=1e-12
+    )
+    np.testing.assert_allclose(
+        kernels.align_planes_matrix(
+            SRC_PLANE,
+            DEST_PLANE,
+            flip_normal=flip_normal,
+            pivot_index=pivot_index
+        ),
+        matrix
+    )
+
+
+def test_axis_rotate_matrices(kernels):
+    # A quarter turn around a Z parallel axis through (1, 0, 0), and a
+    # half turn around X
+    matrices = kernels.axis_rotate_matrices(
+        [(1.0, 0.0, 0.0), (0.0, 0.0, 0.0)],
+        [(1.0, 0.0, 2.0), (3.0, 0.0, 0.0)],
+        [math.pi / 2, math.pi]
+    )
+    np.testing.assert_allclose(
+        matrices[0],
+        affine(ROT_Z_90, (1.0, -1.0, 0.0)),
+        atol=1e-12
+    )
+    np.testing.assert_allclose(
+        matrices[1],
+        affine(np.diag((1.0, -1.0, -1.0)), (0.0, 0.0, 0.0)),
+        atol=1e-12
+    )
+
+
+def test_scale_match_edge_matrices(kernels):
+    matrix = kernels.scale_match_edge_matrices(
+        [(1.0, 1.0, 1.0)],
+        [(3.0, 1.0, 1.0)],
+        [(0.0, 0.0, 0.0)],
+        [(0.0, 0.0, 5.0)]
+    )[0]
+    np.testing.assert_allclose(
+        matrix,
+        affine(np.identity(3) * 2.5, (-1.5, -1.5, -1.5))
+    )
+    np.testing.assert_allclose(
+        kernels.scale_match_edge_matrix(
+            (1.0, 1.0, 1.0),
+            (3.0, 1.0, 1.0),
+            (0.0, 0.0, 0.0),
+            (0.0, 0.0, 5.0)
+        ),
+        matrix
+    )
+
+
+@pytest.mark.parametrize('object_matrix, matrix, expected', [
+    # Uniformly scaled object, global translation
+    (
+        affine(np.identity(3) * 2.0, (1.0, 0.0, 0.0)),
+        affine(np.identity(3), (0.0, 0.0, 4.0)),
+        affine(np.identity(3), (0.0, 0.0, 2.0)),
+    ),
+    # Non-uniformly scaled object, global translation
+    (
+        affine(np.diag((1.0, 2.0, 4.0)), (0.0, 0.0, 0.0)),
+        affine(np.identity(3), (0.0, 0.0, 4.0)),
+        affine(np.identity(3), (0.0, 0.0, 1.0)),
+    ),
+    # Moved object, global rotation around the world origin
+    (
+        affine(np.identity(3), (1.0, 0.0, 0.0)),
+        affine(ROT_Z_90, (0.0, 0.0, 0.0)),
+        affine(ROT_Z_90, (-1.0, 1.0, 0.0)),
+    ),
+])
+def test_get_local_matrix(kernels, object_matrix, matrix, expected):
+    local_matrix = kernels.get_local_matrix(matrix, object_matrix)
+    np.testing.assert_allclose(local_matrix, expected, atol=1e-12)
+    # Seen through the object's matrix, the mesh moves by the global one
+    np.testing.assert_allclose(
+        object_matrix @ local_matrix,
+        matrix @ object_matrix,
+        atol=1e-12
+    )
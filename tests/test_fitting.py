@@ -0,0 +1,92 @@
+"""Tests for the cylinder fit in utils/fitting.py (no Blender needed)."""
+
+
+import numpy as np
+import pytest
+
+
+AXIS = np.array((0.3, -0.5, 0.8)) / np.linalg.norm((0.3, -0.5, 0.8))
+CENTER = np.array((1.0, 2.0, -3.0))
+RADIUS = 0.7
+
+
+def cylinder_points(fitting, count, arc=1.5 * np.pi, heights=(-2.0, 5.0),
+                    noise=0.0):
+    rng = np.random.default_rng(3)
+    u, v = fitting.perpendicular_basis(AXIS)
+    angles = rng.uniform(0.0, arc, count)
+    points = (
+        CENTER +
+        np.outer(rng.uniform(heights[0], heights[1], count), AXIS) +
+        RADIUS * (np.outer(np.cos(angles), u) + np.outer(np.sin(angles), v))
+    )
+    return points + rng.normal(scale=noise, size=points.shape)
+
+
+def assert_fits(cylinder_fit, atol):
+    assert abs(cylinder_fit.axis @ AXIS) == pytest.approx(1.0, abs=atol)
+    assert cylinder_fit.radius == pytest.approx(RADIUS, abs=atol)
+    # The center lies on the true axis
+    offset = cylinder_fit.center - CENTER
+    np.testing.assert_allclose(offset - (offset @ AXIS) * AXIS, 0, atol=atol)
+
+
+def test_fit_cylinder_exact(fitting):
+    cylinder_fit = fitting.fit_cylinder(cylinder_points(fitting, 500))
+    assert_fits(cylinder_fit, 1e-9)
+    assert cylinder_fit.rms_residual < 1e-9
+
+
+def test_fit_cylinder_partial_arc(fitting):
+    # A quarter of a cylinder, where an algebraic circle fit is biased
+    cylinder_fit = fitting.fit_cylinder(
+        cylinder_points(fitting, 2000, arc=0.5 * np.pi, noise=1e-4)
+    )
+    assert_fits(cylinder_fit, 1e-3)
+    assert cylinder_fit.rms_residual == pytest.approx(1e-4, rel=0.1)
+
+
+def test_fit_cylinder_subsampled(fitting, monkeypatch):
+    points = cylinder_points(fitting, 5000, noise=1e-3)
+    full_fit = fitting.fit_cylinder(points)
+    monkeypatch.setattr(fitting, 'cylinder_sample_size', 500)
+    sampled_fit = fitting.fit_cylinder(points)
+    assert_fits(sampled_fit, 1e-3)
+    assert sampled_fit.rms_residual == pytest.approx(
+        full_fit.rms_residual,
+        rel=1e-3
+    )
+
+
+def test_fit_cylinder_planar_ring(fitting):
+    # A single ring (no height), the axis is the ring's normal
+    cylinder_fit = fitting.fit_cylinder(
+        cylinder_points(fitting, 64, arc=2 * np.pi, heights=(0.0, 0.0))
+    )
+    assert_fits(cylinder_fit, 1e-9)
+    np.testing.assert_allclose(cylinder_fit.start, cylinder_fit.center)
+    assert np.linalg.norm(
+        cylinder_fit.end - cylinder_fit.start
+    ) == pytest.approx(RADIUS)
+
+
+def test_fit_cylinder_orient_to(fitting):
+    points = cylinder_points(fitting, 200)
+    for orient_to in (AXIS, -AXIS):
+        cylinder_fit = fitting.fit_cylinder(points, orient_to=orient_to)
+        assert cylinder_fit.axis @ orient_to > 0
+        assert (cylinder_fit.end - cylinder_fit.start) @ orient_to > 0
+
+
+def test_fit_cylinder_too_few_points(fitting, exceptions):
+    with pytest.raises(exceptions.InsufficientSelectionError):
+        fitting.fit_cylinder(np.zeros((2, 3)))
+
+
+def test_get_least_variance_axis(fitting):
+    u, v = fitting.perpendicular_basis(AXIS)
+    angles = np.linspace(0.0, np.pi, 12)
+    normals = np.outer(np.cos(angles), u) + np.outer(np.sin(angles), v)
+    axis = fitting.get_least_variance_axis(normals, np.full(12, 2.0))
+    assert abs(axis @ AXIS) == pytest.approx(1.0)
+    assert fitting.get_least_variance_axis(normals[:1]) is None